@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+http2_benchmark.py - HTTP/1.1 vs HTTP/2 transport benchmark
+
+Starts two local stub servers that answer every GET after a fixed delay:
+one speaking HTTP/1.1 and one speaking HTTP/2 (cleartext, prior knowledge).
+The same URL set is then fetched through AsyncRateLimitedClient against each,
+with identical per-domain rate limits and concurrency, and throughput plus
+the number of TCP connections each server accepted are printed.
+
+Requires httpx[http2] (the h2 package is also used for the stub server).
+
+Usage:
+    python benchmarks/http2_benchmark.py
+    python benchmarks/http2_benchmark.py --requests 400 --rate 100 --concurrency 16 --delay 0.05
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.async_http_client import AsyncRateLimitedClient
+from utils.http2_transport import HAS_HTTPX
+from utils.http_client import RateLimitedClient
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+except ImportError:
+    print("ERROR: httpx[http2] is required: pip install 'httpx[http2]'", file=sys.stderr)
+    sys.exit(2)
+
+BODY = b"<html><head><title>Stub</title></head><body>" + b"x" * 4096 + b"</body></html>"
+
+
+class StubStats:
+    """Connection and request counters for a stub server."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+
+    def add(self, connections: int = 0, requests: int = 0):
+        with self.lock:
+            self.connections += connections
+            self.requests += requests
+
+
+def start_http1_stub(delay: float, stats: StubStats) -> int:
+    """Start a threaded HTTP/1.1 stub server.
+
+    Args:
+        delay: Seconds to wait before answering each request
+        stats: Counters to update
+
+    Returns:
+        Port the server listens on
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def setup(self):
+            super().setup()
+            stats.add(connections=1)
+
+        def do_GET(self):
+            stats.add(requests=1)
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_address[1]
+
+
+class H2StubProtocol(asyncio.Protocol):
+    """Minimal HTTP/2 server: answers each stream with BODY after a delay."""
+
+    def __init__(self, delay: float, stats: StubStats):
+        self.delay = delay
+        self.stats = stats
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.stats.add(connections=1)
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes):
+        try:
+            events = self.conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self.transport.write(self.conn.data_to_send())
+            self.transport.close()
+            return
+
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                self.stats.add(requests=1)
+                asyncio.get_running_loop().call_later(
+                    self.delay, self._respond, event.stream_id
+                )
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.conn.data_to_send())
+
+    def _respond(self, stream_id: int):
+        if self.transport.is_closing():
+            return
+        self.conn.send_headers(stream_id, [
+            (":status", "200"),
+            ("content-type", "text/html"),
+            ("content-length", str(len(BODY))),
+        ])
+        self.conn.send_data(stream_id, BODY, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+def start_http2_stub(delay: float, stats: StubStats) -> int:
+    """Start an HTTP/2 (h2c, prior knowledge) stub server in a background loop.
+
+    Args:
+        delay: Seconds to wait before answering each request
+        stats: Counters to update
+
+    Returns:
+        Port the server listens on
+    """
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(
+        lambda: H2StubProtocol(delay, stats), "127.0.0.1", 0
+    ))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server.sockets[0].getsockname()[1]
+
+
+def build_config(args: argparse.Namespace, http2: bool) -> dict:
+    """Build a client configuration with equal limits for both transports.
+
+    Args:
+        args: Parsed command line arguments
+        http2: Enable the HTTP/2 transport
+
+    Returns:
+        Configuration dictionary
+    """
+    return {
+        'approved_domains': ['127.0.0.1'],
+        'rate_limits': {'default': args.rate, 'burst': args.concurrency},
+        'concurrency': {'per_domain': args.concurrency, 'max_workers': args.concurrency},
+        'retry': {'max_retries': 1},
+        'timeouts': {'request': 30},
+        'http_cache': {'enabled': False},
+        'http2': {'enabled': http2, 'prior_knowledge': True},
+    }
+
+
+async def fetch_all(client: AsyncRateLimitedClient, urls: list[str]) -> list[dict]:
+    """Fetch all URLs concurrently through the async client."""
+    return await asyncio.gather(*(client.fetch(url) for url in urls))
+
+
+def run_case(label: str, args: argparse.Namespace, port: int, http2: bool, stats: StubStats):
+    """Fetch the URL set against one stub server and print the results.
+
+    Args:
+        label: Name printed for this case
+        args: Parsed command line arguments
+        port: Stub server port
+        http2: Enable the HTTP/2 transport
+        stats: Counters of the stub server
+    """
+    client = RateLimitedClient(build_config(args, http2))
+    async_client = AsyncRateLimitedClient(client.config, client)
+    urls = [f"http://127.0.0.1:{port}/page/{i}" for i in range(args.requests)]
+
+    start = time.perf_counter()
+    results = asyncio.run(fetch_all(async_client, urls))
+    elapsed = time.perf_counter() - start
+
+    async_client.close()
+    client.close()
+
+    errors = sum(1 for r in results if r["error"] or r["status_code"] != 200)
+    print(
+        f"{label:<10} {elapsed:7.2f}s  {len(urls) / elapsed:8.1f} req/s  "
+        f"connections={stats.connections:<3} errors={errors}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP/1.1 vs HTTP/2 transport")
+    parser.add_argument('--requests', type=int, default=200, help='URLs to fetch per case')
+    parser.add_argument('--rate', type=float, default=100, help='Per-domain rate limit (req/s)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Per-domain in-flight requests')
+    parser.add_argument('--delay', type=float, default=0.05, help='Stub server latency (s)')
+    args = parser.parse_args()
+
+    if not HAS_HTTPX:
+        print("ERROR: httpx[http2] is required: pip install 'httpx[http2]'", file=sys.stderr)
+        sys.exit(2)
+
+    print(
+        f"{args.requests} requests, rate {args.rate:g} req/s, "
+        f"{args.concurrency} in flight, {args.delay * 1000:.0f} ms server latency"
+    )
+
+    http1_stats = StubStats()
+    run_case("HTTP/1.1", args, start_http1_stub(args.delay, http1_stats), False, http1_stats)
+
+    http2_stats = StubStats()
+    run_case("HTTP/2", args, start_http2_stub(args.delay, http2_stats), True, http2_stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -29,7 +29,9 @@ except ImportError:
 
 # Import the rate-limited HTTP client
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.accounting import checker_scope
 from utils.http_client import RateLimitedClient
+from utils.response_cache import ResponseCache
 
 
 # Configure logging
@@ -53,7 +55,13 @@ class FactChecker:
     STATUS_UNVERIFIABLE_AUTO = "UNVERIFIABLE_AUTO"
     STATUS_UNVERIFIABLE_PDF = "UNVERIFIABLE_PDF"
 
-    def __init__(self, config: Dict, repo_root: Path, registry_path: Path):
+    def __init__(
+        self,
+        config: Dict,
+        repo_root: Path,
+        registry_path: Path,
+        response_cache: Optional[ResponseCache] = None
+    ):
         """
         Initialize the fact checker.
 
@@ -61,6 +69,7 @@ class FactChecker:
             config: Configuration dictionary
             repo_root: Root directory of the repository
             registry_path: Path to the fact registry YAML file
+            response_cache: Run-scoped response cache shared with other checkers
         """
         self.config = config
         self.repo_root = repo_root
@@ -70,8 +79,9 @@ class FactChecker:
         with open(registry_path, 'r', encoding='utf-8') as f:
             self.registry = yaml.safe_load(f)
 
-        # Initialize HTTP client
-        self.http_client = RateLimitedClient(config)
+        # Initialize HTTP client (requests are accounted to this checker)
+        with checker_scope('facts'):
+            self.http_client = RateLimitedClient(config, response_cache=response_cache)
 
         facts = self.registry if isinstance(self.registry, list) else self.registry.get('facts', [])
         logger.info(f"Loaded {len(facts)} facts from registry")
@@ -125,6 +135,8 @@ class FactChecker:
             elif status in [self.STATUS_UNVERIFIABLE_AUTO, self.STATUS_UNVERIFIABLE_PDF]:
                 results["unverifiable"] += 1
 
+        self.http_client.save_state()
+
         return results
 
     def _verify_fact(self, fact: Dict) -> Dict:
@@ -294,18 +306,20 @@ class FactChecker:
         source_url = fact.get('source_url', '')
 
         try:
-            # Fetch the HTML page using session with rate limiting
-            self.http_client._wait_for_rate_limit(self.http_client._get_domain(source_url))
-            response = self.http_client.session.get(source_url, timeout=self.http_client.timeout)
+            # Fetch the HTML page (rate limited, conditional on cached validators)
+            response = self.http_client.fetch(source_url, keep_body=True)
+
+            if response["error"]:
+                raise ConnectionError(response["error"])
 
-            if response.status_code != 200:
+            if response["status_code"] != 200:
                 detail["status"] = self.STATUS_UNVERIFIABLE_AUTO
-                detail["note"] = f"HTTP {response.status_code}"
-                logger.error(f"  {fact_id}: Failed to fetch source (HTTP {response.status_code})")
+                detail["note"] = f"HTTP {response['status_code']}"
+                logger.error(f"  {fact_id}: Failed to fetch source (HTTP {response['status_code']})")
                 return
 
             # Parse HTML and extract text
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response["content"], 'html.parser')
 
             # Remove script and style elements
             for script in soup(["script", "style"]):
@@ -363,64 +377,86 @@ class FactChecker:
             return
 
         try:
-            # Fetch the PDF using session with rate limiting
-            self.http_client._wait_for_rate_limit(self.http_client._get_domain(source_url))
-            response = self.http_client.session.get(source_url, timeout=self.http_client.timeout)
+            # Fetch the PDF (rate limited, conditional on cached validators)
+            response = self.http_client.fetch(source_url, keep_body=True)
 
-            if response.status_code != 200:
+            if response["error"]:
+                raise ConnectionError(response["error"])
+
+            if response["status_code"] != 200:
                 detail["status"] = self.STATUS_UNVERIFIABLE_PDF
-                detail["note"] = f"HTTP {response.status_code}"
-                logger.error(f"  {fact_id}: Failed to fetch PDF (HTTP {response.status_code})")
+                detail["note"] = f"HTTP {response['status_code']}"
+                logger.error(f"  {fact_id}: Failed to fetch PDF (HTTP {response['status_code']})")
                 return
 
-            # Save PDF temporarily
-            import tempfile
-            temp_pdf_path = Path(tempfile.gettempdir()) / f"fact_check_{fact_id}.pdf"
-            temp_pdf_path.write_bytes(response.content)
+            # Reuse text extracted from this exact PDF on a previous run
+            cache = self.http_client.validator_cache
+            content_hash = response["content_hash"]
+            text = cache.load_text(content_hash) if cache else None
 
-            try:
-                # Extract text from PDF
-                with pdfplumber.open(temp_pdf_path) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-
-                if not text.strip():
-                    detail["status"] = self.STATUS_UNVERIFIABLE_PDF
-                    detail["note"] = "PDF text extraction failed (empty result)"
-                    logger.warning(f"  {fact_id}: PDF text extraction returned empty")
-                    return
-
-                # Search for value in text
-                if self._value_found_in_text(value, text):
-                    detail["status"] = self.STATUS_VERIFIED
-                    detail["value_in_source"] = value
-                    detail["note"] = "Value found in PDF"
-                    logger.info(f"  {fact_id}: VERIFIED")
+            if text is None:
+                text = self._extract_pdf_text(fact_id, response["content"])
+                if cache and text.strip():
+                    cache.store_text(content_hash, text)
+
+            if not text.strip():
+                detail["status"] = self.STATUS_UNVERIFIABLE_PDF
+                detail["note"] = "PDF text extraction failed (empty result)"
+                logger.warning(f"  {fact_id}: PDF text extraction returned empty")
+                return
+
+            # Search for value in text
+            if self._value_found_in_text(value, text):
+                detail["status"] = self.STATUS_VERIFIED
+                detail["value_in_source"] = value
+                detail["note"] = "Value found in PDF"
+                logger.info(f"  {fact_id}: VERIFIED")
+            else:
+                similar_value = self._find_similar_value(value, text)
+                if similar_value:
+                    detail["status"] = self.STATUS_CHANGED
+                    detail["value_in_source"] = similar_value
+                    detail["note"] = f"Found different value in PDF: {similar_value}"
+                    logger.warning(f"  {fact_id}: CHANGED (found: {similar_value})")
                 else:
-                    similar_value = self._find_similar_value(value, text)
-                    if similar_value:
-                        detail["status"] = self.STATUS_CHANGED
-                        detail["value_in_source"] = similar_value
-                        detail["note"] = f"Found different value in PDF: {similar_value}"
-                        logger.warning(f"  {fact_id}: CHANGED (found: {similar_value})")
-                    else:
-                        detail["status"] = self.STATUS_NOT_FOUND
-                        detail["note"] = "Value not found in PDF"
-                        logger.warning(f"  {fact_id}: NOT_FOUND_IN_SOURCE")
-
-            finally:
-                # Clean up temp file
-                if temp_pdf_path.exists():
-                    temp_pdf_path.unlink()
+                    detail["status"] = self.STATUS_NOT_FOUND
+                    detail["note"] = "Value not found in PDF"
+                    logger.warning(f"  {fact_id}: NOT_FOUND_IN_SOURCE")
 
         except Exception as e:
             detail["status"] = self.STATUS_UNVERIFIABLE_PDF
             detail["note"] = f"PDF extraction error: {str(e)}"
             logger.error(f"  {fact_id}: PDF extraction error - {str(e)}")
 
+    def _extract_pdf_text(self, fact_id: str, content: bytes) -> str:
+        """
+        Extract text from PDF bytes with pdfplumber.
+
+        Args:
+            fact_id: Fact ID (used for the temporary file name)
+            content: Raw PDF bytes
+
+        Returns:
+            Extracted text (empty string if no text layer)
+        """
+        # Save PDF temporarily
+        import tempfile
+        temp_pdf_path = Path(tempfile.gettempdir()) / f"fact_check_{fact_id}.pdf"
+        temp_pdf_path.write_bytes(content)
+
+        try:
+            with pdfplumber.open(temp_pdf_path) as pdf:
+                text = ""
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        text += page_text + "\n"
+            return text
+        finally:
+            # Clean up temp file
+            if temp_pdf_path.exists():
+                temp_pdf_path.unlink()
+
     def _value_found_in_text(self, value: str, text: str) -> bool:
         """
         Check if value exists in text (with fuzzy matching for numbers).
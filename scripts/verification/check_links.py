@@ -7,17 +7,28 @@ report with suggested remediation actions.
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import yaml
 
+from utils.accounting import checker_scope
+from utils.async_http_client import AsyncRateLimitedClient
+from utils.git_diff import changed_lines
 from utils.http_client import RateLimitedClient
+from utils.link_state import LinkStateStore
 from utils.markdown_parser import extract_urls, get_all_markdown_files
+from utils.response_cache import ResponseCache
+from utils.retry_queue import RetryLater, RetryQueue
+from utils.url_canonical import URLCanonicalizer
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +46,10 @@ class LinkChecker:
         config: Configuration dict with rate limits, approved domains, soft 404 patterns
         repo_root: Root directory of the repository
         registry_path: Optional path to fact_registry.yaml for PDF verification
+        base_rev: Optional git revision; only URLs on lines changed since it
+                  (plus URLs due by TTL) are checked
+        time_budget: Optional wall-clock limit in seconds; URLs not reached in
+                     time are reported as SKIPPED_BUDGET
         client: RateLimitedClient instance for HTTP requests
         fact_registry: Loaded fact registry data (if available)
     """
@@ -43,7 +58,10 @@ class LinkChecker:
         self,
         config: dict,
         repo_root: Path,
-        registry_path: Optional[Path] = None
+        registry_path: Optional[Path] = None,
+        response_cache: Optional[ResponseCache] = None,
+        base_rev: Optional[str] = None,
+        time_budget: Optional[float] = None
     ):
         """
         Initialize the link checker.
@@ -52,17 +70,35 @@ class LinkChecker:
             config: Configuration dictionary containing rate_limits, approved_domains, etc.
             repo_root: Path to repository root
             registry_path: Optional path to fact_registry.yaml
+            response_cache: Run-scoped response cache shared with other checkers
+            base_rev: Git revision to diff markdown files against (e.g. the
+                      PR base branch); None checks every URL due by TTL
+            time_budget: Seconds the run may take (URLs are checked in
+                         priority order); None for no limit
         """
         self.config = config
         self.repo_root = repo_root
         self.registry_path = registry_path
-
-        # Initialize HTTP client with config
-        self.client = RateLimitedClient(config)
+        self.base_rev = base_rev
+        self._git_diff_stats: Optional[dict] = None
+        self.time_budget = time_budget
+        self._deadline: Optional[float] = None
+        self.canonicalizer = URLCanonicalizer(config.get('url_canonical', {}))
+        self._canonical_stats: Optional[dict] = None
+        self._fetch_urls: Dict[str, str] = {}  # canonical URL -> spelling to request
+
+        # Initialize HTTP client with config (requests are accounted to this checker)
+        with checker_scope('links'):
+            self.client = RateLimitedClient(config, response_cache=response_cache)
 
         # Load fact registry if available
         self.fact_registry = self._load_fact_registry()
 
+        # Outcomes of earlier runs, so only URLs past their TTL are rechecked
+        self.link_state = LinkStateStore.from_config(config, self.client.state_dir)
+        self.full_recheck = config.get('link_state', {}).get('full_recheck', False)
+        self._head_only_urls: set = set()
+
     def _load_fact_registry(self) -> Optional[dict]:
         """
         Load the fact registry YAML file.
@@ -87,11 +123,20 @@ class LinkChecker:
         """
         Discover all URLs across markdown files.
 
+        URLs are keyed by their canonical form, so spelling variants are
+        checked once; a location whose URL was written differently keeps
+        that spelling under ``raw_url``. The key is only used for grouping:
+        each group is requested with one of its written spellings (the one
+        equal to the key if there is one, else the first seen), recorded in
+        ``self._fetch_urls``.
+
         Returns:
-            Dict mapping URL to list of location dicts {file, line, link_text}
+            Dict mapping canonical URL to list of location dicts
+            {file, line, link_text[, raw_url]}
         """
         logger.info("Discovering URLs in markdown files...")
         url_locations: Dict[str, List[dict]] = {}
+        raw_urls = set()
 
         markdown_files = get_all_markdown_files(self.repo_root)
         logger.info(f"Found {len(markdown_files)} markdown files")
@@ -99,29 +144,67 @@ class LinkChecker:
         for md_file in markdown_files:
             urls = extract_urls(md_file)
             for url_info in urls:
-                url = url_info.url
+                url = self.canonicalizer.canonical(url_info.url)
                 location = {
                     'file': str(md_file.relative_to(self.repo_root)),
                     'line': url_info.line_number,
                     'link_text': url_info.link_text
                 }
+                if url != url_info.url:
+                    location['raw_url'] = url_info.url
+                raw_urls.add(url_info.url)
+
+                written = self.canonicalizer.strip_punctuation(url_info.url)
+                if url not in self._fetch_urls or written == url:
+                    self._fetch_urls[url] = written
 
                 if url not in url_locations:
                     url_locations[url] = []
                 url_locations[url].append(location)
 
-        logger.info(f"Discovered {len(url_locations)} unique URLs")
+        self._canonical_stats = {
+            'raw_urls': len(raw_urls),
+            'canonical_urls': len(url_locations),
+            'collapsed': len(raw_urls) - len(url_locations),
+        }
+        logger.info(
+            f"Discovered {len(url_locations)} unique URLs "
+            f"({len(raw_urls) - len(url_locations)} spelling variants collapsed)"
+        )
         return url_locations
 
-    def _get_pdf_registry_info(self, url: str) -> Optional[Tuple[str, int]]:
+    def _prewarm_connections(self, urls: List[str], connections: int):
         """
-        Get stored hash and content length for a PDF URL from the registry.
+        Start opening connections to the domains with the most URLs.
+
+        Runs in the background, so connection setup for the busiest
+        ``connection_pool.prewarm_top`` domains overlaps with the first checks.
+
+        Args:
+            urls: Unique URLs about to be checked
+            connections: Connections to open per domain
+        """
+        if not self.client.prewarm_top:
+            return
+        first_url: Dict[str, str] = {}
+        counts: Dict[str, int] = {}
+        for url in urls:
+            domain = self.client._get_domain(url)
+            first_url.setdefault(domain, url)
+            counts[domain] = counts.get(domain, 0) + 1
+        top = sorted(counts, key=counts.get, reverse=True)[:self.client.prewarm_top]
+        logger.info(f"Pre-warming connections to {len(top)} domains")
+        self.client.prewarm([first_url[domain] for domain in top], connections)
+
+    def _get_pdf_registry_info(self, url: str) -> Optional[Tuple[str, int, Optional[str]]]:
+        """
+        Get stored hash, content length and range fingerprint for a PDF URL.
 
         Args:
             url: PDF URL to lookup
 
         Returns:
-            Tuple of (content_hash, content_length) or None if not found
+            Tuple of (content_hash, content_length, fingerprint) or None if not found
         """
         if not self.fact_registry:
             return None
@@ -129,11 +212,11 @@ class LinkChecker:
         # Search for URL in PDF entries
         pdfs = self.fact_registry.get('pdfs', [])
         for pdf_entry in pdfs:
-            if pdf_entry.get('url') == url:
+            if self.canonicalizer.canonical(pdf_entry.get('url', '')) == url:
                 content_hash = pdf_entry.get('content_hash')
                 content_length = pdf_entry.get('content_length')
                 if content_hash and content_length:
-                    return (content_hash, content_length)
+                    return (content_hash, content_length, pdf_entry.get('fingerprint'))
 
         return None
 
@@ -141,30 +224,40 @@ class LinkChecker:
         """
         Check a URL and classify its status.
 
+        The request goes to the spelling written in the markdown (see
+        _discover_urls), and a redirect is judged against that spelling.
+
         Args:
-            url: URL to check
+            url: Canonical URL to check
 
         Returns:
             Tuple of (status_classification, details_dict)
         """
+        fetch_url = self._fetch_urls.get(url, url)
+
         # Check if URL appears to be a PDF
         is_pdf = url.lower().endswith('.pdf')
         known_hash = None
         known_length = None
+        known_fingerprint = None
 
         if is_pdf:
             registry_info = self._get_pdf_registry_info(url)
             if registry_info:
-                known_hash, known_length = registry_info
+                known_hash, known_length, known_fingerprint = registry_info
 
         # Perform HTTP check
         if is_pdf and known_hash:
-            pdf_result = self.client.check_pdf(url, known_length, known_hash)
+            pdf_result = self.client.check_pdf(fetch_url, known_length, known_hash, known_fingerprint)
             details = {
                 'error_detail': pdf_result.get('error', '') or '',
-                'final_url': url,
+                'final_url': fetch_url,
                 'status_code': pdf_result.get('status_code'),
             }
+            if pdf_result.get('circuit_open'):
+                return ('CIRCUIT_OPEN', details)
+            if pdf_result.get('budget_exceeded'):
+                return ('BUDGET_EXCEEDED', details)
             if pdf_result.get('error'):
                 if 'timeout' in pdf_result['error'].lower():
                     return ('TIMEOUT', details)
@@ -181,23 +274,34 @@ class LinkChecker:
                 details['new_hash'] = pdf_result.get('new_hash')
                 details['old_content_length'] = known_length
                 details['new_content_length'] = pdf_result.get('new_content_length')
+                details['new_fingerprint'] = pdf_result.get('fingerprint', '')
                 return ('MOVED_PDF', details)
             return ('OK', details)
 
-        # Standard URL fetch
-        result = self.client.fetch(url)
+        # Standard URL check (HEAD first for non-approved domains, and for
+        # PDFs that were OK last time)
+        result = self.client.probe(fetch_url, prefer_head=url in self._head_only_urls)
 
         details = {
             'error_detail': result.get('error', '') or '',
-            'final_url': result.get('final_url', url),
+            'final_url': result.get('final_url', fetch_url),
             'status_code': result.get('status_code'),
+            'timings_ms': result.get('timings_ms', {}),
+            'content_hash': result.get('content_hash', ''),
+            'content_length': result.get('content_length', 0),
         }
 
         # Classify based on fetch result fields
         error = result.get('error')
         status_code = result.get('status_code', 0)
         is_soft_404 = result.get('is_soft_404', False)
-        final_url = result.get('final_url', url)
+        final_url = result.get('final_url', fetch_url)
+
+        if result.get('circuit_open'):
+            return ('CIRCUIT_OPEN', details)
+
+        if result.get('budget_exceeded'):
+            return ('BUDGET_EXCEEDED', details)
 
         if error is not None:
             error_lower = error.lower()
@@ -212,7 +316,7 @@ class LinkChecker:
             return ('SOFT_404', details)
 
         if status_code == 200:
-            if final_url != url:
+            if final_url != fetch_url:
                 return ('REDIRECT', details)
             return ('OK', details)
 
@@ -267,6 +371,15 @@ class LinkChecker:
         elif status == 'TIMEOUT':
             return "Server not responding. May be temporary. Retry manually."
 
+        elif status == 'CIRCUIT_OPEN':
+            return "Host unreachable (skipped after repeated connection failures). Recheck later."
+
+        elif status == 'BUDGET_EXCEEDED':
+            return f"Not checked: {details.get('error_detail', 'request budget exhausted')}. Raise the budget or recheck."
+
+        elif status == 'SKIPPED_BUDGET':
+            return "Not checked: the run's time budget ran out first. Checked in a later run."
+
         elif status == 'SERVER_ERROR':
             status_code = details.get('status_code', 'unknown')
             return f"Server error ({status_code}). May be temporary."
@@ -282,17 +395,228 @@ class LinkChecker:
 
         return "Manual review required."
 
-    def run(self) -> dict:
+    def _classify_deferring(self, url: str) -> Tuple[str, dict]:
         """
-        Run the link checker and produce results.
+        Classify a URL, raising RetryLater instead of sleeping before a retry.
+
+        Args:
+            url: URL to check
 
         Returns:
-            Results dictionary with all validation data
+            Tuple of (status_classification, details_dict)
+
+        Calling this again for the same URL after a deferral resumes the
+        classification: requests that already completed are not sent again.
+
+        Raises:
+            RetryLater: If a request needs to cool down before its next attempt
         """
-        logger.info("Starting link checker...")
+        with self.client.deferring_retries(url):
+            return self._classify_url(url)
 
-        # Discover all URLs
-        url_locations = self._discover_urls()
+    def _classify_queue(
+        self,
+        urls: List[str],
+        on_classified: Callable[[str, Tuple[str, dict]], None]
+    ) -> int:
+        """
+        Classify URLs in order, moving on while failed requests cool down.
+
+        A URL whose request must wait before retrying is put on a not-before
+        queue and picked up again as soon as it is due, ahead of unchecked
+        URLs. Only when every remaining URL is waiting does the loop sleep.
+        Once the time budget is used up the loop stops and the URLs it did
+        not finish are left unclassified (and their resume state dropped).
+
+        Args:
+            urls: URLs to check
+            on_classified: Called with (url, outcome) as each URL finishes
+
+        Returns:
+            Number of retries that were deferred
+        """
+        retries = RetryQueue()
+        remaining = iter(urls)
+
+        while True:
+            if self._out_of_time():
+                for url in retries.clear():
+                    self.client.forget_deferred(url)
+                return retries.deferred
+            url = retries.pop_ready()
+            if url is None:
+                url = next(remaining, None)
+            if url is None:
+                if not retries:
+                    return retries.deferred
+                retries.wait(until=self._deadline)
+                continue
+
+            try:
+                outcome = self._classify_deferring(url)
+            except RetryLater as e:
+                logger.debug(f"Deferring retry of {url} for {e.delay:.1f}s: {e.reason}")
+                retries.push(url, e.not_before)
+                continue
+            on_classified(url, outcome)
+
+    def _classify_all(self, urls: List[str]) -> Dict[str, Tuple[str, dict]]:
+        """
+        Classify URLs one at a time in the given (priority) order.
+
+        Args:
+            urls: Unique URLs to check
+
+        Returns:
+            Dict mapping URL to (status_classification, details_dict)
+        """
+        classified: Dict[str, Tuple[str, dict]] = {}
+
+        def record(url: str, outcome: Tuple[str, dict]):
+            classified[url] = outcome
+            if len(classified) % 10 == 0:
+                logger.info(f"Progress: {len(classified)}/{len(urls)} URLs checked")
+
+        deferred = self._classify_queue(urls, record)
+        if deferred:
+            logger.info(f"{deferred} retries deferred instead of blocking")
+        return classified
+
+    def _classify_all_threaded(
+        self,
+        urls: List[str],
+        workers: int
+    ) -> Dict[str, Tuple[str, dict]]:
+        """
+        Classify URLs on a thread pool, one worker per domain at a time.
+
+        URLs are grouped by domain and each group is checked sequentially by
+        a single task, so requests to one domain stay serialized under the
+        rate limit while different domains proceed in parallel. Each group
+        keeps the priority order of ``urls``.
+
+        Args:
+            urls: Unique URLs to check
+            workers: Number of worker threads
+
+        Returns:
+            Dict mapping URL to (status_classification, details_dict)
+        """
+        by_domain: Dict[str, List[str]] = {}
+        for url in urls:
+            by_domain.setdefault(self.client._get_domain(url), []).append(url)
+
+        classified: Dict[str, Tuple[str, dict]] = {}
+        lock = threading.Lock()
+
+        def record(url: str, outcome: Tuple[str, dict]):
+            with lock:
+                classified[url] = outcome
+                if len(classified) % 10 == 0:
+                    logger.info(f"Progress: {len(classified)}/{len(urls)} URLs checked")
+
+        def check_domain(domain_urls: List[str]):
+            self._classify_queue(domain_urls, record)
+
+        logger.info(f"Checking {len(by_domain)} domains on {workers} worker threads")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='link-check') as pool:
+            # Largest domains first so they do not end up as the tail; under a
+            # time budget, the domains holding the most urgent URLs first
+            if self._deadline is not None:
+                rank = {url: i for i, url in enumerate(urls)}
+                ordered = sorted(by_domain.values(), key=lambda group: rank[group[0]])
+            else:
+                ordered = sorted(by_domain.values(), key=len, reverse=True)
+            for future in [pool.submit(check_domain, group) for group in ordered]:
+                future.result()
+
+        return classified
+
+    async def _classify_all_async(self, urls: List[str]) -> Dict[str, Tuple[str, dict]]:
+        """
+        Classify URLs concurrently with per-domain concurrency limits.
+
+        Args:
+            urls: Unique URLs to check
+
+        Returns:
+            Dict mapping URL to (status_classification, details_dict)
+        """
+        async_client = AsyncRateLimitedClient(self.config, client=self.client)
+        classified: Dict[str, Tuple[str, dict]] = {}
+
+        def classify_in_time(url: str) -> Optional[Tuple[str, dict]]:
+            # Checked once a worker and domain slot are free, not when queued
+            if self._out_of_time():
+                return None
+            return self._classify_deferring(url)
+
+        async def classify(url: str):
+            # Cool-downs are awaited with the worker and domain slot released
+            while True:
+                try:
+                    outcome = await async_client.call(url, classify_in_time, url)
+                    if outcome is None:
+                        self.client.forget_deferred(url)
+                        return
+                    classified[url] = outcome
+                    break
+                except RetryLater as e:
+                    if self._out_of_time(e.delay):
+                        self.client.forget_deferred(url)
+                        return
+                    await asyncio.sleep(e.delay)
+            if len(classified) % 10 == 0:
+                logger.info(f"Progress: {len(classified)}/{len(urls)} URLs checked")
+
+        try:
+            await asyncio.gather(*(classify(url) for url in urls))
+        finally:
+            async_client.close()
+
+        return classified
+
+    def _recheck_open_circuits(self, classified: Dict[str, Tuple[str, dict]]):
+        """
+        Give short-circuited domains one more chance at the end of the run.
+
+        URLs skipped while a domain's circuit was open are re-checked after
+        everything else has finished. The first one is a half-open trial: if
+        the host is still unreachable the circuit reopens and the rest stay
+        CIRCUIT_OPEN without another connection attempt.
+
+        Args:
+            classified: Dict mapping URL to (status_classification, details_dict),
+                        updated in place
+        """
+        by_domain: Dict[str, List[str]] = {}
+        for url, (status, _) in classified.items():
+            if status == 'CIRCUIT_OPEN':
+                by_domain.setdefault(self.client._get_domain(url), []).append(url)
+
+        for domain, urls in by_domain.items():
+            logger.info(f"Rechecking {len(urls)} URLs on {domain} (circuit open)")
+            self.client.circuit_breaker.half_open(domain)
+            self._classify_queue(urls, classified.__setitem__)
+
+    def _build_result(
+        self,
+        url_locations: Dict[str, List[dict]],
+        classified: Dict[str, Tuple[str, dict]]
+    ) -> dict:
+        """
+        Merge per-URL classifications into the final result.
+
+        Iterates URLs in discovery order so the output does not depend on the
+        order in which checks completed.
+
+        Args:
+            url_locations: Dict mapping URL to list of location dicts
+            classified: Dict mapping URL to (status_classification, details_dict)
+
+        Returns:
+            Results dictionary with all validation data
+        """
         total_urls = sum(len(locations) for locations in url_locations.values())
         unique_urls = len(url_locations)
 
@@ -305,19 +629,17 @@ class LinkChecker:
             'SERVER_ERROR': 0,
             'TIMEOUT': 0,
             'DOMAIN_ERROR': 0,
-            'SOFT_404': 0
+            'SOFT_404': 0,
+            'CIRCUIT_OPEN': 0,
+            'BUDGET_EXCEEDED': 0,
+            'SKIPPED_BUDGET': 0
         }
 
         failures = []
         pdf_updates = []
 
-        # Check each unique URL
-        logger.info(f"Checking {unique_urls} unique URLs...")
-        for idx, (url, locations) in enumerate(url_locations.items(), 1):
-            if idx % 10 == 0:
-                logger.info(f"Progress: {idx}/{unique_urls} URLs checked")
-
-            status, details = self._classify_url(url)
+        for url, locations in url_locations.items():
+            status, details = classified[url]
             results[status] += 1
 
             # Track failures (anything non-OK)
@@ -328,10 +650,18 @@ class LinkChecker:
                     'locations': locations,
                     'error_detail': details.get('error_detail', ''),
                     'final_url': details.get('final_url', url),
+                    'timings_ms': details.get('timings_ms', {}),
                     'suggested_action': self._generate_suggested_action(
                         status, url, details
                     )
                 }
+                for key in ('consecutive_failures', 'last_checked'):
+                    if key in details:
+                        failure_entry[key] = details[key]
+                if any('raw_url' in location for location in locations):
+                    failure_entry['variants'] = sorted(
+                        {location.get('raw_url', url) for location in locations}
+                    )
                 failures.append(failure_entry)
 
                 # Separate tracking for PDF updates
@@ -342,6 +672,7 @@ class LinkChecker:
                         'new_hash': details.get('new_hash', ''),
                         'old_content_length': details.get('old_content_length', 0),
                         'new_content_length': details.get('new_content_length', 0),
+                        'new_fingerprint': details.get('new_fingerprint', ''),
                         'locations': locations,
                         'suggested_action': failure_entry['suggested_action']
                     }
@@ -356,11 +687,312 @@ class LinkChecker:
             'unique_urls': unique_urls,
             'results': results,
             'failures': failures,
-            'pdf_updates': pdf_updates
+            'pdf_updates': pdf_updates,
+            'circuit_breaker': self.client.circuit_breaker.stats(),
+            'latency': self.client.timing_stats.summary(),
+            'connection_pools': self.client.pool_stats(),
+            'body_policy': self.client.body_policy.stats(),
+            'accounting': self.client.accounting.stats(),
+            'hedging': self.client.hedge_stats()
         }
 
         return result
 
+    def _changed_urls(self, url_locations: Dict[str, List[dict]]) -> Optional[set]:
+        """
+        Find URLs referenced on markdown lines changed since ``base_rev``.
+
+        Args:
+            url_locations: Dict mapping URL to list of location dicts
+
+        Returns:
+            Set of changed URLs, or None without a base revision or if the
+            git diff failed (every URL is then treated as unchanged)
+        """
+        if not self.base_rev:
+            return None
+        try:
+            lines = changed_lines(self.repo_root, self.base_rev)
+        except ValueError as e:
+            logger.error(f"Cannot diff against {self.base_rev}, checking URLs by TTL only: {e}")
+            return None
+
+        changed = {
+            url for url, locations in url_locations.items()
+            if any(
+                location['line'] in lines.get(Path(location['file']).as_posix(), ())
+                for location in locations
+            )
+        }
+        self._git_diff_stats = {
+            'base_rev': self.base_rev,
+            'changed_files': len(lines),
+            'changed_urls': len(changed),
+        }
+        logger.info(f"{len(changed)} URLs on lines changed since {self.base_rev}")
+        return changed
+
+    def _plan_checks(
+        self,
+        url_locations: Dict[str, List[dict]]
+    ) -> Tuple[Dict[str, List[dict]], List[str], Dict[str, Tuple[str, dict]]]:
+        """
+        Decide which URLs this run requests and which outcomes it carries forward.
+
+        Without a link state to carry unchanged URLs forward, a diff-based
+        run narrows the result to the changed URLs. URLs to check are
+        returned in priority order.
+
+        Args:
+            url_locations: Dict mapping URL to list of location dicts
+
+        Returns:
+            Tuple of (URL locations to report, URLs to check, carried outcomes)
+        """
+        changed = self._changed_urls(url_locations)
+        if changed is not None and self.link_state is None:
+            logger.warning("Link state disabled: reporting only URLs on changed lines")
+            url_locations = {
+                url: locations for url, locations in url_locations.items() if url in changed
+            }
+        rows = self.link_state.load() if self.link_state is not None else {}
+        urls, carried = self._split_by_freshness(list(url_locations), changed or set(), rows)
+        return url_locations, self._prioritize(urls, url_locations, rows), carried
+
+    def _prioritize(
+        self,
+        urls: List[str],
+        url_locations: Dict[str, List[dict]],
+        rows: Dict[str, dict]
+    ) -> List[str]:
+        """
+        Order URLs so the most useful checks run first.
+
+        URLs that failed last time come first, then PDFs tracked in the fact
+        registry, then URLs referenced from the most places, then the longest
+        unchecked (never-checked URLs count as the stalest). Ties keep
+        discovery order.
+
+        Args:
+            urls: URLs to check
+            url_locations: Dict mapping URL to list of location dicts
+            rows: Stored link state rows by URL (empty without a store)
+
+        Returns:
+            The URLs in priority order
+        """
+        def priority(url: str) -> tuple:
+            row = rows.get(url)
+            failing = row is not None and row['consecutive_failures'] > 0
+            tracked_pdf = url.lower().endswith('.pdf') and self._get_pdf_registry_info(url) is not None
+            checked_at = row['checked_at'] if row is not None else float('-inf')
+            return (not failing, not tracked_pdf, -len(url_locations[url]), checked_at)
+
+        return sorted(urls, key=priority)
+
+    def _start_clock(self):
+        """Start the time budget (if any) at the beginning of a run."""
+        if self.time_budget:
+            self._deadline = time.monotonic() + self.time_budget
+            logger.info(f"Time budget: {self.time_budget:.0f} s")
+
+    def _out_of_time(self, margin: float = 0.0) -> bool:
+        """
+        Whether the time budget is used up.
+
+        Args:
+            margin: Seconds of further waiting to allow for
+
+        Returns:
+            True if the deadline has passed (or would pass within margin)
+        """
+        return self._deadline is not None and time.monotonic() + margin >= self._deadline
+
+    def _mark_skipped(
+        self,
+        urls: List[str],
+        classified: Dict[str, Tuple[str, dict]]
+    ) -> Optional[dict]:
+        """
+        Report URLs the time budget did not reach as SKIPPED_BUDGET.
+
+        Args:
+            urls: URLs this run was to check
+            classified: Dict mapping URL to (status_classification, details_dict),
+                        updated in place
+
+        Returns:
+            Time budget statistics, or None without a time budget
+        """
+        if self._deadline is None:
+            return None
+        skipped = [url for url in urls if url not in classified]
+        for url in skipped:
+            classified[url] = ('SKIPPED_BUDGET', {
+                'error_detail': f"Time budget of {self.time_budget:.0f} s used up",
+                'final_url': url,
+                'status_code': None,
+            })
+        if skipped:
+            logger.warning(f"Time budget used up: {len(skipped)} of {len(urls)} URLs not checked")
+        return {'seconds': self.time_budget, 'checked': len(urls) - len(skipped), 'skipped': len(skipped)}
+
+    def _split_by_freshness(
+        self,
+        urls: List[str],
+        changed: set,
+        rows: Dict[str, dict]
+    ) -> Tuple[List[str], Dict[str, Tuple[str, dict]]]:
+        """
+        Separate URLs due for a check from those whose stored outcome is fresh.
+
+        Fresh outcomes are carried forward into this run's result with the
+        time they were last checked, unless the URL is on a changed line.
+        OK PDFs that are due are marked for a HEAD-only recheck.
+
+        Args:
+            urls: Unique URLs found in this run
+            changed: URLs on lines changed since ``base_rev`` (always checked)
+            rows: Stored link state rows by URL
+
+        Returns:
+            Tuple of (URLs to check, dict mapping carried URLs to
+            (status_classification, details_dict))
+        """
+        if self.link_state is None:
+            return urls, {}
+
+        now = time.time()
+        due: List[str] = []
+        carried: Dict[str, Tuple[str, dict]] = {}
+        for url in urls:
+            row = rows.get(url)
+            if (row is not None and not self.full_recheck and url not in changed
+                    and self.link_state.is_fresh(row, now)):
+                details = dict(row['details'])
+                details['last_checked'] = datetime.fromtimestamp(
+                    row['checked_at'], timezone.utc
+                ).isoformat()
+                carried[url] = (row['status'], details)
+                continue
+            due.append(url)
+            if row is not None and self.link_state.ttl_class(url, row['status']) == 'pdf':
+                self._head_only_urls.add(url)
+
+        logger.info(
+            f"Link state: {len(due)} URLs due, {len(carried)} carried forward "
+            f"from {self.link_state.path}"
+        )
+        return due, carried
+
+    def _save_link_state(
+        self,
+        url_locations: Dict[str, List[dict]],
+        classified: Dict[str, Tuple[str, dict]],
+        carried: Dict[str, Tuple[str, dict]]
+    ) -> Optional[dict]:
+        """
+        Store this run's outcomes and drop URLs no longer referenced.
+
+        Args:
+            url_locations: Dict mapping URL to list of location dicts
+            classified: Outcomes of the URLs checked in this run
+            carried: Outcomes carried forward from earlier runs
+
+        Returns:
+            Link state statistics, or None when the store is disabled
+        """
+        if self.link_state is None:
+            return None
+        try:
+            self.link_state.save(classified)
+            pruned = self.link_state.prune(set(url_locations))
+        finally:
+            self.link_state.close()
+        return {
+            'path': str(self.link_state.path),
+            'checked': len(classified),
+            'carried_forward': len(carried),
+            'pruned': pruned,
+        }
+
+    def run(self, mode: str = 'sequential', workers: int = 1) -> dict:
+        """
+        Run the link checker and produce results.
+
+        Args:
+            mode: 'sequential' to check URLs one at a time, or 'async' to
+                  check different domains concurrently
+            workers: In sequential mode, values above 1 fan domains out over
+                     a thread pool of this size (output is unchanged)
+
+        Returns:
+            Results dictionary with all validation data
+        """
+        if mode == 'async':
+            return asyncio.run(self.run_async())
+
+        logger.info("Starting link checker...")
+        self._start_clock()
+
+        # Discover all URLs
+        url_locations = self._discover_urls()
+        url_locations, urls, carried = self._plan_checks(url_locations)
+
+        # One connection per domain is in use at a time in sequential mode
+        self._prewarm_connections(urls, 1)
+
+        # Check each unique URL
+        logger.info(f"Checking {len(urls)} unique URLs...")
+        if workers > 1:
+            classified = self._classify_all_threaded(urls, workers)
+        else:
+            classified = self._classify_all(urls)
+        self._recheck_open_circuits(classified)
+        self.client.save_state()
+        link_state = self._save_link_state(url_locations, classified, carried)
+        time_budget = self._mark_skipped(urls, classified)
+
+        result = self._build_result(url_locations, {**classified, **carried})
+        result['link_state'] = link_state
+        result['git_diff'] = self._git_diff_stats
+        result['time_budget'] = time_budget
+        result['url_canonical'] = self._canonical_stats
+        return result
+
+    async def run_async(self) -> dict:
+        """
+        Run the link checker with concurrent per-domain request queues.
+
+        Returns:
+            Results dictionary with all validation data
+        """
+        logger.info("Starting link checker (async)...")
+        self._start_clock()
+
+        # Discover all URLs
+        url_locations = self._discover_urls()
+        url_locations, urls, carried = self._plan_checks(url_locations)
+
+        self._prewarm_connections(
+            urls, self.config.get('concurrency', {}).get('per_domain', 2)
+        )
+
+        # Check each unique URL
+        logger.info(f"Checking {len(urls)} unique URLs concurrently...")
+        classified = await self._classify_all_async(urls)
+        await asyncio.to_thread(self._recheck_open_circuits, classified)
+        self.client.save_state()
+        link_state = self._save_link_state(url_locations, classified, carried)
+        time_budget = self._mark_skipped(urls, classified)
+
+        result = self._build_result(url_locations, {**classified, **carried})
+        result['link_state'] = link_state
+        result['git_diff'] = self._git_diff_stats
+        result['time_budget'] = time_budget
+        result['url_canonical'] = self._canonical_stats
+        return result
+
 
 def main():
     """CLI entry point for standalone execution."""
@@ -385,6 +1017,31 @@ def main():
         default=Path('knowledge_base/fact_registry.yaml'),
         help='Path to fact registry YAML file'
     )
+    parser.add_argument(
+        '--mode',
+        choices=['sequential', 'async'],
+        default='sequential',
+        help='Check URLs one at a time or concurrently per domain'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker threads for sequential mode; domains are checked in parallel'
+    )
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        metavar='SECONDS',
+        help='Stop checking after this many seconds (most important URLs first); '
+             'URLs not reached are reported as SKIPPED_BUDGET'
+    )
+    parser.add_argument(
+        '--base-rev',
+        metavar='REV',
+        help='Only check URLs on markdown lines changed since this git revision '
+             '(plus URLs past their recheck TTL); other outcomes are carried forward'
+    )
 
     args = parser.parse_args()
 
@@ -407,10 +1064,12 @@ def main():
     checker = LinkChecker(
         config=config,
         repo_root=repo_root,
-        registry_path=args.registry if args.registry.exists() else None
+        registry_path=args.registry if args.registry.exists() else None,
+        base_rev=args.base_rev,
+        time_budget=args.time_budget
     )
 
-    result = checker.run()
+    result = checker.run(mode=args.mode, workers=args.workers)
 
     # Write results to JSON
     try:
@@ -421,18 +1080,23 @@ def main():
         logger.error(f"Failed to write results: {e}")
         sys.exit(2)
 
-    # Determine exit code
-    has_failures = len(result['failures']) > 0
+    # Determine exit code; URLs left unchecked by a budget are warnings, as in run_all
+    failures = [
+        f for f in result['failures'] if f['status'] not in ('SKIPPED_BUDGET', 'BUDGET_EXCEEDED')
+    ]
+    has_failures = len(failures) > 0
     has_warnings = (
         result['results']['REDIRECT'] > 0 or
-        result['results']['MOVED_PDF'] > 0
+        result['results']['MOVED_PDF'] > 0 or
+        result['results']['BUDGET_EXCEEDED'] > 0 or
+        result['results']['SKIPPED_BUDGET'] > 0
     )
 
     if has_failures:
-        logger.warning(f"Link checking found {len(result['failures'])} failures")
+        logger.warning(f"Link checking found {len(failures)} failures")
         sys.exit(2)
     elif has_warnings:
-        logger.warning(f"Link checking found warnings (redirects or PDF updates)")
+        logger.warning(f"Link checking found warnings (redirects, PDF updates or unchecked URLs)")
         sys.exit(1)
     else:
         logger.info("All links validated successfully")
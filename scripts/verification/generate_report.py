@@ -44,6 +44,7 @@ class ReportGenerator:
         crossrefs_result: dict,
         facts_result: dict,
         circulars_result: dict,
+        http_stats: dict | None = None,
     ) -> int:
         """
         Generate comprehensive report from all verification results.
@@ -53,6 +54,7 @@ class ReportGenerator:
             crossrefs_result: Cross-reference checking results
             facts_result: Fact verification results
             circulars_result: Circular monitoring results
+            http_stats: HTTP client statistics for the run (cache hits, etc.)
 
         Returns:
             Exit code: 0=PASS, 1=WARNINGS, 2=ACTION REQUIRED
@@ -68,6 +70,9 @@ class ReportGenerator:
         # Determine overall status
         status, exit_code = self._determine_overall_status(combined_results)
 
+        if http_stats:
+            combined_results["http"] = http_stats
+
         # Generate report content
         report_date = datetime.utcnow().strftime("%Y-%m-%d")
         report_content = self._build_report(combined_results, report_date, status)
@@ -109,7 +114,7 @@ class ReportGenerator:
         critical_link_failures = [
             f
             for f in link_failures
-            if f.get("status") in ("NOT_FOUND", "DOMAIN_ERROR", "TIMEOUT", "SERVER_ERROR", "SOFT_404")
+            if f.get("status") in ("NOT_FOUND", "DOMAIN_ERROR", "TIMEOUT", "SERVER_ERROR", "SOFT_404", "CIRCUIT_OPEN")
         ]
 
         crossref_failures = crossrefs.get("failures", [])
@@ -140,6 +145,9 @@ class ReportGenerator:
         pdf_updates = [
             f for f in link_failures if f.get("status") == "MOVED_PDF"
         ]
+        unchecked_links = [
+            f for f in link_failures if f.get("status") in ("BUDGET_EXCEEDED", "SKIPPED_BUDGET")
+        ]
 
         stale_facts = [f for f in fact_details if f.get("issue_type") == "stale"]
         approaching_facts = [
@@ -151,6 +159,7 @@ class ReportGenerator:
         has_warnings = (
             len(redirect_failures) > 0
             or len(pdf_updates) > 0
+            or len(unchecked_links) > 0
             or len(stale_facts) > 0
             or len(approaching_facts) > 0
             or len(new_circulars) > 0
@@ -273,6 +282,8 @@ class ReportGenerator:
         if not run_date:
             run_date = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
 
+        http_stats = results.get("http", {})
+
         return {
             "version": self.config.get("version", "1.0.0"),
             "run_date": run_date,
@@ -281,6 +292,19 @@ class ReportGenerator:
             "facts_verified": facts_verified,
             "internal_links_checked": internal_links_checked,
             "circular_sources_checked": circular_sources,
+            "response_cache": http_stats.get("response_cache"),
+            "dns": http_stats.get("dns"),
+            "accounting": http_stats.get("accounting") or link_data.get("accounting"),
+            "single_flight": http_stats.get("single_flight"),
+            "circuit_breaker": link_data.get("circuit_breaker"),
+            "latency": link_data.get("latency"),
+            "connection_pools": link_data.get("connection_pools"),
+            "body_policy": link_data.get("body_policy"),
+            "hedging": link_data.get("hedging"),
+            "link_state": link_data.get("link_state"),
+            "git_diff": link_data.get("git_diff"),
+            "time_budget": link_data.get("time_budget"),
+            "url_canonical": link_data.get("url_canonical"),
         }
 
 
@@ -307,6 +331,7 @@ def load_results(results_dir: Path) -> tuple[dict, dict, dict, dict]:
         "results": {
             "OK": 0, "REDIRECT": 0, "MOVED_PDF": 0, "NOT_FOUND": 0,
             "SERVER_ERROR": 0, "TIMEOUT": 0, "DOMAIN_ERROR": 0, "SOFT_404": 0,
+            "CIRCUIT_OPEN": 0, "BUDGET_EXCEEDED": 0, "SKIPPED_BUDGET": 0,
         },
         "pdf_updates": [],
     }
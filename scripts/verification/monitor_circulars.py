@@ -19,7 +19,9 @@ import yaml
 from bs4 import BeautifulSoup
 
 # Import local utility
+from utils.accounting import checker_scope
 from utils.http_client import RateLimitedClient
+from utils.response_cache import ResponseCache
 
 # Try importing feedparser with graceful fallback
 try:
@@ -42,7 +44,12 @@ class CircularMonitor:
     - State persistence for incremental monitoring
     """
 
-    def __init__(self, config: dict, state_dir: Path):
+    def __init__(
+        self,
+        config: dict,
+        state_dir: Path,
+        response_cache: Optional[ResponseCache] = None
+    ):
         """
         Initialize the circular monitor.
 
@@ -50,6 +57,7 @@ class CircularMonitor:
             config: Configuration dictionary with circular_sources,
                    circular_keywords, keyword_to_files
             state_dir: Directory for persisting monitor state
+            response_cache: Run-scoped response cache shared with other checkers
         """
         self.config = config
         self.state_dir = Path(state_dir)
@@ -61,8 +69,9 @@ class CircularMonitor:
         self.keywords = config.get("circular_keywords", {})
         self.keyword_to_files = config.get("keyword_to_files", {})
 
-        # Initialize HTTP client with config
-        self.client = RateLimitedClient(config)
+        # Initialize HTTP client with config (requests are accounted to this checker)
+        with checker_scope('circulars'):
+            self.client = RateLimitedClient(config, response_cache=response_cache)
 
         # Load state
         self.state = self._load_state()
@@ -95,7 +104,7 @@ class CircularMonitor:
         except Exception as e:
             self.logger.error(f"Failed to save state: {e}")
 
-    def _parse_html_circulars(self, html: str, source_name: str) -> Optional[list[dict]]:
+    def _parse_html_circulars(self, html: str | bytes, source_name: str) -> Optional[list[dict]]:
         """
         Parse HTML content to extract circular/announcement entries.
 
@@ -103,7 +112,7 @@ class CircularMonitor:
         with dates and titles, tables with circular information.
 
         Args:
-            html: Raw HTML content
+            html: Raw HTML content (bytes are decoded by BeautifulSoup)
             source_name: Name of the source for logging
 
         Returns:
@@ -216,11 +225,10 @@ class CircularMonitor:
             feed_url = source_url.rstrip('/') + path
             try:
                 self.logger.info(f"Trying RSS feed: {feed_url}")
-                self.client._wait_for_rate_limit(self.client._get_domain(feed_url))
-                response = self.client.session.get(feed_url, timeout=self.client.timeout)
+                response = self.client.fetch(feed_url, keep_body=True)
 
-                if response.status_code == 200:
-                    feed = feedparser.parse(response.text)
+                if response["status_code"] == 200 and not response["error"]:
+                    feed = feedparser.parse(response["content"])
 
                     if feed.entries:
                         entries = []
@@ -346,12 +354,14 @@ class CircularMonitor:
         source_state = self.state[source_name]
 
         try:
-            # Primary: HTML scraping
-            self.client._wait_for_rate_limit(self.client._get_domain(source_url))
-            response = self.client.session.get(source_url, timeout=self.client.timeout)
-            response.raise_for_status()
+            # Primary: HTML scraping (conditional on cached validators)
+            response = self.client.fetch(source_url, keep_body=True)
+            if response["error"]:
+                raise ConnectionError(response["error"])
+            if response["status_code"] != 200:
+                raise ConnectionError(f"HTTP {response['status_code']} for {source_url}")
 
-            entries = self._parse_html_circulars(response.text, source_name)
+            entries = self._parse_html_circulars(response["content"], source_name)
 
             # Fallback: RSS/Atom
             if entries is None:
@@ -466,6 +476,8 @@ class CircularMonitor:
             source_state['seen_titles'] = list(seen_titles)
             self.state[source_name] = source_state
 
+        self.client.save_state()
+
         self.logger.info(
             f"Monitoring complete: {result['new_circulars']} new circulars, "
             f"{result['new_relevant']} relevant"
@@ -2,7 +2,8 @@
 """
 run_all.py - Daily Verification Pipeline Orchestrator
 
-Runs all verification checks sequentially and generates a unified report.
+Runs all verification checks (sequentially, or concurrently with
+--parallel-checks) and generates a unified report.
 Designed for daily GitHub Actions execution and manual local runs.
 
 Exit Codes:
@@ -16,6 +17,7 @@ import json
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -26,6 +28,11 @@ try:
     from check_facts import FactChecker
     from monitor_circulars import CircularMonitor
     from generate_report import ReportGenerator
+    from utils.accounting import ACCOUNTING
+    from utils.cassette import Cassette
+    from utils.dns_cache import DNS_CACHE
+    from utils.response_cache import ResponseCache
+    from utils.single_flight import IN_FLIGHT
 except ImportError as e:
     print(f"ERROR: Failed to import verification modules: {e}", file=sys.stderr)
     print("Ensure all verification scripts are in the same directory.", file=sys.stderr)
@@ -116,7 +123,12 @@ def run_check(
     output_dir: Path,
     registry_path: Optional[Path],
     dry_run: bool,
-    logger: logging.Logger
+    logger: logging.Logger,
+    link_mode: str = 'sequential',
+    link_workers: int = 1,
+    link_base_rev: Optional[str] = None,
+    link_time_budget: Optional[float] = None,
+    response_cache: Optional[ResponseCache] = None
 ) -> Tuple[Optional[Dict], float]:
     """
     Run a single verification check.
@@ -129,6 +141,12 @@ def run_check(
         registry_path: Path to fact registry (for facts check)
         dry_run: Whether to skip HTTP requests
         logger: Logger instance
+        link_mode: URL checking mode for the links check ('sequential' or 'async')
+        link_workers: Worker threads for sequential link checking
+        link_base_rev: Git revision; the links check only requests URLs on
+            lines changed since it (plus URLs past their recheck TTL)
+        link_time_budget: Seconds the links check may spend checking URLs
+        response_cache: Run-scoped response cache shared by all checkers
 
     Returns:
         Tuple of (result_dict, elapsed_time_seconds)
@@ -139,8 +157,15 @@ def run_check(
     try:
         if check_name == 'links':
             logger.info("Running URL validation...")
-            checker = LinkChecker(config=config, repo_root=repo_root, registry_path=registry_path)
-            result = checker.run()
+            checker = LinkChecker(
+                config=config,
+                repo_root=repo_root,
+                registry_path=registry_path,
+                response_cache=response_cache,
+                base_rev=link_base_rev,
+                time_budget=link_time_budget
+            )
+            result = checker.run(mode=link_mode, workers=link_workers)
             output_file = output_dir / 'links_result.json'
 
         elif check_name == 'crossrefs':
@@ -157,7 +182,8 @@ def run_check(
             checker = FactChecker(
                 config=config,
                 repo_root=repo_root,
-                registry_path=registry_path
+                registry_path=registry_path,
+                response_cache=response_cache
             )
             result = checker.run()
             output_file = output_dir / 'facts_result.json'
@@ -167,7 +193,8 @@ def run_check(
             state_dir = Path(__file__).parent / '.state'
             monitor = CircularMonitor(
                 config=config,
-                state_dir=state_dir
+                state_dir=state_dir,
+                response_cache=response_cache
             )
             result = monitor.run()
             output_file = output_dir / 'circulars_result.json'
@@ -213,10 +240,10 @@ def determine_overall_status(results: Dict[str, Optional[Dict]]) -> str:
         if check_name == 'links':
             link_results = result.get('results', {})
             critical_count = sum(link_results.get(k, 0) for k in
-                               ('NOT_FOUND', 'SERVER_ERROR', 'TIMEOUT', 'DOMAIN_ERROR', 'SOFT_404'))
+                               ('NOT_FOUND', 'SERVER_ERROR', 'TIMEOUT', 'DOMAIN_ERROR', 'SOFT_404', 'CIRCUIT_OPEN'))
             if critical_count > 0:
                 has_critical = True
-            if link_results.get('REDIRECT', 0) > 0 or link_results.get('MOVED_PDF', 0) > 0:
+            if any(link_results.get(k, 0) > 0 for k in ('REDIRECT', 'MOVED_PDF', 'BUDGET_EXCEEDED', 'SKIPPED_BUDGET')):
                 has_warnings = True
 
         elif check_name == 'crossrefs':
@@ -331,7 +358,14 @@ Examples:
   %(prog)s                                    # Run all checks
   %(prog)s --checks links                     # URL validation only
   %(prog)s --checks links,crossrefs           # Multiple checks
+  %(prog)s --link-mode async                  # Check domains concurrently
+  %(prog)s --checks links --workers 4         # Check domains on 4 threads
+  %(prog)s --parallel-checks                  # Run links, facts, ... concurrently
+  %(prog)s --checks links --base-rev origin/main  # PR build: changed links only
+  %(prog)s --checks links --time-budget 1200  # Stop link checks after 20 minutes
   %(prog)s --dry-run                          # Parse without HTTP requests
+  %(prog)s --record cassettes/nightly         # Save all HTTP traffic
+  %(prog)s --replay cassettes/nightly         # Re-run offline from saved traffic
   %(prog)s --verbose --output-dir ./results   # Verbose with custom output
         """
     )
@@ -367,6 +401,55 @@ Examples:
         action='store_true',
         help='Parse markdown and build lists, but skip HTTP requests'
     )
+    parser.add_argument(
+        '--link-mode',
+        choices=['sequential', 'async'],
+        default='sequential',
+        help='URL checking mode: one at a time, or concurrently per domain (default: sequential)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker threads for sequential link checking, one domain per thread (default: 1)'
+    )
+    parser.add_argument(
+        '--parallel-checks',
+        action='store_true',
+        help='Run the selected checks concurrently instead of one after another'
+    )
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        metavar='SECONDS',
+        help='Wall-clock limit for the links check; the most important URLs are checked '
+             'first and the rest are reported as SKIPPED_BUDGET'
+    )
+    parser.add_argument(
+        '--base-rev',
+        metavar='REV',
+        help='Link-check only URLs on markdown lines changed since this git revision '
+             '(e.g. origin/main on PR builds), carrying other outcomes forward'
+    )
+    parser.add_argument(
+        '--full-recheck',
+        action='store_true',
+        help='Check every URL, ignoring link outcomes stored by earlier runs'
+    )
+
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        '--record',
+        type=Path,
+        metavar='DIR',
+        help='Record every HTTP request and response to a cassette directory'
+    )
+    cassette_group.add_argument(
+        '--replay',
+        type=Path,
+        metavar='DIR',
+        help='Serve HTTP responses from a recorded cassette (no network, no rate limits)'
+    )
 
     args = parser.parse_args()
 
@@ -391,6 +474,19 @@ Examples:
         config = load_config(args.config, script_dir)
         logger.info("Configuration loaded")
 
+        if args.record or args.replay:
+            config['cassette'] = {
+                'mode': 'record' if args.record else 'replay',
+                'dir': str(args.record or args.replay),
+            }
+            logger.info(f"Cassette: {config['cassette']['mode']} {config['cassette']['dir']}")
+            if args.replay and not (args.replay / 'interactions.jsonl').exists():
+                logger.error(f"No recorded cassette in {args.replay}")
+                return 2
+
+        if args.full_recheck:
+            config.setdefault('link_state', {})['full_recheck'] = True
+
         # Determine registry path
         registry_path = args.registry
         if registry_path is None and 'facts' in checks_to_run:
@@ -406,26 +502,66 @@ Examples:
         output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Output directory: {output_dir}")
 
-        # Run checks sequentially
+        # One response cache for the whole run, so each URL is fetched once
+        response_cache = ResponseCache.from_config(config)
+
+        # Run checks one after another, or all at once with --parallel-checks
+        # (clients share the process-wide rate limiter and validator cache, so
+        # per-domain rates hold across checkers; identical requests in flight
+        # at the same time are shared)
         pipeline_start = time.time()
         results = {}
         timings = {}
-
-        for check_name in checks_to_run:
-            result, elapsed = run_check(
-                check_name=check_name,
-                config=config,
-                repo_root=repo_root,
-                output_dir=output_dir,
-                registry_path=registry_path,
-                dry_run=args.dry_run,
-                logger=logger
-            )
-            results[check_name] = result
-            timings[check_name] = elapsed
+        check_args = dict(
+            config=config,
+            repo_root=repo_root,
+            output_dir=output_dir,
+            registry_path=registry_path,
+            dry_run=args.dry_run,
+            logger=logger,
+            link_mode=args.link_mode,
+            link_workers=args.workers,
+            link_base_rev=args.base_rev,
+            link_time_budget=args.time_budget,
+            response_cache=response_cache
+        )
+
+        if args.parallel_checks and len(checks_to_run) > 1:
+            with ThreadPoolExecutor(max_workers=len(checks_to_run), thread_name_prefix='check') as executor:
+                futures = {
+                    check_name: executor.submit(run_check, check_name=check_name, **check_args)
+                    for check_name in checks_to_run
+                }
+            for check_name in checks_to_run:
+                results[check_name], timings[check_name] = futures[check_name].result()
+        else:
+            for check_name in checks_to_run:
+                results[check_name], timings[check_name] = run_check(check_name=check_name, **check_args)
 
         total_time = time.time() - pipeline_start
 
+        http_stats = {
+            'response_cache': response_cache.stats(),
+            'dns': DNS_CACHE.stats(),
+            'accounting': ACCOUNTING.stats(),
+            'single_flight': IN_FLIGHT.stats(),
+        }
+        cassette = Cassette.from_config(config)
+        if cassette is not None:
+            http_stats['cassette'] = cassette.stats()
+            logger.info(f"Cassette: {http_stats['cassette']}")
+        response_cache.close()
+        logger.info(f"Response cache: {http_stats['response_cache']}")
+        logger.info(
+            f"DNS cache: {http_stats['dns']['hits']}/{http_stats['dns']['lookups']} hits, "
+            f"{http_stats['dns']['resolve_ms']:.0f} ms resolving"
+        )
+        traffic = http_stats['accounting']['totals']
+        logger.info(
+            f"HTTP traffic: {traffic['requests']} requests ({traffic['retries']} retries), "
+            f"{traffic['bytes_in'] / 1_048_576:.1f} MB in, {traffic['refused']} refused by budgets"
+        )
+
         # Generate unified report
         logger.info("Generating unified report...")
         try:
@@ -437,7 +573,8 @@ Examples:
                 links_result=results.get('links', {}),
                 crossrefs_result=results.get('crossrefs', {}),
                 facts_result=results.get('facts', {}),
-                circulars_result=results.get('circulars', {})
+                circulars_result=results.get('circulars', {}),
+                http_stats=http_stats
             )
             report_path = output_dir / 'latest-report.md'
             logger.info(f"Report generated: {report_path}")
@@ -0,0 +1,97 @@
+"""Equivalence of the sequential, thread-pool and async link check modes."""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from check_links import LinkChecker
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / 'config.yaml'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers by path: /ok*, /redir, /err, anything else 404."""
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, head: bool):
+        if self.path.startswith('/ok'):
+            status, headers, body = 200, {}, b'<html><title>Page</title>content</html>'
+        elif self.path == '/redir':
+            status, headers, body = 302, {'Location': '/ok/target'}, b''
+        elif self.path == '/err':
+            status, headers, body = 500, {}, b'error'
+        else:
+            status, headers, body = 404, {}, b'<html>missing</html>'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(head=False)
+
+    def do_HEAD(self):
+        self._respond(head=True)
+
+
+@pytest.fixture(scope='module')
+def hosts():
+    servers = [ThreadingHTTPServer(('127.0.0.1', 0), StubHandler) for _ in range(2)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield [f'http://127.0.0.1:{server.server_port}' for server in servers]
+    for server in servers:
+        server.shutdown()
+
+
+@pytest.fixture
+def repo(tmp_path, hosts):
+    lines = []
+    for host in hosts:
+        for path in ('/ok1', '/ok2', '/ok3', '/redir', '/err', '/missing'):
+            lines.append(f'- [{path}]({host}{path})')
+        lines.append(f'see {host}/ok1 again')
+    (tmp_path / 'chapters').mkdir()
+    (tmp_path / 'chapters' / 'a.md').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return tmp_path
+
+
+def stable_fields(result: dict) -> dict:
+    """Drop fields that vary between runs (timestamps, timings, client stats)."""
+    return {
+        'results': result['results'],
+        'unique_urls': result['unique_urls'],
+        'failures': [
+            {key: failure[key] for key in ('url', 'status', 'locations', 'final_url', 'error_detail')}
+            for failure in result['failures']
+        ],
+    }
+
+
+def run_checker(repo: Path, tmp_path: Path, mode: str, workers: int = 1) -> dict:
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config['state_dir'] = str(tmp_path / f'state-{mode}-{workers}')
+    config['link_state']['enabled'] = False
+    config['rate_limits']['external'] = 50
+    config['retry']['max_retries'] = 1
+    return LinkChecker(config, repo).run(mode=mode, workers=workers)
+
+
+def test_modes_agree_on_stable_fields(repo, tmp_path):
+    sequential = stable_fields(run_checker(repo, tmp_path, 'sequential'))
+    assert sequential['results']['OK'] == 6
+    assert sequential['results']['REDIRECT'] == 2
+    assert stable_fields(run_checker(repo, tmp_path, 'sequential', workers=4)) == sequential
+    assert stable_fields(run_checker(repo, tmp_path, 'async')) == sequential
@@ -0,0 +1,35 @@
+"""Regression checks for Soft404Detector."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.soft404 import Soft404Detector
+
+BLOB_URL = 'https://www.deutsche-boerse.com/resource/blob/12345/circular.pdf'
+LANDING_TITLES = [
+    'Deutsche Börse'.encode('utf-8'),
+    'Deutsche Börse'.encode('latin-1'),
+    b'Deutsche B&ouml;rse',
+    b'Deutsche B&#246;rse',
+]
+
+
+@pytest.fixture
+def detector() -> Soft404Detector:
+    return Soft404Detector([], {}, ['deutsche-boerse.com'])
+
+
+@pytest.mark.parametrize('title', LANDING_TITLES)
+@pytest.mark.parametrize('encoding', ['utf-8', 'ISO-8859-1', None])
+def test_expired_blob_landing_detected_whatever_the_declared_charset(detector, title, encoding):
+    # requests reports ISO-8859-1 for text/html served without a charset
+    body = b'<html><head><title>' + title + b' | Home</title></head><body>Welcome</body></html>'
+    assert detector.is_soft_404(BLOB_URL, BLOB_URL, body, encoding)
+
+
+def test_blob_page_mentioning_a_document_is_not_a_soft_404(detector):
+    body = '<html><head><title>Deutsche Börse</title></head><body>Download PDF</body></html>'
+    assert not detector.is_soft_404(BLOB_URL, BLOB_URL, body.encode('utf-8'), 'ISO-8859-1')
@@ -0,0 +1,207 @@
+"""Per-run request and bandwidth accounting with optional hard budgets."""
+
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+
+COUNTERS = ('requests', 'retries', 'bytes_in', 'refused')
+
+_checker: contextvars.ContextVar[str] = contextvars.ContextVar('checker', default='')
+
+
+@contextmanager
+def checker_scope(name: str) -> Iterator[None]:
+    """Charge requests of clients created inside the block to a checker.
+
+    RateLimitedClient reads the scope when it is constructed, so requests
+    made later from worker threads or tasks are still charged to the
+    checker that owns the client.
+
+    Args:
+        name: Checker name (e.g. "links")
+    """
+    token = _checker.set(name)
+    try:
+        yield
+    finally:
+        _checker.reset(token)
+
+
+def current_checker() -> str:
+    """Return the checker of the enclosing checker_scope() ("other" outside one)."""
+    return _checker.get() or 'other'
+
+
+def _new_counters() -> dict:
+    return dict.fromkeys(COUNTERS, 0)
+
+
+class RequestAccounting:
+    """Counts requests, retries and body bytes per domain and per checker.
+
+    Budgets are hard limits for the whole run: ``max_requests`` and
+    ``max_bytes`` across all domains, plus the same two limits per domain
+    under ``domains`` (matched on the host name or a subdomain, ignoring the
+    port, most specific first, and shared by every host that matches). Once
+    a budget is used up admit() refuses further requests it covers; bytes of
+    a response already being read still count, so byte budgets can be
+    overshot by one body.
+    """
+
+    def __init__(self):
+        """Initialize with no traffic and no budgets."""
+        self._lock = threading.Lock()
+        self._usage: dict[tuple[str, str], dict] = {}  # (checker, domain) -> counters
+        self._budget_usage: dict[str, dict] = {}       # budget domain -> counters
+        self._budget_keys: dict[str, Optional[str]] = {}
+        self.enabled = False
+        self.max_requests = 0
+        self.max_bytes = 0
+        self.domain_budgets: dict[str, dict] = {}
+
+    def configure(self, config: dict):
+        """Set budgets from the ``budgets`` config section (traffic so far is kept).
+
+        Args:
+            config: Dict with enabled, max_requests, max_bytes and domains
+                (domain -> {max_requests, max_bytes}); 0 means unlimited
+        """
+        with self._lock:
+            self.enabled = config.get('enabled', False)
+            self.max_requests = int(config.get('max_requests', 0) or 0)
+            self.max_bytes = int(config.get('max_bytes', 0) or 0)
+            self.domain_budgets = {
+                domain.lower(): {
+                    'max_requests': int(limits.get('max_requests', 0) or 0),
+                    'max_bytes': int(limits.get('max_bytes', 0) or 0),
+                }
+                for domain, limits in (config.get('domains') or {}).items()
+            }
+            self._budget_keys.clear()
+            self._budget_usage.clear()
+            for (_, domain), counters in self._usage.items():
+                key = self._budget_key_locked(domain)
+                if key is not None:
+                    budget_usage = self._budget_usage.setdefault(key, _new_counters())
+                    for name in COUNTERS:
+                        budget_usage[name] += counters[name]
+
+    def _budget_key_locked(self, domain: str) -> Optional[str]:
+        """Most specific budget domain covering a domain (lock held)."""
+        if domain not in self._budget_keys:
+            host = urlsplit(f"//{domain}").hostname or domain
+            best = None
+            for name in self.domain_budgets:
+                if (host == name or host.endswith('.' + name)) and (best is None or len(name) > len(best)):
+                    best = name
+            self._budget_keys[domain] = best
+        return self._budget_keys[domain]
+
+    def _add_locked(self, checker: str, domain: str, name: str, amount: int):
+        """Add to a counter of a checker/domain pair and its budget (lock held)."""
+        self._usage.setdefault((checker, domain), _new_counters())[name] += amount
+        key = self._budget_key_locked(domain)
+        if key is not None:
+            self._budget_usage.setdefault(key, _new_counters())[name] += amount
+
+    def _totals_locked(self) -> dict:
+        """Counters summed over all checkers and domains (lock held)."""
+        totals = _new_counters()
+        for counters in self._usage.values():
+            for name in COUNTERS:
+                totals[name] += counters[name]
+        return totals
+
+    def admit(self, checker: str, domain: str, retry: bool = False) -> Optional[str]:
+        """Count a request about to be sent, unless a budget is used up.
+
+        Checking and counting happen under one lock, so concurrent requests
+        cannot overshoot a request budget. A refused request is counted
+        under ``refused`` instead of ``requests``.
+
+        Args:
+            checker: Checker making the request
+            domain: Domain name
+            retry: The request repeats a failed or throttled attempt
+
+        Returns:
+            Error message naming the exhausted budget, or None if admitted
+        """
+        with self._lock:
+            reason = self._over_budget_locked(domain) if self.enabled else None
+            if reason is not None:
+                self._add_locked(checker, domain, 'refused', 1)
+                return reason
+            self._add_locked(checker, domain, 'requests', 1)
+            if retry:
+                self._add_locked(checker, domain, 'retries', 1)
+            return None
+
+    def _over_budget_locked(self, domain: str) -> Optional[str]:
+        """Describe the budget a request to a domain would exceed (lock held)."""
+        key = self._budget_key_locked(domain)
+        if key is not None:
+            limits = self.domain_budgets[key]
+            used = self._budget_usage.get(key, _new_counters())
+            if limits['max_requests'] and used['requests'] >= limits['max_requests']:
+                return f"Request budget for {key} exhausted ({limits['max_requests']} requests)"
+            if limits['max_bytes'] and used['bytes_in'] >= limits['max_bytes']:
+                return f"Byte budget for {key} exhausted ({limits['max_bytes']} bytes)"
+        if self.max_requests or self.max_bytes:
+            totals = self._totals_locked()
+            if self.max_requests and totals['requests'] >= self.max_requests:
+                return f"Run request budget exhausted ({self.max_requests} requests)"
+            if self.max_bytes and totals['bytes_in'] >= self.max_bytes:
+                return f"Run byte budget exhausted ({self.max_bytes} bytes)"
+        return None
+
+    def record_bytes(self, checker: str, domain: str, count: int):
+        """Count response body bytes received.
+
+        Args:
+            checker: Checker making the request
+            domain: Domain name
+            count: Bytes read
+        """
+        if count:
+            with self._lock:
+                self._add_locked(checker, domain, 'bytes_in', count)
+
+    def stats(self) -> dict:
+        """Return run totals, per-domain and per-checker counters and budget use.
+
+        Returns:
+            Dict with totals, domains (busiest first by requests), checkers
+            and budgets (limits and usage, empty when budgets are off)
+        """
+        with self._lock:
+            domains: dict[str, dict] = {}
+            checkers: dict[str, dict] = {}
+            for (checker, domain), counters in self._usage.items():
+                for target in (domains.setdefault(domain, _new_counters()),
+                               checkers.setdefault(checker, _new_counters())):
+                    for name in COUNTERS:
+                        target[name] += counters[name]
+            totals = self._totals_locked()
+            budgets = {}
+            if self.enabled:
+                budgets = {
+                    'max_requests': self.max_requests,
+                    'max_bytes': self.max_bytes,
+                    'domains': {
+                        key: {**limits, **self._budget_usage.get(key, _new_counters())}
+                        for key, limits in sorted(self.domain_budgets.items())
+                    },
+                }
+        return {
+            'totals': totals,
+            'domains': dict(sorted(domains.items(), key=lambda item: item[1]['requests'], reverse=True)),
+            'checkers': dict(sorted(checkers.items())),
+            'budgets': budgets,
+        }
+
+
+# Process-wide accounting shared by every client of a run
+ACCOUNTING = RequestAccounting()
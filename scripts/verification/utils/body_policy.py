@@ -0,0 +1,132 @@
+"""Content-type policy deciding how much of a response body a link check reads."""
+
+import threading
+from typing import Optional
+
+# Actions, from most to least reading
+FULL = 'full'        # read and hash the whole body (up to body_limits.max_bytes)
+PREFIX = 'prefix'    # read the soft-404 inspection prefix (body_limits.inspect_bytes)
+CAP = 'cap'          # read at most cap_bytes
+SKIP = 'skip'        # read nothing; status and headers are enough
+ACTIONS = (FULL, PREFIX, CAP, SKIP)
+
+
+class BodyPolicy:
+    """Maps a response's Content-Type to how much of its body to read.
+
+    Only applies to liveness checks (RateLimitedClient.probe): fetches that
+    need the content (fact checks, circulars, tracked PDF hashing) always
+    read the full body. Types are matched on the longest configured prefix
+    of the media type, so ``image/`` covers every image type. Bytes read
+    and bytes left unread (from Content-Length) are counted per media type.
+    """
+
+    def __init__(self, config: dict, inspect_bytes: int):
+        """Initialize policy from the body_policy config section.
+
+        Args:
+            config: Dict with enabled, default, cap_bytes and types keys
+            inspect_bytes: Bytes read by the prefix action
+
+        Raises:
+            ValueError: If an action is not one of ACTIONS
+        """
+        self.enabled = config.get('enabled', False)
+        self.default = config.get('default', CAP)
+        self.cap_bytes = int(config.get('cap_bytes', 65536))
+        self.inspect_bytes = inspect_bytes
+        self.types = {
+            media_type.lower(): action
+            for media_type, action in (config.get('types') or {}).items()
+        }
+        for action in [self.default, *self.types.values()]:
+            if action not in ACTIONS:
+                raise ValueError(f"Unknown body_policy action: {action}")
+
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+
+    @staticmethod
+    def media_type(content_type: str) -> str:
+        """Strip parameters from a Content-Type header value.
+
+        Args:
+            content_type: Header value, e.g. "text/html; charset=utf-8"
+
+        Returns:
+            Lowercased media type, or "unknown" if empty
+        """
+        return content_type.split(';')[0].strip().lower() or 'unknown'
+
+    def action_for(self, content_type: str) -> str:
+        """Return the action configured for a content type.
+
+        Args:
+            content_type: Content-Type header value
+
+        Returns:
+            One of ACTIONS (FULL when the policy is disabled)
+        """
+        if not self.enabled:
+            return FULL
+        media_type = self.media_type(content_type)
+        best = None
+        for prefix in self.types:
+            if media_type.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.types[best] if best is not None else self.default
+
+    def read_limit(self, action: str) -> Optional[int]:
+        """Bytes an action may read.
+
+        Args:
+            action: One of ACTIONS
+
+        Returns:
+            Byte limit, or None for no limit beyond max_bytes
+        """
+        if action == SKIP:
+            return 0
+        if action == PREFIX:
+            return self.inspect_bytes
+        if action == CAP:
+            return self.cap_bytes
+        return None
+
+    def record(self, content_type: str, bytes_read: int, declared: int, complete: bool):
+        """Count the bytes read for one response.
+
+        Args:
+            content_type: Content-Type header value
+            bytes_read: Body bytes read
+            declared: Content-Length header (0 if absent)
+            complete: Whether the whole body was read
+        """
+        media_type = self.media_type(content_type)
+        with self._lock:
+            stats = self._stats.setdefault(media_type, {
+                "action": self.action_for(content_type), "responses": 0, "bytes_read": 0,
+                "bytes_skipped": 0, "partial": 0,
+            })
+            stats["responses"] += 1
+            stats["bytes_read"] += bytes_read
+            if not complete:
+                stats["partial"] += 1
+                stats["bytes_skipped"] += max(0, declared - bytes_read)
+
+    def stats(self) -> dict:
+        """Return per-media-type byte counts.
+
+        Returns:
+            Dict with bytes_read and bytes_skipped totals and a per-type
+            breakdown (configured action, responses, bytes_read, bytes_skipped,
+            partial);
+            bytes_skipped only counts bodies with a Content-Length
+        """
+        with self._lock:
+            types = {media_type: dict(stats) for media_type, stats in sorted(self._stats.items())}
+        return {
+            "bytes_read": sum(s["bytes_read"] for s in types.values()),
+            "bytes_skipped": sum(s["bytes_skipped"] for s in types.values()),
+            "types": types,
+        }
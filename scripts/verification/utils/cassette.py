@@ -0,0 +1,335 @@
+"""Record/replay of HTTP traffic for offline, deterministic runs."""
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Iterator, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+logger = logging.getLogger(__name__)
+
+MODES = ('record', 'replay')
+
+
+def _request_key(method: str, url: str, headers: Optional[dict]) -> str:
+    """Build the lookup key for a request.
+
+    Only the method, URL and Range header identify a request; other headers
+    (User-Agent, Accept-Encoding) do not change between runs.
+
+    Args:
+        method: HTTP method
+        url: Requested URL
+        headers: Extra request headers
+
+    Returns:
+        Key string, e.g. "GET https://example.com/a.pdf bytes=0-65535"
+    """
+    key = f"{method} {url}"
+    byte_range = (headers or {}).get('Range')
+    if byte_range:
+        key += f" {byte_range}"
+    return key
+
+
+class RecordingResponse:
+    """Wraps a live streamed response and records it when closed.
+
+    The body is captured exactly as far as the client reads it, so a replay
+    serves the same bytes to the same code path.
+    """
+
+    def __init__(self, cassette: "Cassette", key: str, response):
+        """Wrap a response.
+
+        Args:
+            cassette: Cassette to write the interaction to
+            key: Request key
+            response: Open streamed response (requests.Response or Http2Response)
+        """
+        self._cassette = cassette
+        self._key = key
+        self._response = response
+        self._body = bytearray()
+        self._complete = False
+        self._recorded = False
+        self.status_code = response.status_code
+        self.url = response.url
+        self.headers = response.headers
+        self.encoding = response.encoding
+
+    def __getattr__(self, name: str):
+        return getattr(self._response, name)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield body chunks from the live response, keeping a copy.
+
+        Args:
+            chunk_size: Chunk size in bytes
+
+        Yields:
+            Body chunks
+        """
+        for chunk in self._response.iter_content(chunk_size=chunk_size):
+            self._body += chunk
+            yield chunk
+        self._complete = True
+
+    def close(self):
+        """Record the interaction (once) and close the live response."""
+        if not self._recorded:
+            self._recorded = True
+            self._cassette._write(self._key, {
+                "status": self.status_code,
+                "url": self.url,
+                "headers": dict(self.headers),
+                "encoding": self.encoding,
+                "body": self._cassette._store_body(bytes(self._body)) if self._body else None,
+                "complete": self._complete,
+            })
+        self._response.close()
+
+    def __enter__(self) -> "RecordingResponse":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ReplayResponse:
+    """Recorded response exposing the requests.Response subset we use."""
+
+    def __init__(self, cassette: "Cassette", entry: dict):
+        """Build a response from a recorded interaction.
+
+        Args:
+            cassette: Cassette holding the body
+            entry: Recorded interaction
+        """
+        self._cassette = cassette
+        self._body_hash = entry.get("body")
+        self.status_code = entry["status"]
+        self.url = entry["url"]
+        self.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        self.encoding = entry.get("encoding")
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield the recorded body in chunks.
+
+        Args:
+            chunk_size: Chunk size in bytes
+
+        Yields:
+            Body chunks
+        """
+        if not self._body_hash:
+            return
+        body = self._cassette._load_body(self._body_hash)
+        for offset in range(0, len(body), chunk_size):
+            yield body[offset:offset + chunk_size]
+
+    def close(self):
+        """Nothing to release."""
+
+    def __enter__(self) -> "ReplayResponse":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Cassette:
+    """On-disk log of HTTP interactions, written in record mode and served in replay.
+
+    Layout of the cassette directory:
+
+        interactions.jsonl   one line per request: key, status, final URL,
+                             headers, encoding and the body hash (or the
+                             transport error that was raised)
+        bodies/<sha256>.gz   response bodies, gzip-compressed, stored once
+
+    When the same request was made several times while recording (retries,
+    429 then 200), replay returns the recorded responses in order and keeps
+    repeating the last one. Requests that were never recorded fail with a
+    ConnectionError so the miss shows up in the results.
+    """
+
+    _open: dict[tuple[Path, str], "Cassette"] = {}
+    _open_lock = threading.Lock()
+
+    def __init__(self, directory: Path, mode: str):
+        """Open a cassette directory.
+
+        Args:
+            directory: Cassette directory (created in record mode)
+            mode: 'record' or 'replay'
+
+        Raises:
+            ValueError: If the mode is unknown
+            FileNotFoundError: If replaying a directory without interactions.jsonl
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.interactions_file = self.directory / 'interactions.jsonl'
+        self.bodies_dir = self.directory / 'bodies'
+        self._lock = threading.Lock()
+        self._entries: dict[str, list[dict]] = {}
+        self._positions: dict[str, int] = {}
+        self._body_cache: dict[str, bytes] = {}
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+        if mode == 'record':
+            self.bodies_dir.mkdir(parents=True, exist_ok=True)
+            self.interactions_file.write_text('', encoding='utf-8')
+        else:
+            with open(self.interactions_file, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries.setdefault(entry["key"], []).append(entry)
+            logger.info(
+                f"Replaying {sum(len(e) for e in self._entries.values())} recorded "
+                f"responses from {self.directory}"
+            )
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["Cassette"]:
+        """Return the process-wide cassette selected by ``config['cassette']``.
+
+        Every client built from the same configuration shares one cassette,
+        so a run's checkers record into (and replay from) the same log.
+
+        Args:
+            config: Configuration dictionary with an optional cassette section
+
+        Returns:
+            Cassette, or None when recording and replay are off
+        """
+        cassette_config = config.get('cassette') or {}
+        mode = cassette_config.get('mode')
+        if not mode:
+            return None
+        key = (Path(cassette_config['dir']).resolve(), mode)
+        with cls._open_lock:
+            if key not in cls._open:
+                cls._open[key] = cls(key[0], mode)
+            return cls._open[key]
+
+    @property
+    def replaying(self) -> bool:
+        """True in replay mode."""
+        return self.mode == 'replay'
+
+    def _write(self, key: str, entry: dict):
+        """Append one interaction to interactions.jsonl."""
+        line = json.dumps({"key": key, **entry}, ensure_ascii=False)
+        with self._lock:
+            with open(self.interactions_file, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self.recorded += 1
+
+    def _store_body(self, body: bytes) -> str:
+        """Write a body under its hash (once) and return the hash."""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.bodies_dir / f"{digest}.gz"
+        if not path.exists():
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(gzip.compress(body))
+            tmp.replace(path)
+        return digest
+
+    def _load_body(self, digest: str) -> bytes:
+        """Read a stored body by hash."""
+        with self._lock:
+            body = self._body_cache.get(digest)
+        if body is None:
+            body = gzip.decompress((self.bodies_dir / f"{digest}.gz").read_bytes())
+            with self._lock:
+                self._body_cache[digest] = body
+        return body
+
+    def record(self, method: str, url: str, headers: Optional[dict], response) -> RecordingResponse:
+        """Wrap a live response so it is recorded once the client closes it.
+
+        Args:
+            method: HTTP method
+            url: Requested URL
+            headers: Extra request headers
+            response: Open streamed response
+
+        Returns:
+            Response wrapper to hand to the client
+        """
+        return RecordingResponse(self, _request_key(method, url, headers), response)
+
+    def record_error(self, method: str, url: str, headers: Optional[dict], error: Exception):
+        """Record a transport error raised instead of a response.
+
+        Args:
+            method: HTTP method
+            url: Requested URL
+            headers: Extra request headers
+            error: requests exception that was raised
+        """
+        self._write(_request_key(method, url, headers), {
+            "error": {"type": type(error).__name__, "message": str(error)},
+        })
+
+    def replay(self, method: str, url: str, headers: Optional[dict] = None) -> ReplayResponse:
+        """Serve the next recorded response for a request.
+
+        Args:
+            method: HTTP method
+            url: Requested URL
+            headers: Extra request headers
+
+        Returns:
+            Recorded response
+
+        Raises:
+            requests.exceptions.RequestException: The recorded transport
+                error, or ConnectionError if the request was never recorded
+        """
+        key = _request_key(method, url, headers)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                raise requests.exceptions.ConnectionError(f"No recorded response for {key}")
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            entry = entries[min(position, len(entries) - 1)]
+            self.replayed += 1
+
+        error = entry.get("error")
+        if error:
+            error_cls = getattr(requests.exceptions, error["type"], requests.exceptions.RequestException)
+            if not (isinstance(error_cls, type) and issubclass(error_cls, requests.exceptions.RequestException)):
+                error_cls = requests.exceptions.RequestException
+            raise error_cls(error["message"])
+        return ReplayResponse(self, entry)
+
+    def stats(self) -> dict:
+        """Return record/replay counters.
+
+        Returns:
+            Dict with mode, dir, recorded, replayed and misses
+        """
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "dir": str(self.directory),
+                "recorded": self.recorded,
+                "replayed": self.replayed,
+                "misses": self.misses,
+            }
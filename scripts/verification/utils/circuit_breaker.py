@@ -0,0 +1,175 @@
+"""Per-domain circuit breaker for connection failures."""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """Stops sending requests to a domain that keeps failing to connect.
+
+    Each domain starts closed. After ``failure_threshold`` consecutive
+    connection failures (timeouts, refused connections, DNS errors - not
+    HTTP error statuses) its circuit opens and allow() refuses further
+    requests, so the remaining URLs on a dead host fail immediately instead
+    of each going through every retry and backoff sleep. After
+    ``reset_after`` seconds, or when half_open() is called, one trial
+    request is let through: success closes the circuit, failure reopens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 4, reset_after: float = 300):
+        """Initialize breaker with all circuits closed.
+
+        Args:
+            failure_threshold: Consecutive connection failures that open a
+                               circuit (0 never opens, only counts time lost)
+            reset_after: Seconds before an open circuit allows a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self._lock = threading.Lock()
+        self._domains: dict[str, dict] = {}
+
+    def _state_locked(self, domain: str) -> dict:
+        """Per-domain state; caller must hold the lock."""
+        return self._domains.setdefault(domain, {
+            "state": self.CLOSED,
+            "consecutive_failures": 0,
+            "opened_at": 0.0,
+            "trial_in_flight": False,
+            "times_opened": 0,
+            "short_circuits": 0,
+            "time_lost": 0.0,
+        })
+
+    def allow(self, domain: str) -> bool:
+        """Check whether a request to a domain may be sent.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            False if the circuit is open (the request is short-circuited)
+        """
+        with self._lock:
+            state = self._state_locked(domain)
+            if state["state"] == self.OPEN and time.monotonic() - state["opened_at"] >= self.reset_after:
+                state["state"] = self.HALF_OPEN
+
+            if state["state"] == self.CLOSED:
+                return True
+            if state["state"] == self.HALF_OPEN and not state["trial_in_flight"]:
+                state["trial_in_flight"] = True
+                return True
+
+            state["short_circuits"] += 1
+            return False
+
+    def record_success(self, domain: str):
+        """Record that a request to a domain got a response (any status).
+
+        Args:
+            domain: Domain name
+        """
+        with self._lock:
+            state = self._state_locked(domain)
+            state["state"] = self.CLOSED
+            state["consecutive_failures"] = 0
+            state["trial_in_flight"] = False
+
+    def record_inconclusive(self, domain: str):
+        """Record a request that failed for reasons specific to its URL.
+
+        Malformed URLs, redirect loops, certificate problems or a body cut
+        off mid-transfer say nothing about whether the host is reachable, so
+        the failure count is left alone; only a pending half-open trial is
+        released so the next request can serve as the trial instead.
+
+        Args:
+            domain: Domain name
+        """
+        with self._lock:
+            self._state_locked(domain)["trial_in_flight"] = False
+
+    def record_failure(self, domain: str, seconds: float = 0.0):
+        """Record a connection failure to a domain.
+
+        Args:
+            domain: Domain name
+            seconds: Time the failed attempt took
+        """
+        with self._lock:
+            state = self._state_locked(domain)
+            state["consecutive_failures"] += 1
+            state["time_lost"] += seconds
+            if state["state"] == self.HALF_OPEN or (
+                    self.failure_threshold
+                    and state["consecutive_failures"] >= self.failure_threshold):
+                if state["state"] != self.OPEN:
+                    state["times_opened"] += 1
+                state["state"] = self.OPEN
+                state["opened_at"] = time.monotonic()
+                state["trial_in_flight"] = False
+
+    def add_time_lost(self, domain: str, seconds: float):
+        """Charge extra time (e.g. a backoff sleep) to a failing domain.
+
+        Args:
+            domain: Domain name
+            seconds: Time spent
+        """
+        with self._lock:
+            self._state_locked(domain)["time_lost"] += seconds
+
+    def is_open(self, domain: str) -> bool:
+        """Check whether a domain's circuit is currently open.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            True if requests to the domain are being short-circuited
+        """
+        with self._lock:
+            return self._domains.get(domain, {}).get("state") == self.OPEN
+
+    def half_open(self, domain: str):
+        """Let the next request to an open domain through as a trial.
+
+        Args:
+            domain: Domain name
+        """
+        with self._lock:
+            state = self._state_locked(domain)
+            if state["state"] == self.OPEN:
+                state["state"] = self.HALF_OPEN
+                state["trial_in_flight"] = False
+
+    def stats(self) -> dict:
+        """Return per-domain breaker counters for domains that ever failed.
+
+        Returns:
+            Dict with domains_opened, short_circuits, time_lost_s and a
+            per-domain breakdown (state, times_opened, short_circuits,
+            time_lost_s)
+        """
+        with self._lock:
+            domains = {
+                domain: {
+                    "state": state["state"],
+                    "times_opened": state["times_opened"],
+                    "short_circuits": state["short_circuits"],
+                    "time_lost_s": round(state["time_lost"], 2),
+                }
+                for domain, state in sorted(self._domains.items())
+                if state["times_opened"] or state["time_lost"]
+            }
+        return {
+            "domains_opened": sum(1 for d in domains.values() if d["times_opened"]),
+            "short_circuits": sum(d["short_circuits"] for d in domains.values()),
+            "time_lost_s": round(sum(d["time_lost_s"] for d in domains.values()), 2),
+            "domains": domains,
+        }
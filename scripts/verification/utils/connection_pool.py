@@ -0,0 +1,284 @@
+"""Per-domain connection pool sizing, pre-warming and utilisation stats."""
+
+import logging
+import ssl
+import threading
+import time
+from typing import Optional
+
+import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.wait import wait_for_read
+
+from utils.dns_cache import CachedHTTPConnectionPool, CachedHTTPSConnectionPool, DnsCachingAdapter
+
+
+logger = logging.getLogger(__name__)
+
+# Shortest wait for post-handshake TLS session tickets (seconds)
+TICKET_WAIT_MIN = 0.1
+
+
+class PoolUsage:
+    """Utilisation counters of one host's connection pool."""
+
+    def __init__(self, maxsize: int):
+        """Initialize counters.
+
+        Args:
+            maxsize: Connections the pool keeps
+        """
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.checkouts = 0
+        self.opened = 0
+        self.reused = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.discarded = 0
+        self.prewarmed = 0
+
+    def checkout(self, connected: bool):
+        """Count a connection handed to a request.
+
+        Args:
+            connected: The connection already had a live socket
+        """
+        with self._lock:
+            self.checkouts += 1
+            if connected:
+                self.reused += 1
+            else:
+                self.opened += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def checkin(self, discarded: bool):
+        """Count a connection returned to the pool.
+
+        Args:
+            discarded: The pool was full and the connection was closed
+        """
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+            if discarded:
+                self.discarded += 1
+
+    def add_prewarmed(self, count: int):
+        """Count connections opened ahead of use.
+
+        Args:
+            count: Connections opened
+        """
+        with self._lock:
+            self.prewarmed += count
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "maxsize": self.maxsize,
+                "checkouts": self.checkouts,
+                "opened": self.opened,
+                "reused": self.reused,
+                "peak_in_use": self.peak_in_use,
+                "discarded": self.discarded,
+                "prewarmed": self.prewarmed,
+            }
+
+
+def _drain_session_tickets(conn, wait: float):
+    """Consume TLS 1.3 session tickets sent after the handshake.
+
+    Servers send them shortly after the handshake completes. Until they are
+    read the socket looks readable, and urllib3 discards idle connections
+    with unread data as dropped, which would throw a pre-warmed connection
+    away on first use.
+
+    Args:
+        conn: Freshly connected urllib3 connection
+        wait: Seconds to wait for the tickets to arrive
+    """
+    sock = conn.sock
+    if not isinstance(sock, ssl.SSLSocket):
+        return
+    previous = sock.gettimeout()
+    sock.setblocking(False)
+    try:
+        # Tickets may come in several records; stop once the socket is quiet
+        while wait_for_read(sock, timeout=wait):
+            try:
+                sock.recv(1)
+            except ssl.SSLWantReadError:
+                continue  # only handshake messages were waiting
+            conn.close()  # closed by the server, or unsolicited data
+            return
+    except OSError:
+        conn.close()
+    finally:
+        if conn.sock is not None:
+            sock.settimeout(previous)
+
+
+class _TrackedPoolMixin:
+    """Connection pool that reports checkouts and returns to a PoolUsage."""
+
+    usage: Optional[PoolUsage] = None
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        if self.usage is not None:
+            self.usage.checkout(conn.is_connected)
+        return conn
+
+    def _put_conn(self, conn):
+        # Approximate under concurrency, exact for the usual single put
+        discarded = self.pool is not None and self.pool.full()
+        super()._put_conn(conn)
+        if self.usage is not None:
+            self.usage.checkin(discarded)
+
+    def prewarm(self, connections: int, timeout: float) -> int:
+        """Open connections and leave them idle in the pool (not counted as use).
+
+        Args:
+            connections: Connections to open (capped at the pool size)
+            timeout: Connect timeout in seconds
+
+        Returns:
+            Number of connections opened
+        """
+        conns = []
+        opened = 0
+        try:
+            for _ in range(min(connections, self.pool.maxsize)):
+                conn = super()._get_conn()
+                conns.append(conn)
+                if not conn.is_connected:
+                    conn.timeout = timeout
+                    start = time.monotonic()
+                    conn.connect()
+                    # Tickets follow the handshake by about one round trip
+                    _drain_session_tickets(conn, max(time.monotonic() - start, TICKET_WAIT_MIN))
+                    opened += conn.sock is not None
+        except (OSError, Urllib3HTTPError) as e:
+            logger.debug(f"Pre-warming {self.host} failed: {e}")
+        finally:
+            for conn in conns:
+                super()._put_conn(conn)
+
+        if self.usage is not None:
+            self.usage.add_prewarmed(opened)
+        return opened
+
+
+class TrackedHTTPConnectionPool(_TrackedPoolMixin, CachedHTTPConnectionPool):
+    """HTTP pool with cached name resolution and utilisation counters."""
+
+
+class TrackedHTTPSConnectionPool(_TrackedPoolMixin, CachedHTTPSConnectionPool):
+    """HTTPS pool with cached name resolution and utilisation counters."""
+
+
+class SizedPoolAdapter(DnsCachingAdapter):
+    """Transport adapter with per-domain pool sizes and connection pre-warming.
+
+    Pools for hosts listed in ``pool_sizes`` (matched on the domain or a
+    subdomain, most specific first) keep that many connections; every other
+    host uses ``pool_maxsize``. Usage counters survive pool eviction, so
+    stats() covers every host contacted.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_sizes: Optional[dict[str, int]] = None
+    ):
+        """Initialize adapter.
+
+        Args:
+            pool_connections: Number of host pools kept open
+            pool_maxsize: Connections kept per host by default
+            pool_sizes: Per-domain overrides of pool_maxsize
+        """
+        self.pool_sizes = {domain.lower(): size for domain, size in (pool_sizes or {}).items()}
+        self._usage: dict[str, PoolUsage] = {}
+        self._usage_lock = threading.Lock()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def _size_for(self, host: str, default: int) -> int:
+        """Pool size for a host.
+
+        Args:
+            host: Host name
+            default: Size when no override matches
+
+        Returns:
+            Connections to keep for the host
+        """
+        host = host.lower()
+        best = None
+        for name in self.pool_sizes:
+            if (host == name or host.endswith('.' + name)) and (best is None or len(name) > len(best)):
+                best = name
+        return self.pool_sizes[best] if best else default
+
+    def _pool_factory(self, pool_cls):
+        """Wrap a pool class so each new pool gets its host's size and counters."""
+        def build(host, port=None, **kwargs):
+            maxsize = self._size_for(host, kwargs.get('maxsize', self._pool_maxsize))
+            kwargs['maxsize'] = maxsize
+            pool = pool_cls(host, port, **kwargs)
+            key = f"{host}:{port}" if port else host
+            with self._usage_lock:
+                usage = self._usage.get(key)
+                if usage is None:
+                    usage = self._usage[key] = PoolUsage(maxsize)
+            pool.usage = usage
+            return pool
+        return build
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': self._pool_factory(TrackedHTTPConnectionPool),
+            'https': self._pool_factory(TrackedHTTPSConnectionPool),
+        }
+
+    def prewarm(self, session: requests.Session, url: str, connections: int, timeout: float) -> int:
+        """Open (and TLS-handshake) connections to a URL's host ahead of use.
+
+        The pool is looked up exactly as requests will look it up for the
+        URL, so later requests pick the warm connections up.
+
+        Args:
+            session: Session the adapter is mounted on (for TLS settings)
+            url: Any URL on the host
+            connections: Connections to open (capped at the pool size)
+            timeout: Connect timeout in seconds
+
+        Returns:
+            Number of connections opened
+        """
+        request = requests.Request('GET', url).prepare()
+        settings = session.merge_environment_settings(url, {}, None, None, None)
+        if hasattr(self, 'get_connection_with_tls_context'):
+            pool = self.get_connection_with_tls_context(
+                request, settings['verify'], settings['proxies'], settings['cert']
+            )
+        else:
+            # requests < 2.32.2 applies TLS settings per request, not per pool
+            pool = self.get_connection(request.url, settings['proxies'])
+        if not isinstance(pool, _TrackedPoolMixin):
+            return 0  # proxied
+        return pool.prewarm(connections, timeout)
+
+    def stats(self) -> dict:
+        """Return per-host pool utilisation.
+
+        Returns:
+            Dict mapping host (with port) to maxsize, checkouts, opened,
+            reused, peak_in_use, discarded and prewarmed counters
+        """
+        with self._usage_lock:
+            return {key: usage.to_dict() for key, usage in sorted(self._usage.items())}
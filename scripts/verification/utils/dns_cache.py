@@ -0,0 +1,210 @@
+"""Process-wide DNS resolution cache for the requests transport."""
+
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from utils.timing import add_phase
+
+# getaddrinfo errors that mean the name does not exist (NXDOMAIN / no records)
+NEGATIVE_ERRNOS = {
+    code for code in (getattr(socket, 'EAI_NONAME', None), getattr(socket, 'EAI_NODATA', None))
+    if code is not None
+}
+
+
+class DnsCache:
+    """Caches getaddrinfo results per host for a fixed TTL.
+
+    Names that do not resolve are cached too (negative caching), so every
+    link to a dead host after the first fails immediately with the original
+    resolver error instead of paying another lookup. Transient failures such
+    as EAI_AGAIN are never cached. Resolution time is recorded per host.
+    """
+
+    def __init__(self, ttl: float = 300, negative_ttl: float = 300):
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds a successful resolution is reused (0 disables caching)
+            negative_ttl: Seconds a "name not found" error is reused
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, tuple[float, object]] = {}  # key -> (expires, addresses | error)
+        self._domains: dict[str, dict] = {}
+
+    def configure(self, ttl: float, negative_ttl: float):
+        """Update TTLs (entries already cached keep their expiry).
+
+        Args:
+            ttl: Seconds a successful resolution is reused
+            negative_ttl: Seconds a "name not found" error is reused
+        """
+        with self._lock:
+            self.ttl = ttl
+            self.negative_ttl = negative_ttl
+
+    def _domain_stats(self, host: str) -> dict:
+        """Per-host counters; caller must hold the lock."""
+        return self._domains.setdefault(host, {
+            "lookups": 0, "hits": 0, "negative_hits": 0,
+            "resolutions": 0, "failures": 0, "resolve_ms": 0.0,
+        })
+
+    def resolve(self, host: str, port: int) -> list[str]:
+        """Resolve a host to its addresses, using the cache when fresh.
+
+        Args:
+            host: Host name (or literal IP)
+            port: Port to resolve for
+
+        Returns:
+            Unique addresses in resolver order
+
+        Raises:
+            socket.gaierror: If the name cannot be resolved (possibly cached)
+        """
+        family = allowed_gai_family()
+        key = (host, port, family)
+        now = time.monotonic()
+
+        with self._lock:
+            stats = self._domain_stats(host)
+            stats["lookups"] += 1
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > now:
+                stats["hits"] += 1
+                if isinstance(cached[1], socket.gaierror):
+                    stats["negative_hits"] += 1
+                    error = cached[1]
+                    raise socket.gaierror(error.errno, error.strerror)
+                return list(cached[1])
+
+        start = time.perf_counter_ns()
+        try:
+            infos = socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            elapsed_ns = time.perf_counter_ns() - start
+            add_phase('dns', elapsed_ns)
+            elapsed_ms = elapsed_ns / 1e6
+            with self._lock:
+                stats["resolutions"] += 1
+                stats["failures"] += 1
+                stats["resolve_ms"] += elapsed_ms
+                if e.errno in NEGATIVE_ERRNOS and self.negative_ttl > 0:
+                    self._entries[key] = (time.monotonic() + self.negative_ttl, e)
+            raise
+        elapsed_ns = time.perf_counter_ns() - start
+        add_phase('dns', elapsed_ns)
+        elapsed_ms = elapsed_ns / 1e6
+
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            stats["resolutions"] += 1
+            stats["resolve_ms"] += elapsed_ms
+            if self.ttl > 0:
+                self._entries[key] = (time.monotonic() + self.ttl, tuple(addresses))
+        return addresses
+
+    def stats(self) -> dict:
+        """Return cache counters, overall and per host.
+
+        Returns:
+            Dict with lookups, hits, negative_hits, resolutions, failures,
+            resolve_ms and a per-host "domains" breakdown
+        """
+        with self._lock:
+            domains = {
+                host: dict(counters, resolve_ms=round(counters["resolve_ms"], 2))
+                for host, counters in self._domains.items()
+            }
+        totals = {
+            name: sum(d[name] for d in domains.values())
+            for name in ("lookups", "hits", "negative_hits", "resolutions", "failures")
+        }
+        totals["resolve_ms"] = round(sum(d["resolve_ms"] for d in domains.values()), 2)
+        totals["domains"] = domains
+        return totals
+
+
+# Shared by every RateLimitedClient in the process
+DNS_CACHE = DnsCache()
+
+
+class _CachedResolutionMixin:
+    """urllib3 connection that resolves its host through DNS_CACHE.
+
+    Each cached address is tried in turn by pointing ``_dns_host`` at it for
+    the stock connect logic; TLS SNI and certificate checks keep using the
+    real host name. Resolution, TCP connect and TLS handshake times are
+    charged to the request being timed (utils.timing).
+    """
+
+    _new_conn_ns = 0
+
+    def connect(self):
+        start = time.perf_counter_ns()
+        self._new_conn_ns = 0
+        super().connect()
+        if isinstance(self, HTTPSConnection):
+            add_phase('tls', time.perf_counter_ns() - start - self._new_conn_ns)
+
+    def _new_conn(self):
+        start = time.perf_counter_ns()
+        host = self._dns_host
+        try:
+            addresses = DNS_CACHE.resolve(host.strip('[]'), self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+
+        connect_start = time.perf_counter_ns()
+        last_error = None
+        try:
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (ConnectTimeoutError, NewConnectionError) as e:
+                    last_error = e
+                finally:
+                    self._dns_host = host
+            raise last_error or NewConnectionError(self, f"No addresses found for {host}")
+        finally:
+            now = time.perf_counter_ns()
+            add_phase('connect', now - connect_start)
+            self._new_conn_ns = now - start
+
+
+class CachedHTTPConnection(_CachedResolutionMixin, HTTPConnection):
+    """HTTPConnection with cached name resolution."""
+
+
+class CachedHTTPSConnection(_CachedResolutionMixin, HTTPSConnection):
+    """HTTPSConnection with cached name resolution."""
+
+
+class CachedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = CachedHTTPConnection
+
+
+class CachedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = CachedHTTPSConnection
+
+
+class DnsCachingAdapter(HTTPAdapter):
+    """requests transport adapter whose connections use DNS_CACHE."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CachedHTTPConnectionPool,
+            'https': CachedHTTPSConnectionPool,
+        }
@@ -0,0 +1,99 @@
+"""Lines added or changed in markdown files since a git revision."""
+
+import logging
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, Set
+
+
+logger = logging.getLogger(__name__)
+
+# Unified diff hunk header "@@ -a,b +start,count @@": old count, new start and count
+HUNK_RE = re.compile(r'^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
+def _git(repo_root: Path, *args: str) -> str:
+    """Run a git command in the repository and return its output.
+
+    Args:
+        repo_root: Directory to run git in
+        *args: git arguments
+
+    Returns:
+        Standard output
+
+    Raises:
+        ValueError: If git is not installed or the command fails
+    """
+    try:
+        completed = subprocess.run(
+            ['git', '-c', 'core.quotePath=false', *args],
+            cwd=repo_root, capture_output=True, text=True, check=False
+        )
+    except OSError as e:
+        raise ValueError(f"Cannot run git: {e}") from e
+    if completed.returncode != 0:
+        raise ValueError(f"git {args[0]} failed: {completed.stderr.strip()}")
+    return completed.stdout
+
+
+def changed_lines(repo_root: Path, base_rev: str, pattern: str = '*.md') -> Dict[str, Set[int]]:
+    """Return the lines added or edited in markdown files since a revision.
+
+    The working tree is compared with the merge base of ``base_rev`` and
+    HEAD, so commits that landed on the base branch after the fork point are
+    not counted while uncommitted edits are. Untracked files count as
+    entirely new. Deleted lines have no counterpart and are not reported.
+
+    Args:
+        repo_root: Repository root (paths are relative to it)
+        base_rev: Base revision, e.g. "origin/main"
+        pattern: Pathspec of files to diff
+
+    Returns:
+        Dict mapping POSIX path (relative to repo_root) to changed line numbers
+
+    Raises:
+        ValueError: If repo_root is not in a git work tree or base_rev is unknown
+    """
+    merge_base = _git(repo_root, 'merge-base', base_rev, 'HEAD').strip()
+    diff = _git(
+        repo_root, 'diff', '--unified=0', '--no-color', '--no-ext-diff', '--relative',
+        merge_base, '--', pattern
+    )
+
+    changed: Dict[str, Set[int]] = {}
+    current = None
+    hunk_lines = 0  # Lines of the current hunk body still to skip
+    for line in diff.splitlines():
+        # Inside a hunk every line is content, even one reading "+++ x"
+        if hunk_lines:
+            if not line.startswith('\\'):  # "\ No newline at end of file"
+                hunk_lines -= 1
+            continue
+        if line.startswith('+++ '):
+            target = line[4:]
+            current = None if target == '/dev/null' else changed.setdefault(target[2:], set())
+            continue
+        match = HUNK_RE.match(line)
+        if match:
+            old_count = int(match.group(1)) if match.group(1) is not None else 1
+            start = int(match.group(2))
+            count = int(match.group(3)) if match.group(3) is not None else 1
+            hunk_lines = old_count + count
+            if current is not None:
+                current.update(range(start, start + count))
+
+    untracked = _git(repo_root, 'ls-files', '--others', '--exclude-standard', '--', pattern)
+    for path in untracked.splitlines():
+        with open(repo_root / path, encoding='utf-8', errors='replace') as f:
+            changed[path] = set(range(1, sum(1 for _ in f) + 1))
+
+    # Files whose only change was a deletion have no changed lines left
+    changed = {path: lines for path, lines in changed.items() if lines}
+    logger.info(
+        f"{len(changed)} markdown files changed since {base_rev} "
+        f"({merge_base[:12]}), {sum(len(lines) for lines in changed.values())} lines"
+    )
+    return changed
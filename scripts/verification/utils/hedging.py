@@ -0,0 +1,208 @@
+"""Hedged requests: a second copy of a slow request, first response wins."""
+
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+from utils.timing import capture_phases
+
+
+logger = logging.getLogger(__name__)
+
+
+class HedgeStats:
+    """Thread-safe per-domain counts of hedged requests."""
+
+    def __init__(self):
+        """Initialize with no requests."""
+        self._lock = threading.Lock()
+        self._domains: dict[str, dict] = {}
+
+    def record(self, domain: str, hedged: bool, hedge_won: bool):
+        """Count one request that was eligible for hedging.
+
+        Args:
+            domain: Domain name
+            hedged: A second request was sent
+            hedge_won: The second request answered first
+        """
+        with self._lock:
+            counters = self._domains.setdefault(domain, {"requests": 0, "hedged": 0, "hedge_wins": 0})
+            counters["requests"] += 1
+            counters["hedged"] += hedged
+            counters["hedge_wins"] += hedge_won
+
+    def stats(self) -> dict:
+        """Return hedge and win rates overall and per domain.
+
+        Returns:
+            Dict with requests (eligible), hedged, hedge_wins, hedge_rate
+            (hedged / requests), win_rate (hedge_wins / hedged) and the same
+            counters per domain
+        """
+        with self._lock:
+            domains = {domain: dict(counters) for domain, counters in sorted(self._domains.items())}
+        totals = {
+            name: sum(counters[name] for counters in domains.values())
+            for name in ("requests", "hedged", "hedge_wins")
+        }
+        return {
+            **totals,
+            "hedge_rate": round(totals["hedged"] / totals["requests"], 3) if totals["requests"] else 0.0,
+            "win_rate": round(totals["hedge_wins"] / totals["hedged"], 3) if totals["hedged"] else 0.0,
+            "domains": domains,
+        }
+
+
+class _Race:
+    """Whether the hedge of one request was sent, decided under a lock."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._over = False
+        self._hedge_sent = False
+
+    def start_hedge(self) -> bool:
+        """Claim the right to send the hedge (False once a copy has won)."""
+        with self._lock:
+            if not self._over:
+                self._hedge_sent = True
+            return self._hedge_sent
+
+    def finish(self) -> bool:
+        """End the race; returns whether the hedge was sent."""
+        with self._lock:
+            self._over = True
+            return self._hedge_sent
+
+
+class Hedger:
+    """Runs a request and, if it is still waiting after a delay, a copy of it.
+
+    Both copies run on a small thread pool; whichever produces a response
+    first is returned and the other is closed when it arrives. A request is
+    only hedged when two pool threads are free, otherwise it runs on the
+    caller's thread as usual, so the pool never queues work behind slow
+    hosts.
+    """
+
+    def __init__(self, max_in_flight: int = 8):
+        """Initialize the pool.
+
+        Args:
+            max_in_flight: Requests (originals and hedges) running at once
+        """
+        self.max_in_flight = max(2, max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix='hedge')
+        self._lock = threading.Lock()
+        self._free = self.max_in_flight
+        self.stats = HedgeStats()
+
+    def _take_slots(self, count: int) -> bool:
+        """Reserve pool threads, or return False if fewer are free."""
+        with self._lock:
+            if self._free < count:
+                return False
+            self._free -= count
+            return True
+
+    def _release_slot(self):
+        """Return one pool thread."""
+        with self._lock:
+            self._free += 1
+
+    def _run(
+        self,
+        send: Callable,
+        race: Optional[_Race] = None,
+        before: Optional[Callable[[], bool]] = None
+    ):
+        """Worker: send one copy, capturing its phase timings.
+
+        Args:
+            send: Callable sending the request
+            race: For the hedge, the race it joins (not sent once it is over)
+            before: For the hedge, called first; returning False calls it off
+
+        Returns:
+            (response, phases), or None if the copy was not sent
+        """
+        try:
+            if before is not None and not before():
+                return None
+            if race is not None and not race.start_hedge():
+                return None  # the original answered while waiting
+            with capture_phases() as phases:
+                response = send()
+            return response, phases
+        finally:
+            self._release_slot()
+
+    @staticmethod
+    def _close_late(future: Future):
+        """Close the losing copy's response once it arrives."""
+        if not future.cancelled() and future.exception() is None and future.result() is not None:
+            future.result()[0].close()
+
+    def send(
+        self,
+        domain: str,
+        send: Callable,
+        delay: float,
+        send_hedge: Callable,
+        before_hedge: Callable[[], bool]
+    ):
+        """Send a request, hedging it after ``delay`` seconds without headers.
+
+        Args:
+            domain: Domain name (for stats)
+            send: Callable sending the request and returning the open response
+            delay: Seconds to wait for the original before sending the copy
+            send_hedge: Callable sending the copy (may raise to refuse it)
+            before_hedge: Called on the pool thread before the copy is sent
+                (to wait for a rate-limit token); returning False cancels it.
+                The copy is not sent if the original answered meanwhile
+
+        Returns:
+            (response, phases) of the winning copy; phases are the connection
+            phase timings captured while it was sent
+
+        Raises:
+            requests.exceptions.RequestException: If every copy that was
+                sent failed (the original's error is raised)
+        """
+        if not self._take_slots(2):
+            with capture_phases() as phases:
+                response = send()
+            return response, phases
+
+        original = self._executor.submit(self._run, send)
+        done, _ = wait([original], timeout=delay)
+        if done:
+            self._release_slot()  # the hedge slot was never used
+            self.stats.record(domain, hedged=False, hedge_won=False)
+            return original.result()
+
+        race = _Race()
+        hedge = self._executor.submit(self._run, send_hedge, race, before_hedge)
+        pending = {original, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next(
+                (f for f in done if f.exception() is None and f.result() is not None), None
+            )
+            if winner is not None:
+                hedged = race.finish()
+                self.stats.record(domain, hedged=hedged, hedge_won=winner is hedge)
+                for other in pending | (done - {winner}):
+                    other.add_done_callback(self._close_late)
+                return winner.result()
+
+        # Nothing succeeded: report the original request's failure
+        self.stats.record(domain, hedged=race.finish(), hedge_won=False)
+        return original.result()
+
+    def close(self):
+        """Stop the pool without waiting for losing requests to finish."""
+        self._executor.shutdown(wait=False)
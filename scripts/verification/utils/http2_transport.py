@@ -0,0 +1,180 @@
+"""Optional HTTP/2 transport for RateLimitedClient (requires httpx[http2])."""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Iterator, Optional
+
+import requests
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+
+def _map_error(error: Exception) -> requests.exceptions.RequestException:
+    """Translate an httpx exception into the matching requests exception.
+
+    RateLimitedClient's retry and classification logic only knows the
+    requests exception hierarchy (and checkers look for "timeout" or "dns" in
+    the message), so errors keep their text but change type.
+
+    Args:
+        error: Exception raised by httpx
+
+    Returns:
+        Equivalent requests exception
+    """
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.Timeout(f"Request timed out: {error}")
+    if isinstance(error, httpx.ConnectError):
+        return requests.exceptions.ConnectionError(str(error))
+    if isinstance(error, httpx.TooManyRedirects):
+        return requests.exceptions.TooManyRedirects(str(error))
+    return requests.exceptions.RequestException(str(error))
+
+
+class Http2Response:
+    """Streaming httpx response exposing the requests.Response subset we use."""
+
+    def __init__(self, transport: "Http2Transport", response: "httpx.Response"):
+        """Wrap an httpx response opened with stream=True.
+
+        Args:
+            transport: Transport whose event loop owns the response
+            response: Open httpx response
+        """
+        self._transport = transport
+        self._response = response
+        self.status_code = response.status_code
+        self.url = str(response.url)
+        self.headers = response.headers
+        self.encoding = response.charset_encoding
+        self.http_version = response.http_version
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield the (decoded) body in chunks.
+
+        Args:
+            chunk_size: Chunk size in bytes
+
+        Yields:
+            Body chunks
+        """
+        chunks = self._response.aiter_bytes(chunk_size=chunk_size)
+        while True:
+            try:
+                yield self._transport._run(chunks.__anext__())
+            except StopAsyncIteration:
+                return
+
+    def close(self):
+        """Release the stream back to the connection."""
+        self._transport._run(self._response.aclose())
+
+    def __enter__(self) -> "Http2Response":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Http2Transport:
+    """Multiplexes requests to a host over one HTTP/2 connection.
+
+    httpx's synchronous HTTP/2 connection is not safe to share between
+    threads, so an AsyncClient runs on a private event loop thread and the
+    blocking request()/iter_content() calls made by worker threads are
+    submitted to it. Concurrent requests to the same host thus become
+    streams on one connection instead of separate HTTP/1.1 connections.
+    Servers that do not negotiate HTTP/2 (via ALPN) are transparently spoken
+    to over HTTP/1.1 by httpx.
+    """
+
+    def __init__(self, config: dict, headers: Optional[dict] = None):
+        """Start the event loop thread and the shared httpx client.
+
+        Args:
+            config: Configuration dictionary containing http2 and timeouts
+            headers: Default request headers (e.g. User-Agent)
+        """
+        http2_config = config.get('http2', {})
+        self.client = httpx.AsyncClient(
+            http1=not http2_config.get('prior_knowledge', False),
+            http2=True,
+            headers=headers,
+            timeout=config.get('timeouts', {}).get('request', 30),
+            limits=httpx.Limits(
+                max_connections=http2_config.get('max_connections', 20),
+                max_keepalive_connections=http2_config.get('max_connections', 20),
+            ),
+        )
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name='http2-loop', daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the transport's loop and wait for its result.
+
+        Args:
+            coro: Coroutine using the httpx client
+
+        Returns:
+            Coroutine result
+
+        Raises:
+            requests.exceptions.RequestException: On any httpx error
+        """
+        try:
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+        except httpx.HTTPError as e:
+            raise _map_error(e) from e
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: bool = True,
+        stream: bool = True
+    ) -> Http2Response:
+        """Send a request, mirroring requests.Session.request(stream=True).
+
+        Args:
+            method: HTTP method
+            url: URL to request
+            headers: Extra request headers
+            timeout: Timeout in seconds (client default if None)
+            allow_redirects: Follow redirects
+            stream: Accepted for signature compatibility; bodies always stream
+
+        Returns:
+            Response wrapper; the caller must close it
+
+        Raises:
+            requests.exceptions.RequestException: On any transport error
+        """
+        try:
+            request = self.client.build_request(
+                method, url, headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+            )
+        except httpx.HTTPError as e:
+            raise _map_error(e) from e
+        response = self._run(
+            self.client.send(request, stream=True, follow_redirects=allow_redirects)
+        )
+        return Http2Response(self, response)
+
+    def close(self):
+        """Close all pooled connections and stop the event loop thread."""
+        self._run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -1,40 +1,285 @@
 """HTTP client with rate limiting, retry logic, and soft 404 detection."""
 
+import email.utils
 import hashlib
+import json
+import logging
+import os
+import threading
+import re
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Hashable, Optional
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+
+from utils.accounting import ACCOUNTING, current_checker
+from utils.body_policy import FULL, BodyPolicy
+from utils.cassette import Cassette
+from utils.circuit_breaker import CircuitBreaker
+from utils.connection_pool import SizedPoolAdapter
+from utils.dns_cache import DNS_CACHE
+from utils.hedging import Hedger
+from utils.http2_transport import HAS_HTTPX, Http2Transport
+from utils.rate_limiter import TokenBucketRateLimiter
+from utils.response_cache import ResponseCache
+from utils.retry_queue import RetryLater
+from utils.single_flight import IN_FLIGHT
+from utils.soft404 import Soft404Detector
+from utils.timing import CONNECTION_PHASES, TimingStats, add_phase, capture_phases
+from utils.validator_cache import ValidatorCache
+
+
+logger = logging.getLogger(__name__)
+
+
+def _is_connection_failure(error: requests.exceptions.RequestException) -> bool:
+    """Whether a request error means the host itself could not be reached.
+
+    Timeouts and refused or reset connections count against a domain's
+    circuit breaker; errors tied to one URL (InvalidURL, MissingSchema,
+    TooManyRedirects, SSLError, ChunkedEncodingError, ...) do not.
+
+    Args:
+        error: Exception raised by a request
+
+    Returns:
+        True for connection failures and timeouts
+    """
+    if isinstance(error, requests.exceptions.SSLError):
+        return False
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
 
 
 class RateLimitedClient:
     """HTTP client with per-domain rate limiting and retry logic."""
 
-    def __init__(self, config: dict):
+    # Serializes head_probe.json updates from clients running at the same time
+    _head_file_lock = threading.Lock()
+
+    def __init__(self, config: dict, response_cache: Optional[ResponseCache] = None):
         """Initialize client with configuration.
 
         Args:
             config: Configuration dictionary containing rate_limits, retry, timeouts, etc.
+            response_cache: Run-scoped cache shared with other clients (optional)
         """
         self.config = config
+        self.response_cache = response_cache
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': config.get('user_agent', 'hft-exchange-knowledge-verifier/1.0')
         })
-        self._domain_timestamps: dict[str, float] = {}
+        # Record/replay of all traffic (run_all.py --record / --replay)
+        self.cassette = Cassette.from_config(config)
+        self.replaying = self.cassette is not None and self.cassette.replaying
+
+        # Per-domain token buckets (shared by every client in the process, and
+        # safely across threads and tasks)
+        self.rate_limiter = TokenBucketRateLimiter.shared(
+            config.get('rate_limits', {}),
+            config.get('approved_domains', [])
+        )
 
         # Extract config values
-        self.rate_limit = config.get('rate_limits', {}).get('default', 2)  # req/s
         self.max_retries = config.get('retry', {}).get('max_retries', 3)
         self.backoff_base = config.get('retry', {}).get('backoff_base', 1)
         self.backoff_multiplier = config.get('retry', {}).get('backoff_multiplier', 4)
+        self.max_retry_after = config.get('retry', {}).get('max_retry_after', 120)
+
+        # Fail fast on domains that keep refusing connections
+        breaker_config = config.get('circuit_breaker', {})
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=(
+                breaker_config.get('failure_threshold', 4)
+                if breaker_config.get('enabled', False) else 0
+            ),
+            reset_after=breaker_config.get('reset_after', 300)
+        )
+
+        # Requests, retries and bytes per domain, charged to the checker that
+        # created this client; run-wide budgets refuse requests once used up
+        ACCOUNTING.configure(config.get('budgets', {}))
+        self.accounting = ACCOUNTING
+        self.checker = current_checker()
+
+        # Retries handed back to the caller's scheduler (see deferring_retries):
+        # per job, the attempts used by deferred requests and the results of
+        # requests that already completed
+        self._defer_local = threading.local()
+        self._deferred_jobs: dict[Hashable, dict] = {}
+        self._pending_lock = threading.Lock()
         self.timeout = config.get('timeouts', {}).get('request', 30)
 
+        # Resolve each host once per TTL (process-wide, including failures);
+        # the adapter also times DNS, connect and TLS even with caching off
+        dns_ttl = config.get('timeouts', {}).get('dns_cache', 300)
+        DNS_CACHE.configure(
+            dns_ttl, config.get('timeouts', {}).get('dns_negative_cache', dns_ttl)
+        )
+        pool_config = config.get('connection_pool', {})
+        self.pool_adapter = SizedPoolAdapter(
+            pool_connections=pool_config.get('pool_connections', 10),
+            pool_maxsize=pool_config.get('pool_maxsize', 10),
+            pool_sizes=pool_config.get('domains')
+        )
+        self.session.mount('http://', self.pool_adapter)
+        self.session.mount('https://', self.pool_adapter)
+        self.prewarm_top = pool_config.get('prewarm_top', 0)
+        self._prewarm_executor: Optional[ThreadPoolExecutor] = None
+
+        # Per-domain latency histograms of every request phase
+        self.timing_stats = TimingStats()
+
+        # Hedged GETs: a second copy once a domain's usual wait for headers
+        # has passed (off with a cassette, which must see each request once)
+        hedge_config = config.get('hedging', {})
+        self.hedger = None
+        if hedge_config.get('enabled', False) and self.cassette is None:
+            self.hedger = Hedger(hedge_config.get('max_in_flight', 8))
+        self.hedge_percentile = hedge_config.get('percentile', 95)
+        self.hedge_min_samples = hedge_config.get('min_samples', 5)
+        self.hedge_min_delay = hedge_config.get('min_delay', 0.25)
+        self.hedge_approved = hedge_config.get('approved_domains', False)
+
+        # Streaming body limits
+        body_limits = config.get('body_limits', {})
+        self.chunk_size = body_limits.get('chunk_size', 65536)
+        self.inspect_bytes = body_limits.get('inspect_bytes', 262144)
+        self.max_body_bytes = body_limits.get('max_bytes', 104857600)
+
+        # How much of each content type liveness checks read
+        self.body_policy = BodyPolicy(config.get('body_policy', {}), self.inspect_bytes)
+
+        # PDF change detection from sampled byte ranges
+        fingerprint_config = config.get('pdf_fingerprint', {})
+        self.fingerprint_enabled = fingerprint_config.get('enabled', False)
+        self.fingerprint_head_bytes = fingerprint_config.get('head_bytes', 65536)
+        self.fingerprint_tail_bytes = fingerprint_config.get('tail_bytes', 65536)
+        self.fingerprint_xref_bytes = fingerprint_config.get('xref_bytes', 65536)
+
         # Soft 404 patterns
         self.soft_404_patterns = config.get('soft_404_patterns', [])
         self.db_specific_soft_404 = config.get('db_specific_soft_404', {})
+        self.soft_404_detector = Soft404Detector(
+            self.soft_404_patterns,
+            self.db_specific_soft_404,
+            config.get('approved_domains', [])
+        )
+
+        # Runtime state directory (relative paths resolve against scripts/verification/)
+        state_dir = Path(config.get('state_dir', '.state'))
+        if not state_dir.is_absolute():
+            state_dir = Path(__file__).resolve().parent.parent / state_dir
+        self.state_dir = state_dir
+
+        # Rates learned by the adaptive limiter in earlier runs
+        self.rate_state_file = self.state_dir / 'rate_limits.json'
+        if self.cassette is None:
+            self.rate_limiter.load_state(self.rate_state_file)
+
+        # HEAD-first probing of non-approved domains
+        probe_config = config.get('head_probe', {})
+        self.head_probe_enabled = probe_config.get('enabled', False)
+        self.head_fallback_statuses = set(probe_config.get('fallback_statuses', [403, 405, 501]))
+        self.head_remember_seconds = probe_config.get('remember_days', 30) * 86400
+        self.suspicious_redirect_keywords = [
+            k.lower() for k in probe_config.get(
+                'suspicious_redirect_keywords', ['login', 'signin', 'error', 'not-found', 'notfound', '404']
+            )
+        ]
+        self.head_probe_file = self.state_dir / 'head_probe.json'
+        self._head_lock = threading.Lock()
+        self._head_rejecting = self._load_head_rejecting() if self.cassette is None else {}
+
+        # Conditional-GET validator cache
+        cache_config = config.get('http_cache', {})
+        self.validator_cache: Optional[ValidatorCache] = None
+        if cache_config.get('enabled', False) and self.cassette is None:
+            self.validator_cache = ValidatorCache.shared(self.state_dir / cache_config.get('dir', 'http_cache'))
+        self.cache_body_types = cache_config.get('store_bodies', ['application/pdf'])
+
+        # Optional HTTP/2 transport for approved domains
+        self.http2: Optional[Http2Transport] = None
+        if config.get('http2', {}).get('enabled', False):
+            if HAS_HTTPX:
+                self.http2 = Http2Transport(
+                    config, {'User-Agent': self.session.headers['User-Agent']}
+                )
+            else:
+                logger.warning("httpx[http2] not installed - using HTTP/1.1 for all domains")
+
+    def save_state(self):
+        """Persist on-disk client state (validator cache index, learned rates).
+
+        Runs that record or replay a cassette neither load nor save state, so
+        a replay makes the same requests as the recording.
+        """
+        if self.cassette is not None:
+            return
+        if self.validator_cache is not None:
+            self.validator_cache.save()
+        self.rate_limiter.save_state(self.rate_state_file)
+        if self.head_probe_enabled:
+            self._save_head_rejecting()
+
+    def close(self):
+        """Close pooled connections of all transports."""
+        if self._prewarm_executor is not None:
+            self._prewarm_executor.shutdown(wait=True)
+        if self.hedger is not None:
+            self.hedger.close()
+        self.session.close()
+        if self.http2 is not None:
+            self.http2.close()
+
+    def prewarm(self, urls: list[str], connections: int = 1):
+        """Open connections to the hosts of some URLs in the background.
+
+        Each host gets up to ``connections`` connections (TCP and TLS
+        handshake done) left idle in its pool, so the first requests to it do
+        not pay the setup on the critical path. Hosts served over HTTP/2 and
+        replayed runs are skipped.
+
+        Args:
+            urls: One URL per host to warm
+            connections: Connections to open per host
+        """
+        urls = [url for url in urls if not self._uses_http2(self._get_domain(url))]
+        if self.replaying or not urls:
+            return
+        if self._prewarm_executor is None:
+            self._prewarm_executor = ThreadPoolExecutor(
+                max_workers=min(8, len(urls)), thread_name_prefix='prewarm'
+            )
+        for url in urls:
+            future = self._prewarm_executor.submit(
+                self.pool_adapter.prewarm, self.session, url, connections, self.timeout
+            )
+            future.add_done_callback(self._log_prewarm_failure)
+
+    @staticmethod
+    def _log_prewarm_failure(future):
+        """Log a pre-warm task that raised instead of opening connections.
+
+        Args:
+            future: Completed pre-warm future
+        """
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Connection pre-warming failed: {future.exception()!r}")
+
+    def pool_stats(self) -> dict:
+        """Return connection pool utilisation per host.
+
+        Returns:
+            Dict mapping host to maxsize, checkouts, opened, reused,
+            peak_in_use, discarded and prewarmed counters
+        """
+        return self.pool_adapter.stats()
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL.
@@ -48,86 +293,618 @@ class RateLimitedClient:
         parsed = urlparse(url)
         return parsed.netloc
 
-    def _wait_for_rate_limit(self, domain: str):
-        """Wait if needed to respect rate limit for domain.
+    def _is_approved_domain(self, domain: str) -> bool:
+        """Check whether a domain is one of the approved (DB) domains or a subdomain.
 
         Args:
-            domain: Domain name to check rate limit for
+            domain: Domain name, optionally with port
+
+        Returns:
+            True if the domain is approved
         """
-        if domain not in self._domain_timestamps:
-            self._domain_timestamps[domain] = 0
+        host = domain.split(':')[0].lower()
+        return any(
+            host == approved or host.endswith('.' + approved)
+            for approved in self.config.get('approved_domains', [])
+        )
 
-        min_interval = 1.0 / self.rate_limit  # seconds between requests
-        elapsed = time.time() - self._domain_timestamps[domain]
+    def _uses_http2(self, domain: str) -> bool:
+        """Check whether requests to a domain go over the HTTP/2 transport.
 
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
+        Args:
+            domain: Domain name, optionally with port
 
-        self._domain_timestamps[domain] = time.time()
+        Returns:
+            True for approved domains when the HTTP/2 transport is active
+        """
+        return self.http2 is not None and self._is_approved_domain(domain)
+
+    def _send(self, method: str, url: str, headers: Optional[dict] = None):
+        """Send one streamed request over the transport for its domain.
 
-    def _is_soft_404(self, url: str, final_url: str, response: requests.Response) -> bool:
+        Every network request goes through here. Approved domains use the
+        HTTP/2 transport when enabled; everything else (and every request if
+        httpx is not installed) uses the requests session. With a cassette,
+        responses and transport errors are recorded here, or served from it
+        without touching the network. With ``hedging`` enabled, a GET still
+        without headers after the domain's usual wait is sent a second time
+        (through the rate limiter and budgets) and the first response wins.
+
+        Args:
+            method: HTTP method
+            url: URL to request
+            headers: Extra request headers
+
+        Returns:
+            Open streamed response (requests.Response, Http2Response or a
+            cassette response)
+
+        Raises:
+            requests.exceptions.RequestException: On any transport error
+        """
+        if self.replaying:
+            return self.cassette.replay(method, url, headers)
+
+        domain = self._get_domain(url)
+        transport = self.http2 if self._uses_http2(domain) else self.session
+
+        def send():
+            return transport.request(
+                method=method,
+                url=url,
+                headers=headers,
+                timeout=self.timeout,
+                allow_redirects=True,
+                stream=True
+            )
+
+        def send_hedge():
+            over_budget = self.accounting.admit(self.checker, domain)
+            if over_budget:
+                raise requests.exceptions.RequestException(over_budget)
+            return send()
+
+        def before_hedge() -> bool:
+            self._wait_for_rate_limit(domain)
+            return True
+
+        delay = self._hedge_delay(domain) if method == "GET" else None
+        try:
+            if delay is None:
+                response = send()
+            else:
+                response, phases = self.hedger.send(domain, send, delay, send_hedge, before_hedge)
+                for name, elapsed_ns in phases.items():
+                    add_phase(name, elapsed_ns)
+        except requests.exceptions.RequestException as e:
+            if self.cassette is not None:
+                self.cassette.record_error(method, url, headers, e)
+            raise
+
+        if self.cassette is not None:
+            return self.cassette.record(method, url, headers, response)
+        return response
+
+    def _hedge_delay(self, domain: str) -> Optional[float]:
+        """Seconds to wait for headers before hedging a GET to a domain.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            The domain's ``hedging.percentile`` time to first byte (at least
+            ``min_delay``), or None if hedging is off for the domain or it
+            has fewer than ``min_samples`` responses so far
+        """
+        if self.hedger is None or (self._is_approved_domain(domain) and not self.hedge_approved):
+            return None
+        ttfb = self.timing_stats.percentile(
+            domain, 'ttfb', self.hedge_percentile, self.hedge_min_samples
+        )
+        return None if ttfb is None else max(ttfb, self.hedge_min_delay)
+
+    def hedge_stats(self) -> dict:
+        """Return hedge and win rates (empty when hedging is off).
+
+        Returns:
+            Dict as returned by HedgeStats.stats()
+        """
+        return self.hedger.stats.stats() if self.hedger is not None else {}
+
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (delay in seconds or an HTTP date).
+
+        Args:
+            value: Header value
+
+        Returns:
+            Seconds to wait, or None if absent or unparseable
+        """
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _record_response(
+        self,
+        domain: str,
+        response,
+        attempt: int,
+        can_retry: bool = True
+    ) -> Optional[float]:
+        """Report a response to the rate limiter.
+
+        Throttling responses (429/503) slow the domain down. If the request
+        will be retried, the domain is also paused for Retry-After seconds,
+        or for the usual backoff delay if the server did not say. A request
+        is given up instead when it has no attempts left or the pause would
+        exceed ``retry.max_retry_after``; the domain is then not paused, so
+        the remaining URLs on it do not wait for a retry that never comes.
+
+        Args:
+            domain: Domain name
+            response: Response received
+            attempt: Zero-based attempt number
+            can_retry: Whether the caller retries throttled requests
+
+        Returns:
+            Pause in seconds before retrying a throttled request, None if
+            the response was not throttled or will not be retried
+        """
+        pause = None
+        if (response.status_code in TokenBucketRateLimiter.THROTTLE_STATUSES
+                and can_retry and attempt < self.max_retries - 1):
+            pause = self._parse_retry_after(response.headers.get('Retry-After'))
+            if pause is None:
+                pause = self.backoff_base * (self.backoff_multiplier ** attempt)
+            if pause > self.max_retry_after:
+                pause = None
+        self.rate_limiter.record(domain, response.status_code, pause)
+        return pause
+
+    def _record_timing(
+        self,
+        domain: str,
+        phases: dict,
+        start_ns: int,
+        headers_ns: int,
+        result: Optional[dict] = None
+    ):
+        """Complete the phase timings of one exchange and add them to the histograms.
+
+        Args:
+            domain: Domain name
+            phases: Connection phases captured while sending (nanoseconds)
+            start_ns: perf_counter_ns() before the request was sent
+            headers_ns: perf_counter_ns() once the response headers arrived
+            result: Fetch result to attach the timings to as "timings_ms"
+        """
+        end_ns = time.perf_counter_ns()
+        phases['ttfb'] = headers_ns - start_ns - sum(phases.get(p, 0) for p in CONNECTION_PHASES)
+        phases['transfer'] = end_ns - headers_ns
+        phases['total'] = end_ns - start_ns
+        self.timing_stats.record(domain, phases)
+        if result is not None:
+            result["timings_ms"] = {name: round(ns / 1e6, 2) for name, ns in phases.items()}
+
+    def _wait_for_rate_limit(self, domain: str):
+        """Wait if needed to respect rate limit for domain (never when replaying).
+
+        Args:
+            domain: Domain name to check rate limit for
+        """
+        if not self.replaying:
+            self.rate_limiter.acquire(domain)
+
+    def _is_soft_404(
+        self,
+        url: str,
+        final_url: str,
+        body_prefix: bytes,
+        encoding: Optional[str] = None
+    ) -> bool:
         """Detect soft 404 errors (200 status but no real content).
 
+        Only the leading bytes of the body are inspected, decoded once (see
+        Soft404Detector), so the full body never has to be held in memory.
+
         Args:
             url: Original requested URL
             final_url: Final URL after redirects
-            response: Response object
+            body_prefix: Leading bytes of the response body
+            encoding: Response charset (falls back to UTF-8)
 
         Returns:
             True if this appears to be a soft 404
         """
-        # Check for generic soft 404 patterns in body
+        return self.soft_404_detector.is_soft_404(url, final_url, body_prefix, encoding)
+
+    def _read_body(
+        self,
+        response: requests.Response,
+        keep_limit: int,
+        read_limit: Optional[int] = None
+    ) -> dict:
+        """Stream a response body, hashing it chunk by chunk.
+
+        Only the first ``inspect_bytes`` are retained for soft-404 checks,
+        plus the full body if it fits within keep_limit. Reading stops once
+        ``max_bytes`` have been consumed (truncated) or once read_limit bytes
+        have been read (partial); in both cases the hash is left empty and
+        the length falls back to the Content-Length header.
+
+        Args:
+            response: Response opened with stream=True
+            keep_limit: Buffer the complete body if it is at most this many bytes
+            read_limit: Stop after this many bytes (None reads to the end)
+
+        Returns:
+            Dict with content_hash, content_length, prefix, content, truncated,
+            partial and bytes_read
+        """
+        hasher = hashlib.sha256()
+        prefix = bytearray()
+        chunks = [] if keep_limit > 0 else None
+        length = 0
+        truncated = False
+        partial = read_limit == 0
+        declared = int(response.headers.get('Content-Length', 0))
+
         try:
-            content = response.text.lower()
-            for pattern in self.soft_404_patterns:
-                if pattern.lower() in content:
-                    return True
-        except:
-            pass
-
-        # DB-specific checks
-        domain = self._get_domain(url)
-        if not any(approved in domain for approved in self.config.get('approved_domains', [])):
+            if not partial:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    length += len(chunk)
+                    if length > self.max_body_bytes:
+                        truncated = True
+                        break
+                    hasher.update(chunk)
+                    if len(prefix) < self.inspect_bytes:
+                        prefix += chunk[:self.inspect_bytes - len(prefix)]
+                    if chunks is not None:
+                        chunks.append(chunk)
+                        if length > keep_limit:
+                            chunks = None
+                    if read_limit is not None and length >= read_limit and length != declared:
+                        partial = True
+                        break
+        finally:
+            response.close()
+
+        if truncated or partial:
+            return {
+                "content_hash": "",
+                "content_length": max(declared, length),
+                "prefix": bytes(prefix),
+                "content": None,
+                "truncated": truncated,
+                "partial": partial,
+                "bytes_read": length,
+            }
+
+        return {
+            "content_hash": hasher.hexdigest(),
+            "content_length": length,
+            "prefix": bytes(prefix),
+            "content": b"".join(chunks) if chunks is not None else None,
+            "truncated": False,
+            "partial": False,
+            "bytes_read": length,
+        }
+
+    def _apply_cached_entry(self, url: str, result: dict, keep_body: bool) -> bool:
+        """Fill a result from the validator cache after a 304 Not Modified.
+
+        Args:
+            url: Requested URL
+            result: Result dict to update in place
+            keep_body: Whether the cached body should be attached
+
+        Returns:
+            True if a usable cache entry was found
+        """
+        entry = self.validator_cache.get(url)
+        if not entry:
             return False
 
-        # Check 1: Homepage redirect (deep path redirects to domain root)
-        if self.db_specific_soft_404.get('homepage_redirect', True):
-            original_path = urlparse(url).path
-            final_path = urlparse(final_url).path
-            if len(original_path) > 10 and final_path in ['/', '/en/', '/de/']:
-                return True
-
-        # Check 2: Expired blob landing page
-        if self.db_specific_soft_404.get('expired_blob_landing', True):
-            if '/resource/blob/' in url.lower():
-                try:
-                    soup = BeautifulSoup(response.content, 'lxml')
-                    # Look for generic landing page indicators
-                    if soup.find('title') and 'deutsche börse' in soup.find('title').text.lower():
-                        # If we're on a blob URL but title is generic, likely expired
-                        if not any(word in response.text.lower() for word in ['pdf', 'document', 'download']):
-                            return True
-                except:
-                    pass
-
-        # Check 3: Meta refresh redirect
-        if self.db_specific_soft_404.get('meta_refresh_redirect', True):
-            if '<meta http-equiv="refresh"' in response.text.lower():
-                return True
+        result["status_code"] = 200
+        result["not_modified"] = True
+        result["content_type"] = entry.get("content_type", "")
+        result["content_length"] = entry.get("content_length", 0)
+        result["content_hash"] = entry.get("content_hash", "")
+        result["is_soft_404"] = entry.get("is_soft_404", False)
 
-        return False
+        if keep_body:
+            content = self.validator_cache.load_body(result["content_hash"])
+            if content is None:
+                return False
+            result["content"] = content
+
+        return True
+
+    def _update_validator_cache(
+        self,
+        url: str,
+        method: str,
+        response: requests.Response,
+        result: dict,
+        content: Optional[bytes],
+        keep_body: bool
+    ):
+        """Record validators from a fresh response in the validator cache.
+
+        Args:
+            url: Requested URL
+            method: HTTP method used
+            response: Response object
+            result: Result dict already populated from the response
+            content: Full body for GET requests, None for HEAD
+            keep_body: Whether the caller asked for the body
+        """
+        etag = response.headers.get('ETag', '')
+        last_modified = response.headers.get('Last-Modified', '')
+
+        if response.status_code != 200:
+            self.validator_cache.invalidate(url)
+            return
+
+        if method == "HEAD":
+            # A HEAD cannot refresh the stored hash; drop it if validators moved
+            entry = self.validator_cache.get(url)
+            if entry and (entry.get("etag"), entry.get("last_modified")) != (etag, last_modified):
+                self.validator_cache.invalidate(url)
+            return
+
+        self.validator_cache.update(url, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": result["content_hash"],
+            "content_length": result["content_length"],
+            "content_type": result["content_type"],
+            "is_soft_404": result["is_soft_404"],
+        })
+
+        content_type = result["content_type"].split(';')[0].strip().lower()
+        if keep_body or content_type in self.cache_body_types:
+            self.validator_cache.store_body(result["content_hash"], content)
+
+    @contextmanager
+    def deferring_retries(self, job: Hashable = None):
+        """Raise RetryLater instead of waiting out retry delays in this thread.
+
+        Inside the block, a fetch that would sleep before its next attempt
+        (connection error backoff, or a 429/503 Retry-After pause) raises
+        RetryLater with the time the retry becomes due. Running the same job
+        again after that resumes where it stopped: requests that completed
+        before the deferral are answered with their earlier results, and the
+        deferred request continues from its next attempt. A scheduler can
+        therefore check other URLs in the meantime without sending any
+        request twice or changing how many attempts each request gets.
+
+        The job's state is dropped when the block finishes without a
+        deferral; a scheduler that gives up on a deferred job calls
+        forget_deferred().
+
+        Args:
+            job: Identity of the unit of work (e.g. the URL being classified)
+        """
+        previous = (getattr(self._defer_local, 'enabled', False), getattr(self._defer_local, 'job', None))
+        self._defer_local.enabled = True
+        self._defer_local.job = job
+        deferred = False
+        try:
+            yield
+        except RetryLater:
+            deferred = True
+            raise
+        finally:
+            self._defer_local.enabled, self._defer_local.job = previous
+            if not deferred:
+                self.forget_deferred(job)
+
+    def forget_deferred(self, job: Hashable = None):
+        """Drop the resume state of a deferred job that will not be run again.
+
+        Args:
+            job: Job passed to deferring_retries()
+        """
+        with self._pending_lock:
+            self._deferred_jobs.pop(job, None)
+
+    def _deferred_job(self) -> Optional[dict]:
+        """Resume state of the calling thread's job, or None when not deferring."""
+        if self.replaying or not getattr(self._defer_local, 'enabled', False):
+            return None
+        with self._pending_lock:
+            return self._deferred_jobs.setdefault(
+                getattr(self._defer_local, 'job', None), {'attempts': {}, 'results': {}}
+            )
+
+    def _completed_request(self, key: tuple) -> tuple[bool, object]:
+        """Look up a request the current deferred job already completed.
+
+        Args:
+            key: Identity of the request within the job
+
+        Returns:
+            Tuple of (found, result copy)
+        """
+        job = self._deferred_job()
+        if job is None:
+            return False, None
+        with self._pending_lock:
+            if key not in job['results']:
+                return False, None
+            result = job['results'][key]
+        return True, self._copy_result(result)
+
+    def _remember_request(self, key: tuple, result):
+        """Record a completed request of the current deferred job.
+
+        Args:
+            key: Identity of the request within the job
+            result: Its result (copied)
+        """
+        job = self._deferred_job()
+        if job is not None:
+            with self._pending_lock:
+                job['results'][key] = self._copy_result(result)
+
+    @staticmethod
+    def _copy_result(result):
+        """Copy a result dict deeply enough that callers cannot alter the original."""
+        if isinstance(result, dict):
+            return dict(result, headers=dict(result.get("headers", {})))
+        return result
+
+    def _retry_later(self, method: str, url: str, attempt: int, delay: float, reason: str):
+        """Hand the next attempt of a request back to the caller if deferring.
+
+        Returns without doing anything outside deferring_retries(), in which
+        case the caller waits in-line as before.
+
+        Args:
+            method: HTTP method of the request
+            url: URL of the request
+            attempt: Zero-based attempt that just failed
+            delay: Seconds to wait before the next attempt
+            reason: Error text or status of the failed attempt
 
-    def fetch(self, url: str, method: str = "GET", stream: bool = False) -> dict:
+        Raises:
+            RetryLater: When the calling thread is deferring retries
+        """
+        job = self._deferred_job()
+        if job is None:
+            return
+        with self._pending_lock:
+            job['attempts'][(method, url)] = attempt + 1
+        raise RetryLater(url, time.monotonic() + delay, reason)
+
+    def fetch(
+        self,
+        url: str,
+        method: str = "GET",
+        stream: bool = False,
+        keep_body: bool = False,
+        liveness: bool = False
+    ) -> dict:
         """Fetch URL with rate limiting and retry logic.
 
+        If the client shares a run-scoped ResponseCache, each method+URL is
+        fetched at most once per run and later callers get a copy of the
+        first result (and body, when it was small enough to cache). Results
+        of liveness fetches that stopped reading early only satisfy other
+        liveness fetches.
+
+        Concurrent calls for the same method and URL, from this or any other
+        client in the process, share one request in flight (see
+        _shares_flight for which calls can share).
+
         Args:
             url: URL to fetch
             method: HTTP method (GET, HEAD, etc.)
-            stream: Whether to stream response
+            stream: Only read headers, skipping the body (no hash)
+            keep_body: Attach the response body as result["content"] (GET only)
+            liveness: Only reachability matters; ``body_policy`` decides how
+                much of the body is read (no hash unless read in full)
 
         Returns:
             Dictionary with response metadata and status
         """
+        # Already completed before a deferred retry of the same job
+        job_key = ('fetch', method, url, stream, keep_body, liveness)
+        found, completed = self._completed_request(job_key)
+        if found:
+            return completed
+
+        use_response_cache = self.response_cache is not None and not stream
+        if use_response_cache:
+            cached = self.response_cache.get(
+                method, url, need_body=keep_body, need_complete=not liveness
+            )
+            if cached is not None:
+                self._remember_request(job_key, cached)
+                return cached
+
+        def fetch_and_cache() -> dict:
+            result = self._fetch_uncached(url, method, stream, keep_body, liveness)
+            content = result.get("content") if keep_body else result.pop("content", None)
+            if use_response_cache and not (result.get("circuit_open") or result.get("budget_exceeded")):
+                self.response_cache.put(method, url, result, content)
+            return result
+
+        result, shared = IN_FLIGHT.run(
+            (method, url, stream), (keep_body, liveness), fetch_and_cache,
+            lambda leader_mode: self._shares_flight(leader_mode, keep_body, liveness),
+            lambda result: dict(result, headers=dict(result.get("headers", {})))
+        )
+        if shared and not keep_body:
+            # May have joined a keep_body fetch: drop the body and its size-limit error
+            result.pop("content", None)
+            if result.get("truncated"):
+                result["error"] = None
+        self._remember_request(job_key, result)
+        return result
+
+    @staticmethod
+    def _shares_flight(leader_mode: tuple[bool, bool], keep_body: bool, liveness: bool) -> bool:
+        """Whether a fetch in flight answers a concurrent identical call.
+
+        A keep_body fetch serves every call; any other full read serves calls
+        without keep_body; a liveness read (possibly partial) only serves
+        other liveness calls.
+
+        Args:
+            leader_mode: (keep_body, liveness) of the fetch in flight
+            keep_body: Whether the new call needs the body
+            liveness: Whether the new call only checks reachability
+
+        Returns:
+            True if the new call can wait for the fetch in flight
+        """
+        leader_keep_body, leader_liveness = leader_mode
+        if leader_keep_body:
+            return True
+        return not keep_body and (liveness or not leader_liveness)
+
+    def _fetch_uncached(
+        self,
+        url: str,
+        method: str,
+        stream: bool,
+        keep_body: bool,
+        liveness: bool = False
+    ) -> dict:
+        """Perform a fetch over the network (or validator cache).
+
+        GET bodies are streamed and hashed chunk by chunk; only a bounded
+        prefix is kept for soft-404 checks unless keep_body is set, and
+        bodies above ``body_limits.max_bytes`` are cut off (result["truncated"]).
+        For liveness fetches the body policy may stop reading earlier, in
+        which case result["body_read"] names the action applied.
+
+        When the validator cache is enabled, GET and HEAD requests are sent
+        with If-None-Match / If-Modified-Since and a 304 response is reported
+        as status 200 with the cached hash, length and (if requested) body.
+
+        Args:
+            url: URL to fetch
+            method: HTTP method (GET, HEAD, etc.)
+            stream: Only read headers, skipping the body (no hash)
+            keep_body: Always buffer the body, erroring if it exceeds max_bytes
+            liveness: Apply the body policy to the body read
+
+        Returns:
+            Dictionary with response metadata and status; "content" holds the
+            body whenever it was buffered in full
+        """
         domain = self._get_domain(url)
         result = {
             "url": url,
@@ -139,65 +916,412 @@ class RateLimitedClient:
             "response_time_ms": 0.0,
             "error": None,
             "is_soft_404": False,
+            "not_modified": False,
             "headers": {}
         }
 
-        for attempt in range(self.max_retries):
+        use_cache = (
+            self.validator_cache is not None
+            and not stream
+            and method in ("GET", "HEAD")
+        )
+        request_headers = {}
+        if use_cache:
+            request_headers = self.validator_cache.conditional_headers(
+                url, require_body=keep_body
+            )
+
+        # Resume a deferred request where its previous attempts left off
+        first_attempt = 0
+        job = self._deferred_job()
+        if job is not None:
+            with self._pending_lock:
+                first_attempt = job['attempts'].pop((method, url), 0)
+
+        for attempt in range(first_attempt, self.max_retries):
+            if not self.circuit_breaker.allow(domain):
+                result["error"] = (
+                    f"Circuit open for {domain} after "
+                    f"{self.circuit_breaker.failure_threshold} consecutive connection failures"
+                )
+                result["circuit_open"] = True
+                return result
+
+            over_budget = self.accounting.admit(self.checker, domain, retry=attempt > 0)
+            if over_budget:
+                result["error"] = over_budget
+                result["budget_exceeded"] = True
+                return result
+
             try:
                 self._wait_for_rate_limit(domain)
 
                 start_time = time.time()
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    timeout=self.timeout,
-                    allow_redirects=True,
-                    stream=stream
-                )
-                elapsed_ms = (time.time() - start_time) * 1000
+                start_ns = time.perf_counter_ns()
+                with capture_phases() as phases:
+                    response = self._send(method, url, request_headers)
+                headers_ns = time.perf_counter_ns()
+                self.circuit_breaker.record_success(domain)
 
                 result["status_code"] = response.status_code
                 result["final_url"] = response.url
                 result["content_type"] = response.headers.get('Content-Type', '')
                 result["content_length"] = int(response.headers.get('Content-Length', 0))
-                result["response_time_ms"] = elapsed_ms
+                result["response_time_ms"] = (headers_ns - start_ns) / 1e6
                 result["headers"] = dict(response.headers)
 
-                # Compute hash for GET requests (not streaming)
-                if method == "GET" and not stream:
-                    content = response.content
-                    result["content_hash"] = hashlib.sha256(content).hexdigest()
-                    result["content_length"] = len(content)
+                # Throttled - the limiter holds the retry back for Retry-After
+                pause = self._record_response(domain, response, attempt)
+                if pause is not None:
+                    response.close()
+                    self._record_timing(domain, phases, start_ns, headers_ns, result)
+                    self._retry_later(method, url, attempt, pause, f"HTTP {response.status_code}")
+                    continue
+
+                # Unchanged since last run - answer from the validator cache
+                if response.status_code == 304 and request_headers:
+                    response.close()
+                    self._record_timing(domain, phases, start_ns, headers_ns, result)
+                    if self._apply_cached_entry(url, result, keep_body):
+                        return result
+                    # Cache entry unusable - retry once without validators
+                    self.validator_cache.invalidate(url)
+                    request_headers = {}
+                    continue
+
+                if method != "GET" or stream:
+                    response.close()
+                    self._record_timing(domain, phases, start_ns, headers_ns, result)
+                    if use_cache:
+                        self._update_validator_cache(url, method, response, result, None, keep_body)
+                    return result
+
+                # Stream the body: hash incrementally, keep a bounded prefix
+                content_type = result["content_type"].split(';')[0].strip().lower()
+                keep_limit = 0
+                if keep_body or (use_cache and content_type in self.cache_body_types):
+                    keep_limit = self.max_body_bytes
+                elif self.response_cache is not None:
+                    keep_limit = self.response_cache.max_entry_bytes
+
+                # Liveness checks read only as much as the content type warrants;
+                # a body within one chunk is read anyway to keep the connection
+                action, read_limit = FULL, None
+                declared = result["content_length"]
+                if liveness and not keep_body and not 0 < declared <= self.chunk_size:
+                    action = self.body_policy.action_for(content_type)
+                    read_limit = self.body_policy.read_limit(action)
+                body = self._read_body(response, keep_limit, read_limit)
+                self._record_timing(domain, phases, start_ns, headers_ns, result)
+                self.accounting.record_bytes(self.checker, domain, body["bytes_read"])
+                self.body_policy.record(
+                    content_type, body["bytes_read"], declared, not body["partial"]
+                )
+
+                result["content_hash"] = body["content_hash"]
+                result["content_length"] = body["content_length"]
+                if body["partial"]:
+                    result["body_read"] = action
+                if body["truncated"]:
+                    result["truncated"] = True
+                    if keep_body:
+                        result["error"] = (
+                            f"Response body exceeds max_bytes ({self.max_body_bytes})"
+                        )
+                elif body["content"] is not None:
+                    result["content"] = body["content"]
 
                 # Check for soft 404
-                if response.status_code == 200 and method == "GET" and not stream:
-                    result["is_soft_404"] = self._is_soft_404(url, response.url, response)
+                if response.status_code == 200:
+                    result["is_soft_404"] = self._is_soft_404(
+                        url, response.url, body["prefix"], response.encoding
+                    )
+
+                if use_cache:
+                    if body["truncated"] or body["partial"]:
+                        self.validator_cache.invalidate(url)
+                    else:
+                        self._update_validator_cache(
+                            url, method, response, result, body["content"], keep_body
+                        )
 
                 return result
 
             except requests.exceptions.RequestException as e:
-                # Calculate backoff delay
-                if attempt < self.max_retries - 1:
+                if _is_connection_failure(e):
+                    self.circuit_breaker.record_failure(domain, time.time() - start_time)
+                else:
+                    self.circuit_breaker.record_inconclusive(domain)
+
+                # Calculate backoff delay (no point once the circuit opened)
+                if attempt < self.max_retries - 1 and not self.circuit_breaker.is_open(domain):
                     delay = self.backoff_base * (self.backoff_multiplier ** attempt)
-                    time.sleep(delay)
+                    self._retry_later(method, url, attempt, delay, str(e))
+                    if not self.replaying:
+                        time.sleep(delay)
+                        self.circuit_breaker.add_time_lost(domain, delay)
                 else:
                     result["error"] = str(e)
                     return result
 
         return result
 
+    def _fetch_range(self, url: str, start: int, end: int) -> Optional[dict]:
+        """Fetch one byte range of a resource.
+
+        Args:
+            url: URL to fetch
+            start: First byte offset
+            end: Last byte offset (inclusive)
+
+        Returns:
+            Dict with start, data and total (full resource length), or None if
+            the request failed or the server did not answer with that range
+        """
+        # Already fetched before a deferred retry of the same job
+        found, completed = self._completed_request(('range', url, start, end))
+        if found:
+            return completed
+        result = self._fetch_range_uncached(url, start, end)
+        self._remember_request(('range', url, start, end), result)
+        return result
+
+    def _fetch_range_uncached(self, url: str, start: int, end: int) -> Optional[dict]:
+        """Fetch one byte range of a resource over the network.
+
+        Args:
+            url: URL to fetch
+            start: First byte offset
+            end: Last byte offset (inclusive)
+
+        Returns:
+            Dict with start, data and total, or None (see _fetch_range)
+        """
+        domain = self._get_domain(url)
+        if not self.circuit_breaker.allow(domain) or self.accounting.admit(self.checker, domain):
+            return None
+        self._wait_for_rate_limit(domain)
+
+        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        try:
+            with capture_phases() as phases:
+                response = self._send(
+                    "GET", url, {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+                )
+        except requests.exceptions.RequestException as e:
+            if _is_connection_failure(e):
+                self.circuit_breaker.record_failure(domain, time.time() - start_time)
+            else:
+                self.circuit_breaker.record_inconclusive(domain)
+            return None
+
+        headers_ns = time.perf_counter_ns()
+        self.circuit_breaker.record_success(domain)
+        self._record_response(domain, response, 0, can_retry=False)
+
+        data = bytearray()
+        try:
+            # 200 means Range was ignored; never read the full body here
+            if response.status_code != 206:
+                return None
+            match = re.match(
+                r'bytes (\d+)-(\d+)/(\d+)', response.headers.get('Content-Range', '')
+            )
+            if not match or int(match.group(1)) != start:
+                return None
+
+            limit = end - start + 1
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                data += chunk
+                if len(data) >= limit:
+                    break
+        except requests.exceptions.RequestException:
+            return None
+        finally:
+            response.close()
+            self._record_timing(domain, phases, start_ns, headers_ns)
+            self.accounting.record_bytes(self.checker, domain, len(data))
+
+        return {"start": start, "data": bytes(data[:limit]), "total": int(match.group(3))}
+
+    def pdf_fingerprint(self, url: str) -> Optional[dict]:
+        """Compute a sampled fingerprint of a PDF from HTTP Range requests.
+
+        Hashes the total length plus the head, the tail (which holds the
+        trailer and startxref) and, if it lies outside both, the window at the
+        startxref offset where the cross-reference table starts. Any edit that
+        rewrites the file or appends an incremental update changes one of them.
+
+        Args:
+            url: PDF URL
+
+        Returns:
+            Dict with fingerprint, content_length and content_hash (only set
+            when the file fit in the head range and was hashed in full), or
+            None if the server does not support Range requests
+        """
+        head = self._fetch_range(url, 0, self.fingerprint_head_bytes - 1)
+        if head is None:
+            return None
+        total = head["total"]
+        parts = [head]
+
+        if total > len(head["data"]):
+            tail_start = max(len(head["data"]), total - self.fingerprint_tail_bytes)
+            tail = self._fetch_range(url, tail_start, total - 1)
+            if tail is None or tail["total"] != total:
+                return None
+            parts.append(tail)
+
+            xref_offsets = re.findall(rb'startxref\s+(\d+)', tail["data"])
+            if xref_offsets:
+                offset = int(xref_offsets[-1])
+                if len(head["data"]) <= offset < tail_start:
+                    end = min(offset + self.fingerprint_xref_bytes, tail_start) - 1
+                    xref = self._fetch_range(url, offset, end)
+                    if xref is None or xref["total"] != total:
+                        return None
+                    parts.append(xref)
+
+        hasher = hashlib.sha256(str(total).encode())
+        for part in parts:
+            hasher.update(f"|{part['start']}:{len(part['data'])}|".encode())
+            hasher.update(part["data"])
+
+        whole_file = len(parts) == 1 and len(head["data"]) == total
+        return {
+            "fingerprint": hasher.hexdigest(),
+            "content_length": total,
+            "content_hash": hashlib.sha256(head["data"]).hexdigest() if whole_file else "",
+        }
+
+    def _load_head_rejecting(self) -> dict:
+        """Load domains remembered as rejecting HEAD, dropping expired ones.
+
+        Returns:
+            Dict mapping domain to the time (epoch seconds) it was recorded
+        """
+        if not self.head_probe_enabled or not self.head_probe_file.exists():
+            return {}
+        try:
+            with open(self.head_probe_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        cutoff = time.time() - self.head_remember_seconds
+        return {
+            domain: recorded for domain, recorded in saved.get('rejects_head', {}).items()
+            if recorded >= cutoff
+        }
+
+    def _save_head_rejecting(self):
+        """Persist the domains that reject HEAD, merged with those already saved.
+
+        Other clients of the run save their own findings to the same file,
+        so the newest record of each domain wins instead of the last writer.
+        """
+        with self._head_file_lock:
+            merged = self._load_head_rejecting()
+            with self._head_lock:
+                for domain, recorded in self._head_rejecting.items():
+                    merged[domain] = max(recorded, merged.get(domain, 0))
+            data = {'rejects_head': dict(sorted(merged.items()))}
+            self.head_probe_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.head_probe_file.with_name(f".{self.head_probe_file.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+            os.replace(tmp_path, self.head_probe_file)
+
+    def _is_suspicious_redirect(self, url: str, final_url: str) -> bool:
+        """Check whether a redirect may land on a soft 404 that HEAD cannot see.
+
+        Args:
+            url: Requested URL
+            final_url: URL after redirects
+
+        Returns:
+            True for redirects to another host, to the site root from a deep
+            path, or to a login/error-looking page
+        """
+        if final_url == url:
+            return False
+        original, final = urlparse(url), urlparse(final_url)
+        if original.netloc.lower() != final.netloc.lower():
+            return True
+        if len(original.path) > 10 and final.path in ('', '/', '/en/', '/de/'):
+            return True
+        target = (final.path + '?' + final.query).lower()
+        return any(keyword in target for keyword in self.suspicious_redirect_keywords)
+
+    def probe(self, url: str, prefer_head: bool = False) -> dict:
+        """Check that a URL is reachable, downloading its body only when needed.
+
+        Approved domains always get a full GET because the DB-specific soft
+        404 checks need the body. Other domains are probed with HEAD first;
+        GET is used instead when the domain is known to reject HEAD, when
+        HEAD answers with a ``head_probe.fallback_statuses`` code (the
+        domain is then remembered as rejecting HEAD if GET works) or when
+        HEAD ends on a suspicious redirect. GET probes read only as much of
+        the body as ``body_policy`` allows for its content type.
+
+        Args:
+            url: URL to check
+            prefer_head: Probe approved domains with HEAD too (for URLs whose
+                body is not inspected, such as known-good PDFs)
+
+        Returns:
+            Result dict as returned by fetch (no hash for HEAD probes or
+            bodies the policy did not read in full)
+        """
+        domain = self._get_domain(url)
+        if not self.head_probe_enabled or (self._is_approved_domain(domain) and not prefer_head):
+            return self.fetch(url, liveness=True)
+
+        with self._head_lock:
+            rejects_head = domain in self._head_rejecting
+        if rejects_head:
+            return self.fetch(url, liveness=True)
+
+        head_result = self.fetch(url, method="HEAD")
+        if head_result["error"] is not None:
+            return head_result
+
+        if head_result["status_code"] in self.head_fallback_statuses:
+            get_result = self.fetch(url, liveness=True)
+            if get_result["error"] is None and get_result["status_code"] < 400:
+                with self._head_lock:
+                    self._head_rejecting[domain] = time.time()
+            return get_result
+
+        if self._is_suspicious_redirect(url, head_result["final_url"]):
+            return self.fetch(url, liveness=True)
+
+        return head_result
+
     def check_pdf(
         self,
         url: str,
         known_content_length: Optional[int] = None,
-        known_hash: Optional[str] = None
+        known_hash: Optional[str] = None,
+        known_fingerprint: Optional[str] = None
     ) -> dict:
         """Check if PDF has changed using HEAD request and optional full download.
 
+        With the validator cache enabled both requests are conditional, so an
+        unchanged PDF is answered from its cached hash without a transfer.
+
+        With ``pdf_fingerprint`` enabled, a PDF whose length is unknown or
+        differs is first sampled with Range requests (see pdf_fingerprint).
+        If the fingerprint matches one recorded for a known hash (the
+        registry's or the last full download's), that hash is used; the PDF
+        is only downloaded in full when the fingerprint is new or the server
+        ignores Range.
+
         Args:
             url: PDF URL to check
             known_content_length: Previously recorded Content-Length
             known_hash: Previously recorded SHA-256 hash
+            known_fingerprint: Previously recorded range fingerprint of known_hash
 
         Returns:
             Dictionary with change detection results
@@ -208,7 +1332,9 @@ class RateLimitedClient:
             "new_content_length": 0,
             "new_hash": "",
             "error": None,
-            "status_code": 0
+            "status_code": 0,
+            "not_modified": False,
+            "fingerprint": ""
         }
 
         # First try HEAD request
@@ -217,6 +1343,8 @@ class RateLimitedClient:
 
         if head_result["error"]:
             result["error"] = head_result["error"]
+            result["circuit_open"] = head_result.get("circuit_open", False)
+            result["budget_exceeded"] = head_result.get("budget_exceeded", False)
             return result
 
         if head_result["status_code"] != 200:
@@ -226,17 +1354,57 @@ class RateLimitedClient:
         new_length = head_result["content_length"]
         result["new_content_length"] = new_length
 
+        # Validators unchanged since the last full download - reuse its hash
+        if head_result["not_modified"] and head_result["content_hash"]:
+            result["not_modified"] = True
+            result["new_hash"] = head_result["content_hash"]
+            if known_hash:
+                result["changed"] = (head_result["content_hash"] != known_hash)
+            else:
+                result["changed"] = (known_content_length is not None and
+                                   new_length != known_content_length)
+            return result
+
         # If we have known length and it matches, assume unchanged
         if known_content_length is not None and new_length == known_content_length:
             result["changed"] = False
             result["new_hash"] = known_hash or ""
             return result
 
-        # Content-Length differs or unavailable - do full GET to compute hash
+        # Content-Length differs or unavailable - try a sampled fingerprint
+        fingerprint = self.pdf_fingerprint(url) if self.fingerprint_enabled else None
+        if fingerprint is not None:
+            result["fingerprint"] = fingerprint["fingerprint"]
+            sampled_hash = fingerprint["content_hash"]
+
+            if not sampled_hash:
+                stored = self.validator_cache.get_fingerprint(url) if self.validator_cache else None
+                if stored and stored["fingerprint"] == fingerprint["fingerprint"]:
+                    sampled_hash = stored["content_hash"]
+                elif known_fingerprint and known_fingerprint == fingerprint["fingerprint"]:
+                    sampled_hash = known_hash or ""
+
+            if sampled_hash:
+                result["new_content_length"] = fingerprint["content_length"]
+                result["new_hash"] = sampled_hash
+                if known_hash:
+                    result["changed"] = (sampled_hash != known_hash)
+                else:
+                    result["changed"] = (known_content_length is not None and
+                                       fingerprint["content_length"] != known_content_length)
+                if self.validator_cache is not None:
+                    self.validator_cache.set_fingerprint(
+                        url, fingerprint["fingerprint"], sampled_hash, fingerprint["content_length"]
+                    )
+                return result
+
+        # Fingerprint unavailable or new - do full GET to compute hash
         get_result = self.fetch(url, method="GET")
 
         if get_result["error"]:
             result["error"] = get_result["error"]
+            result["circuit_open"] = get_result.get("circuit_open", False)
+            result["budget_exceeded"] = get_result.get("budget_exceeded", False)
             return result
 
         if get_result["status_code"] != 200:
@@ -245,6 +1413,22 @@ class RateLimitedClient:
 
         result["new_content_length"] = get_result["content_length"]
         result["new_hash"] = get_result["content_hash"]
+        result["not_modified"] = get_result["not_modified"]
+
+        # Too large to hash within max_bytes - fall back to length comparison
+        if get_result.get("truncated"):
+            result["truncated"] = True
+            result["changed"] = (known_content_length is not None and
+                               get_result["content_length"] != known_content_length)
+            return result
+
+        # Remember which hash this fingerprint belongs to for the next run
+        if (fingerprint is not None and self.validator_cache is not None
+                and get_result["content_length"] == fingerprint["content_length"]):
+            self.validator_cache.set_fingerprint(
+                url, fingerprint["fingerprint"], get_result["content_hash"],
+                get_result["content_length"]
+            )
 
         # Compare hash if we have a known hash
         if known_hash:
@@ -0,0 +1,195 @@
+"""Persistent per-URL link-check state for incremental rechecks."""
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Statuses by TTL class; anything else (CIRCUIT_OPEN, BUDGET_EXCEEDED) means
+# the URL was not actually checked and is never stored
+STATUS_CLASSES = {
+    'OK': 'ok',
+    'REDIRECT': 'warning',
+    'MOVED_PDF': 'warning',
+    'NOT_FOUND': 'failure',
+    'SERVER_ERROR': 'failure',
+    'TIMEOUT': 'failure',
+    'DOMAIN_ERROR': 'failure',
+    'SOFT_404': 'failure',
+}
+
+DEFAULT_TTL_HOURS = {'ok': 164, 'pdf': 20, 'warning': 20, 'failure': 20}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    url TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    status_code INTEGER,
+    final_url TEXT,
+    content_hash TEXT,
+    content_length INTEGER,
+    checked_at REAL NOT NULL,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    details TEXT NOT NULL DEFAULT '{}'
+)
+"""
+
+
+class LinkStateStore:
+    """SQLite table of the last link-check outcome of every URL.
+
+    Each row holds the last status, HTTP status code, final URL, content
+    hash and length, when the URL was checked and how many checks in a row
+    failed. A URL is due for a recheck once its row is older than the TTL of
+    its class: ``ok`` (a little under a week), ``pdf`` (OK PDFs, rechecked
+    with HEAD), ``warning`` (redirects, updated PDFs) and ``failure``. The
+    defaults sit a little under whole days so a nightly schedule's jitter
+    does not push a recheck to the following night.
+    """
+
+    def __init__(self, path: Path, ttl_hours: Optional[dict] = None):
+        """Open (and create if needed) the store.
+
+        Args:
+            path: SQLite database file
+            ttl_hours: Hours per TTL class, merged over DEFAULT_TTL_HOURS
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_hours = {**DEFAULT_TTL_HOURS, **(ttl_hours or {})}
+        self._db = sqlite3.connect(self.path)
+        self._db.row_factory = sqlite3.Row
+        with self._db:
+            self._db.execute(SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: dict, state_dir: Path) -> Optional["LinkStateStore"]:
+        """Open the store configured in the ``link_state`` section.
+
+        Disabled while a cassette is recorded or replayed, so those runs
+        check every URL.
+
+        Args:
+            config: Full configuration dictionary
+            state_dir: Runtime state directory (relative paths resolve here)
+
+        Returns:
+            LinkStateStore, or None when disabled
+        """
+        state_config = config.get('link_state', {})
+        if not state_config.get('enabled', False) or (config.get('cassette') or {}).get('mode'):
+            return None
+        path = Path(state_config.get('path', 'link_state.sqlite'))
+        if not path.is_absolute():
+            path = state_dir / path
+        return cls(path, state_config.get('ttl_hours'))
+
+    @staticmethod
+    def ttl_class(url: str, status: str) -> Optional[str]:
+        """Return the TTL class of an outcome.
+
+        Args:
+            url: Checked URL
+            status: Link status classification
+
+        Returns:
+            'ok', 'pdf', 'warning' or 'failure'; None if the status is not stored
+        """
+        status_class = STATUS_CLASSES.get(status)
+        if status_class == 'ok' and url.lower().endswith('.pdf'):
+            return 'pdf'
+        return status_class
+
+    def load(self) -> dict[str, dict]:
+        """Return every stored row.
+
+        Returns:
+            Dict mapping URL to its row (details decoded from JSON)
+        """
+        rows = {}
+        for row in self._db.execute("SELECT * FROM links"):
+            entry = dict(row)
+            entry['details'] = json.loads(entry['details'])
+            rows[entry['url']] = entry
+        return rows
+
+    def is_fresh(self, row: dict, now: Optional[float] = None) -> bool:
+        """Whether a stored outcome is recent enough to skip a recheck.
+
+        Args:
+            row: Stored row
+            now: Current time (defaults to time.time())
+
+        Returns:
+            True if the row is younger than its class's TTL
+        """
+        ttl_class = self.ttl_class(row['url'], row['status'])
+        if ttl_class is None:
+            return False
+        age = (time.time() if now is None else now) - row['checked_at']
+        return age < self.ttl_hours[ttl_class] * 3600
+
+    def save(self, outcomes: dict[str, tuple[str, dict]], now: Optional[float] = None) -> int:
+        """Store the outcomes of URLs checked in this run.
+
+        Outcomes whose status means the URL was not checked are skipped, so
+        the previous row stays in place. Failure details gain a
+        ``consecutive_failures`` count.
+
+        Args:
+            outcomes: Dict mapping URL to (status, details)
+            now: Check time (defaults to time.time())
+
+        Returns:
+            Number of rows written
+        """
+        now = time.time() if now is None else now
+        previous = {
+            row['url']: row['consecutive_failures']
+            for row in self._db.execute("SELECT url, consecutive_failures FROM links")
+        }
+        rows = []
+        for url, (status, details) in outcomes.items():
+            status_class = STATUS_CLASSES.get(status)
+            if status_class is None:
+                continue
+            failures = 0
+            if status_class == 'failure':
+                failures = details['consecutive_failures'] = previous.get(url, 0) + 1
+            rows.append((
+                url, status, details.get('status_code'), details.get('final_url', url),
+                details.get('new_hash', details.get('content_hash', '')),
+                details.get('new_content_length', details.get('content_length', 0)),
+                now, failures, json.dumps(details, ensure_ascii=False),
+            ))
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO links (url, status, status_code, final_url, content_hash, "
+                "content_length, checked_at, consecutive_failures, details) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def prune(self, urls: set[str]) -> int:
+        """Delete rows of URLs no longer referenced anywhere.
+
+        Args:
+            urls: URLs found in this run
+
+        Returns:
+            Number of rows deleted
+        """
+        stale = [(row['url'],) for row in self._db.execute("SELECT url FROM links") if row['url'] not in urls]
+        with self._db:
+            self._db.executemany("DELETE FROM links WHERE url = ?", stale)
+        return len(stale)
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
@@ -0,0 +1,308 @@
+"""Thread-safe per-domain token-bucket rate limiter."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class TokenBucketRateLimiter:
+    """Per-domain token buckets shared by threads and asyncio tasks.
+
+    Each domain has a bucket refilled at ``rate`` tokens per second up to
+    ``burst`` tokens. A request takes one token; if none is available the
+    caller is told how long to wait. Reservations are made under a lock and
+    may drive the bucket negative, so concurrent callers queue up behind each
+    other instead of racing for the same slot. The lock is never held while
+    sleeping, which makes the limiter safe to share between worker threads
+    and coroutines.
+
+    With ``adaptive`` enabled the rate of each domain is tuned by AIMD
+    (additive increase, multiplicative decrease) from response feedback:
+    every healthy response raises it by ``increase / rate`` (about
+    ``increase`` req/s per second of traffic), a 429 or 503 multiplies it by
+    ``decrease`` and a Retry-After pauses the domain for that long. Rates
+    stay within [min_rate, configured rate * max_factor] and can be saved
+    and reloaded so the next run starts from what was learned.
+
+    Rates come from the ``rate_limits`` config section::
+
+        rate_limits:
+          default: 2           # req/s for approved (Deutsche Boerse) domains
+          burst: 1             # default bucket size
+          external: 5          # req/s for domains outside approved_domains
+          domains:             # overrides, matched on the domain or a subdomain
+            eurex.com: 1
+            wikipedia.org: {rate: 5, burst: 3}
+          adaptive:
+            enabled: true
+            increase: 0.1      # additive step (req/s)
+            decrease: 0.5      # multiplier on 429/503
+            min_rate: 0.2
+            max_factor: 2      # ceiling relative to the configured rate
+    """
+
+    # Statuses that mean "slow down"
+    THROTTLE_STATUSES = (429, 503)
+
+    _shared: dict[str, "TokenBucketRateLimiter"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate_limits: dict, approved_domains: Optional[list[str]] = None):
+        """Initialize limiter from the rate_limits config section.
+
+        Args:
+            rate_limits: Dict with default, burst, external and domains keys
+            approved_domains: Domains that use the default rather than the external rate
+        """
+        self.default_rate = float(rate_limits.get('default', 2))
+        self.default_burst = float(rate_limits.get('burst', 1))
+        self.approved_domains = approved_domains or []
+
+        external = rate_limits.get('external')
+        self.external = self._parse_entry(external) if external is not None else None
+
+        self.overrides = {
+            domain.lower(): self._parse_entry(entry)
+            for domain, entry in (rate_limits.get('domains') or {}).items()
+        }
+
+        adaptive = rate_limits.get('adaptive') or {}
+        self.adaptive = adaptive.get('enabled', False)
+        self.increase = float(adaptive.get('increase', 0.1))
+        self.decrease = float(adaptive.get('decrease', 0.5))
+        self.min_rate = float(adaptive.get('min_rate', 0.2))
+        self.max_factor = float(adaptive.get("max_factor", 2))
+
+        self._lock = threading.Lock()
+        self._buckets: dict[str, list[float]] = {}  # domain -> [tokens, last_refill]
+        self._limits: dict[str, tuple[float, float]] = {}  # domain -> (rate, burst)
+        self._learned: dict[str, dict] = {}  # domain -> {"rate", "updated_at"} from state
+        self._throttled: dict[str, int] = {}  # domain -> 429/503 responses seen
+        self._loaded: set[Path] = set()  # state files already loaded
+        self._save_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, rate_limits: dict, approved_domains: Optional[list[str]] = None) -> "TokenBucketRateLimiter":
+        """Return the process-wide limiter for a rate_limits configuration.
+
+        Every client built from the same configuration shares one set of
+        buckets, so checkers running at the same time stay within the
+        configured rate of each domain together rather than each.
+
+        Args:
+            rate_limits: Dict with default, burst, external and domains keys
+            approved_domains: Domains that use the default rather than the external rate
+
+        Returns:
+            TokenBucketRateLimiter
+        """
+        key = json.dumps([rate_limits, approved_domains or []], sort_keys=True, default=str)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(rate_limits, approved_domains)
+            return cls._shared[key]
+
+    def _parse_entry(self, entry) -> tuple[float, float]:
+        """Normalise a config entry to (rate, burst).
+
+        Args:
+            entry: Number (req/s) or dict with rate and optional burst
+
+        Returns:
+            Tuple of (rate, burst)
+        """
+        if isinstance(entry, dict):
+            return (float(entry.get('rate', self.default_rate)),
+                    float(entry.get('burst', self.default_burst)))
+        return (float(entry), self.default_burst)
+
+    def _lookup_limits(self, domain: str) -> tuple[float, float]:
+        """Resolve (rate, burst) for a domain from the configuration.
+
+        Args:
+            domain: Domain name, optionally with port
+
+        Returns:
+            Tuple of (rate, burst)
+        """
+        host = domain.split(':')[0].lower()
+
+        # Most specific override wins (www.eurex.com before eurex.com)
+        best = None
+        for name, limits in self.overrides.items():
+            if host == name or host.endswith('.' + name):
+                if best is None or len(name) > len(best[0]):
+                    best = (name, limits)
+        if best:
+            return best[1]
+
+        if self.external is not None and not any(
+            host == d or host.endswith('.' + d) for d in self.approved_domains
+        ):
+            return self.external
+
+        return (self.default_rate, self.default_burst)
+
+    def limits_for(self, domain: str) -> tuple[float, float]:
+        """Return the (rate, burst) in effect for a domain.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            Tuple of (requests per second, burst size)
+        """
+        with self._lock:
+            return self._limits_locked(domain)
+
+    def _limits_locked(self, domain: str) -> tuple[float, float]:
+        """Cached limit lookup; caller must hold the lock."""
+        if domain not in self._limits:
+            rate, burst = self._lookup_limits(domain)
+            if self.adaptive and domain in self._learned:
+                rate = self._clamp(domain, float(self._learned[domain]["rate"]))
+            self._limits[domain] = (rate, burst)
+        return self._limits[domain]
+
+    def _clamp(self, domain: str, rate: float) -> float:
+        """Keep an adaptive rate within [min_rate, configured rate * max_factor]."""
+        ceiling = self._lookup_limits(domain)[0] * self.max_factor
+        return max(self.min_rate, min(ceiling, rate))
+
+    def record(self, domain: str, status_code: int, retry_after: Optional[float] = None):
+        """Feed a response back into the domain's rate (adaptive mode).
+
+        Args:
+            domain: Domain name
+            status_code: HTTP status of the response
+            retry_after: Seconds to pause the domain before a throttled
+                request is retried (omit when it will not be retried)
+        """
+        with self._lock:
+            rate, burst = self._limits_locked(domain)
+
+            if status_code in self.THROTTLE_STATUSES:
+                self._throttled[domain] = self._throttled.get(domain, 0) + 1
+                if self.adaptive:
+                    rate = self._clamp(domain, rate * self.decrease)
+                    self._limits[domain] = (rate, burst)
+            elif self.adaptive and status_code < 500:
+                rate = self._clamp(domain, rate + self.increase / rate)
+                self._limits[domain] = (rate, burst)
+
+            # Debit the pause from the bucket so every caller waits it out
+            if retry_after and retry_after > 0:
+                now = time.monotonic()
+                bucket = self._buckets.setdefault(domain, [burst, now])
+                bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+                bucket[0] = min(bucket[0], 0.0) - retry_after * rate
+
+    def stats(self) -> dict:
+        """Return the current rate and throttle count of every domain seen.
+
+        Returns:
+            Dict mapping domain to {"rate": req/s, "throttled": count}
+        """
+        with self._lock:
+            return {
+                domain: {"rate": round(rate, 3), "throttled": self._throttled.get(domain, 0)}
+                for domain, (rate, _) in sorted(self._limits.items())
+            }
+
+    def load_state(self, path: Path):
+        """Load learned rates saved by a previous run (adaptive mode only).
+
+        A file already loaded into this limiter is not read again, so a
+        shared limiter keeps the rates it has learned since.
+
+        Args:
+            path: JSON file written by save_state
+        """
+        path = Path(path).resolve()
+        with self._lock:
+            if path in self._loaded:
+                return
+            self._loaded.add(path)
+        if not self.adaptive or not path.exists():
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                learned = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            self._learned = {
+                domain: entry for domain, entry in learned.items()
+                if isinstance(entry, dict) and isinstance(entry.get("rate"), (int, float))
+            }
+            self._limits.clear()
+
+    def save_state(self, path: Path):
+        """Persist learned rates for the next run (adaptive mode only).
+
+        Domains not contacted in this run keep their previously learned rate.
+
+        Args:
+            path: JSON file to write
+        """
+        if not self.adaptive:
+            return
+        with self._lock:
+            learned = dict(self._learned)
+            for domain, (rate, _) in self._limits.items():
+                learned[domain] = {"rate": round(rate, 3), "updated_at": time.time()}
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._save_lock:
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(learned, indent=2, sort_keys=True), encoding='utf-8')
+            os.replace(tmp_path, path)
+
+    def reserve(self, domain: str) -> float:
+        """Take a token for a domain without blocking.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            rate, burst = self._limits_locked(domain)
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(domain, [burst, now])
+
+            # Refill since last reservation, capped at burst
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+            bucket[0] -= 1
+            if bucket[0] >= 0:
+                return 0.0
+            return -bucket[0] / rate
+
+    def acquire(self, domain: str):
+        """Block the calling thread until a request to domain is allowed.
+
+        Args:
+            domain: Domain name
+        """
+        delay = self.reserve(domain)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, domain: str):
+        """Suspend the calling coroutine until a request to domain is allowed.
+
+        Args:
+            domain: Domain name
+        """
+        delay = self.reserve(domain)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -144,7 +144,8 @@ def format_link_failures(failures: list[dict]) -> str:
     Args:
         failures: List of failed link dictionaries with keys:
                   'url', 'status' (string classification), 'locations' (array),
-                  'error_detail', 'final_url', 'suggested_action'
+                  'error_detail', 'final_url', 'suggested_action', and
+                  optionally 'consecutive_failures'
 
     Returns:
         Formatted Markdown section with tables
@@ -159,11 +160,11 @@ def format_link_failures(failures: list[dict]) -> str:
     for failure in failures:
         status = failure.get("status", "")
 
-        # Critical: NOT_FOUND, DOMAIN_ERROR, TIMEOUT, SERVER_ERROR, SOFT_404
-        if status in ("NOT_FOUND", "DOMAIN_ERROR", "TIMEOUT", "SERVER_ERROR", "SOFT_404"):
+        # Critical: NOT_FOUND, DOMAIN_ERROR, TIMEOUT, SERVER_ERROR, SOFT_404, CIRCUIT_OPEN
+        if status in ("NOT_FOUND", "DOMAIN_ERROR", "TIMEOUT", "SERVER_ERROR", "SOFT_404", "CIRCUIT_OPEN"):
             critical.append(failure)
-        # Warning: REDIRECT, MOVED_PDF
-        elif status in ("REDIRECT", "MOVED_PDF"):
+        # Warning: REDIRECT, MOVED_PDF, BUDGET_EXCEEDED / SKIPPED_BUDGET (not checked)
+        elif status in ("REDIRECT", "MOVED_PDF", "BUDGET_EXCEEDED", "SKIPPED_BUDGET"):
             warnings.append(failure)
         else:
             critical.append(failure)  # Default to critical
@@ -184,6 +185,8 @@ def format_link_failures(failures: list[dict]) -> str:
             line = str(first_loc.get("line", ""))
             link_text = first_loc.get("link_text", "")
             action = item.get("suggested_action", "Investigate and fix")
+            if item.get("consecutive_failures", 0) > 1:
+                action += f" (failing for {item['consecutive_failures']} runs)"
 
             rows.append([url, file_path, line, link_text, action])
 
@@ -207,6 +210,10 @@ def format_link_failures(failures: list[dict]) -> str:
                 status_text = f"Redirect -> {item.get('final_url', '')}"
             elif status_str == "MOVED_PDF":
                 status_text = "PDF updated"
+            elif status_str == "BUDGET_EXCEEDED":
+                status_text = "Not checked (budget exceeded)"
+            elif status_str == "SKIPPED_BUDGET":
+                status_text = "Not checked (time budget)"
             else:
                 status_text = status_str
             action = item.get("suggested_action", "Review")
@@ -399,7 +406,20 @@ def format_metadata(metadata: dict) -> str:
     Args:
         metadata: Dictionary with keys:
                   'version', 'run_date', 'run_time', 'urls_checked',
-                  'facts_verified', 'internal_links_checked', 'circular_sources_checked'
+                  'facts_verified', 'internal_links_checked', 'circular_sources_checked',
+                  and optionally 'response_cache' (hit/miss statistics)
+                  'dns' (resolver cache statistics), 'circuit_breaker'
+                  (per-domain breaker statistics), 'latency' (per-domain
+                  request phase percentiles), 'accounting' (requests, retries
+                  and bytes per domain and checker), 'connection_pools' (per-host
+                  pool utilisation), 'body_policy' (body bytes read and
+                  skipped per content type), 'hedging' (hedged request
+                  counts and rates), 'single_flight' (requests shared by
+                  concurrent callers), 'link_state' (URLs checked and
+                  carried forward from earlier runs), 'git_diff' (URLs on
+                  lines changed since the base revision), 'time_budget'
+                  (URLs checked and skipped within the wall-clock budget) and
+                  'url_canonical' (URL spellings collapsed before checking)
 
     Returns:
         Formatted Markdown metadata section
@@ -414,9 +434,156 @@ def format_metadata(metadata: dict) -> str:
     output += f"- Internal links checked: {metadata.get('internal_links_checked', 0)}\n"
     output += f"- Circular sources checked: {metadata.get('circular_sources_checked', 0)}\n"
 
+    canonical = metadata.get("url_canonical")
+    if canonical and canonical.get("collapsed"):
+        output += (
+            f"- URL spellings: {canonical.get('raw_urls', 0)} as written, "
+            f"{canonical.get('canonical_urls', 0)} after canonicalization\n"
+        )
+
+    link_state = metadata.get("link_state")
+    if link_state:
+        output += (
+            f"- Link state: {link_state.get('checked', 0)} URLs checked this run, "
+            f"{link_state.get('carried_forward', 0)} carried forward from earlier runs\n"
+        )
+
+    git_diff = metadata.get("git_diff")
+    if git_diff:
+        output += (
+            f"- Changed since {git_diff.get('base_rev')}: {git_diff.get('changed_urls', 0)} URLs "
+            f"in {git_diff.get('changed_files', 0)} markdown files\n"
+        )
+
+    time_budget = metadata.get("time_budget")
+    if time_budget:
+        output += (
+            f"- Time budget: {time_budget.get('seconds', 0):.0f} s; {time_budget.get('checked', 0)} URLs "
+            f"checked in priority order, {time_budget.get('skipped', 0)} skipped\n"
+        )
+
+    cache = metadata.get("response_cache")
+    if cache:
+        output += (
+            f"- Response cache: {cache.get('hits', 0)} hits, {cache.get('misses', 0)} misses, "
+            f"{cache.get('bytes_saved', 0) / 1_048_576:.1f} MB saved\n"
+        )
+
+    dns = metadata.get("dns")
+    if dns:
+        output += (
+            f"- DNS cache: {dns.get('hits', 0)}/{dns.get('lookups', 0)} lookups cached "
+            f"({dns.get('negative_hits', 0)} negative), "
+            f"{dns.get('resolutions', 0)} resolutions in {dns.get('resolve_ms', 0):.0f} ms\n"
+        )
+
+    accounting = metadata.get("accounting")
+    if accounting and accounting.get("totals", {}).get("requests"):
+        totals = accounting["totals"]
+        by_checker = ", ".join(
+            f"{checker} {counters['requests']}" for checker, counters in accounting.get("checkers", {}).items()
+        )
+        output += (
+            f"- HTTP traffic: {totals['requests']} requests ({totals['retries']} retries), "
+            f"{totals['bytes_in'] / 1_048_576:.1f} MB received; by checker: {by_checker}\n"
+        )
+        busiest = list(accounting.get("domains", {}).items())[:3]
+        if busiest:
+            output += "- Busiest domains: " + ", ".join(
+                f"{domain} {counters['requests']} requests / {counters['bytes_in'] / 1_048_576:.1f} MB"
+                for domain, counters in busiest
+            ) + "\n"
+        if totals.get("refused"):
+            output += f"- Budgets: {totals['refused']} requests refused after a budget was used up\n"
+
+    breaker = metadata.get("circuit_breaker")
+    if breaker and breaker.get("domains"):
+        output += (
+            f"- Circuit breaker: {breaker.get('domains_opened', 0)} domains opened, "
+            f"{breaker.get('short_circuits', 0)} requests short-circuited, "
+            f"{breaker.get('time_lost_s', 0):.1f} s lost to failing hosts\n"
+        )
+
+    pools = metadata.get("connection_pools")
+    if pools:
+        totals = {
+            name: sum(pool.get(name, 0) for pool in pools.values())
+            for name in ("opened", "prewarmed", "reused", "discarded")
+        }
+        saturated = sum(
+            1 for pool in pools.values() if pool.get("peak_in_use", 0) > pool.get("maxsize", 0)
+        )
+        output += (
+            f"- Connection pools: {totals['opened']} connections opened on demand, "
+            f"{totals['prewarmed']} pre-warmed, {totals['reused']} reuses, "
+            f"{totals['discarded']} discarded ({saturated} of {len(pools)} hosts exceeded their pool size)\n"
+        )
+
+    single_flight = metadata.get("single_flight")
+    if single_flight and single_flight.get("coalesced"):
+        output += (
+            f"- Coalesced requests: {single_flight['coalesced']} callers shared a request "
+            f"already in flight ({single_flight.get('requests', 0)} requests sent)\n"
+        )
+
+    hedging = metadata.get("hedging")
+    if hedging and hedging.get("requests"):
+        output += (
+            f"- Hedged requests: {hedging.get('hedged', 0)} of {hedging['requests']} GETs to "
+            f"measured hosts ({hedging.get('hedge_rate', 0):.0%}); the hedge answered first in "
+            f"{hedging.get('hedge_wins', 0)} ({hedging.get('win_rate', 0):.0%})\n"
+        )
+
+    body_policy = metadata.get("body_policy")
+    if body_policy and body_policy.get("types"):
+        partial = ", ".join(
+            f"{media_type} {stats['partial']}/{stats['responses']}"
+            for media_type, stats in body_policy["types"].items() if stats.get("partial")
+        )
+        output += (
+            f"- Response bodies: {body_policy.get('bytes_read', 0) / 1_048_576:.1f} MB read, "
+            f"{body_policy.get('bytes_skipped', 0) / 1_048_576:.1f} MB skipped"
+        )
+        output += f" (partial reads: {partial})\n" if partial else "\n"
+
+    latency = metadata.get("latency")
+    if latency:
+        output += "\n" + format_latency(latency)
+
     return output
 
 
+def format_latency(latency: dict, top: int = 10) -> str:
+    """
+    Format the domains that took the most request time as a table.
+
+    Args:
+        latency: Per-domain summaries from TimingStats.summary() (busiest first)
+        top: Number of domains to show
+
+    Returns:
+        Markdown table with request counts, total time and p50/p95/p99/max
+        of time-to-first-byte and whole-request time
+    """
+    def percentiles(summary: dict) -> str:
+        if not summary:
+            return "-"
+        return " / ".join(f"{summary.get(p, 0):.0f}" for p in ("p50", "p95", "p99", "max"))
+
+    headers = ["Domain", "Requests", "Time (s)", "TTFB p50/p95/p99/max (ms)", "Total p50/p95/p99/max (ms)"]
+    rows = [
+        [
+            domain,
+            str(stats.get("requests", 0)),
+            f"{stats.get('total_ms', 0) / 1000:.1f}",
+            percentiles(stats.get("ttfb")),
+            percentiles(stats.get("total")),
+        ]
+        for domain, stats in list(latency.items())[:top]
+    ]
+    return "**Request time by domain**\n\n" + format_table(headers, rows)
+
+
 def wrap_collapsible(title: str, content: str) -> str:
     """
     Wrap content in <details><summary> tags for collapsible sections.
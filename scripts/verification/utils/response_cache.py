@@ -0,0 +1,196 @@
+"""In-run response cache shared by all checkers of one pipeline run."""
+
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """Content-addressed response cache scoped to a single pipeline run.
+
+    Fetch results are stored per (method, URL) without their bodies; bodies
+    are stored once per SHA-256 hash, so identical documents reached through
+    different URLs share storage. Bodies live in memory up to
+    ``max_memory_bytes`` and are evicted least-recently-used first; evicted
+    bodies spill to a temporary directory (if enabled) instead of being lost.
+    The spill directory is removed by close().
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 16 * 1024 * 1024,
+        spill_to_disk: bool = True
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            max_memory_bytes: Total body bytes kept in memory before eviction
+            max_entry_bytes: Largest single body worth caching
+            spill_to_disk: Write evicted bodies to a temp directory
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.spill_to_disk = spill_to_disk
+
+        self._lock = threading.Lock()
+        self._results: dict[tuple[str, str], dict] = {}
+        self._bodies: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._spill_dir: Optional[Path] = None
+        self._spilled: set[str] = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+        self.spilled_bytes = 0
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ResponseCache":
+        """Build a cache from the ``response_cache`` config section.
+
+        Args:
+            config: Full configuration dictionary
+
+        Returns:
+            Configured ResponseCache
+        """
+        cache_config = config.get('response_cache', {})
+        return cls(
+            max_memory_bytes=int(cache_config.get('max_memory_mb', 64) * 1024 * 1024),
+            max_entry_bytes=int(cache_config.get('max_entry_mb', 16) * 1024 * 1024),
+            spill_to_disk=cache_config.get('spill_to_disk', True),
+        )
+
+    def get(
+        self,
+        method: str,
+        url: str,
+        need_body: bool = False,
+        need_complete: bool = False
+    ) -> Optional[dict]:
+        """Look up a previous fetch result.
+
+        Args:
+            method: HTTP method
+            url: Requested URL
+            need_body: Only count as a hit if the body is available
+            need_complete: Only count as a hit if the body was read in full
+                (results carrying "body_read" stopped early)
+
+        Returns:
+            Copy of the cached result (with "content" if need_body) or None
+        """
+        with self._lock:
+            cached = self._results.get((method, url))
+            if cached is not None and need_complete and "body_read" in cached:
+                cached = None
+            content = None
+            if cached is not None and need_body:
+                content = self._load_body_locked(cached.get("content_hash", ""))
+                if content is None:
+                    cached = None
+
+            if cached is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            if method == "GET":
+                self.bytes_saved += cached.get("content_length", 0)
+
+        result = dict(cached, headers=dict(cached.get("headers", {})))
+        if need_body:
+            result["content"] = content
+        return result
+
+    def put(self, method: str, url: str, result: dict, content: Optional[bytes] = None):
+        """Store a fetch result and, optionally, its body.
+
+        Args:
+            method: HTTP method
+            url: Requested URL
+            result: Fetch result dict (any "content" key is ignored)
+            content: Full response body matching result["content_hash"]
+        """
+        entry = {k: v for k, v in result.items() if k != "content"}
+        content_hash = entry.get("content_hash", "")
+
+        with self._lock:
+            self._results[(method, url)] = entry
+            if (content is not None and content_hash
+                    and len(content) <= self.max_entry_bytes
+                    and content_hash not in self._bodies
+                    and content_hash not in self._spilled):
+                self._bodies[content_hash] = content
+                self._memory_bytes += len(content)
+                self._evict_locked()
+
+    def _load_body_locked(self, content_hash: str) -> Optional[bytes]:
+        """Fetch a body from memory or the spill directory (lock held).
+
+        Args:
+            content_hash: SHA-256 hex digest
+
+        Returns:
+            Body bytes or None
+        """
+        if not content_hash:
+            return None
+        if content_hash in self._bodies:
+            self._bodies.move_to_end(content_hash)
+            return self._bodies[content_hash]
+        if content_hash in self._spilled:
+            try:
+                return (self._spill_dir / content_hash).read_bytes()
+            except OSError:
+                self._spilled.discard(content_hash)
+        return None
+
+    def _evict_locked(self):
+        """Evict least-recently-used bodies until under the memory limit."""
+        while self._memory_bytes > self.max_memory_bytes and self._bodies:
+            content_hash, content = self._bodies.popitem(last=False)
+            self._memory_bytes -= len(content)
+            self.evictions += 1
+
+            if self.spill_to_disk:
+                if self._spill_dir is None:
+                    self._spill_dir = Path(tempfile.mkdtemp(prefix='verification-cache-'))
+                (self._spill_dir / content_hash).write_bytes(content)
+                self._spilled.add(content_hash)
+                self.spilled_bytes += len(content)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and memory usage.
+
+        Returns:
+            Dict with hits, misses, bytes_saved, evictions, memory and spill sizes
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "entries": len(self._results),
+                "memory_bytes": self._memory_bytes,
+                "evictions": self.evictions,
+                "spilled_bytes": self.spilled_bytes,
+            }
+
+    def close(self):
+        """Drop all cached data and remove the spill directory."""
+        with self._lock:
+            self._results.clear()
+            self._bodies.clear()
+            self._memory_bytes = 0
+            self._spilled.clear()
+            if self._spill_dir is not None:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
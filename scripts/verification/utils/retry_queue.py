@@ -0,0 +1,94 @@
+"""Deferred retries: a not-before queue instead of in-line backoff sleeps."""
+
+import heapq
+import itertools
+import time
+from typing import Any, Optional
+
+
+class RetryLater(Exception):
+    """Raised by RateLimitedClient instead of sleeping before a retry.
+
+    Only raised while the calling thread is inside
+    RateLimitedClient.deferring_retries(). The client remembers how many
+    attempts the request has used and which earlier requests of the same
+    job already completed, so running the job again after ``not_before``
+    resumes with the next attempt and the total retry budget is unchanged.
+    """
+
+    def __init__(self, url: str, not_before: float, reason: str = ""):
+        """Create a deferral.
+
+        Args:
+            url: URL whose request should be retried
+            not_before: time.monotonic() value before which not to retry
+            reason: Why the request failed (error text or status)
+        """
+        super().__init__(f"Retry {url} after {max(0.0, not_before - time.monotonic()):.2f}s: {reason}")
+        self.url = url
+        self.not_before = not_before
+        self.reason = reason
+
+    @property
+    def delay(self) -> float:
+        """Seconds left until the retry may run (0 if already due)."""
+        return max(0.0, self.not_before - time.monotonic())
+
+
+class RetryQueue:
+    """Min-heap of work items ordered by their not-before time.
+
+    Items pushed with the same not-before time come out in push order.
+    Not thread-safe; each scheduling loop owns its own queue.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._heap: list[tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+        self.deferred = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: Any, not_before: float):
+        """Schedule an item.
+
+        Args:
+            item: Work item (e.g. a URL)
+            not_before: time.monotonic() value before which it is not ready
+        """
+        heapq.heappush(self._heap, (not_before, next(self._counter), item))
+        self.deferred += 1
+
+    def pop_ready(self) -> Optional[Any]:
+        """Remove and return the earliest item whose time has come.
+
+        Returns:
+            The item, or None if nothing is due yet
+        """
+        if self._heap and self._heap[0][0] <= time.monotonic():
+            return heapq.heappop(self._heap)[2]
+        return None
+
+    def clear(self) -> list:
+        """Remove and return every queued item, due or not.
+
+        Returns:
+            The items in not-before order
+        """
+        items = [item for _, _, item in sorted(self._heap)]
+        self._heap.clear()
+        return items
+
+    def wait(self, until: Optional[float] = None):
+        """Sleep until the earliest queued item is due (no-op when empty).
+
+        Args:
+            until: time.monotonic() value to wake up at the latest
+        """
+        if self._heap:
+            wake = self._heap[0][0] if until is None else min(self._heap[0][0], until)
+            delay = wake - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
@@ -0,0 +1,112 @@
+"""Single-flight deduplication of concurrent identical requests."""
+
+import threading
+from typing import Any, Callable, Hashable
+
+
+class _Flight:
+    """One request in progress and, once finished, its outcome."""
+
+    def __init__(self, mode: Any):
+        self.mode = mode
+        self.done = threading.Event()
+        self.result: Any = None
+        self.failed = False
+
+
+class SingleFlight:
+    """Lets concurrent callers of the same request share one execution.
+
+    The first caller for a key (the leader) runs the request; callers that
+    arrive while it is in flight wait for it and receive a copy of its
+    result instead of sending their own. Nothing is kept once the request
+    finishes, so this is not a cache: a caller arriving afterwards runs the
+    request again (or finds it in a cache the leader filled).
+
+    A leader's ``mode`` describes what its result contains; a follower only
+    joins if ``can_join(leader_mode)`` says that result serves it, and
+    otherwise runs its own request. If the leader raises, its followers run
+    the request themselves (one of them becoming the new leader), so a
+    failure such as a deferred retry is never shared.
+    """
+
+    def __init__(self):
+        """Initialize with nothing in flight."""
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def run(
+        self,
+        key: Hashable,
+        mode: Any,
+        func: Callable[[], Any],
+        can_join: Callable[[Any], bool],
+        copy: Callable[[Any], Any]
+    ) -> tuple[Any, bool]:
+        """Run func for key, or share the result of an identical call in flight.
+
+        Args:
+            key: Identity of the request (e.g. method and URL)
+            mode: What this caller's result will contain
+            func: Runs the request and returns its result
+            can_join: Whether a flight started with a given mode serves this caller
+            copy: Makes an independent copy of a result for each follower
+
+        Returns:
+            Tuple of (result, shared); shared is True if another caller's
+            request produced the result
+
+        Raises:
+            Exception: Whatever func raises, when this caller ran it
+        """
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                if flight is None:
+                    flight = self._flights[key] = _Flight(mode)
+                    role = 'lead'
+                elif can_join(flight.mode):
+                    role = 'follow'
+                else:
+                    role = 'alone'  # in flight, but its result would not serve us
+                if role != 'follow':
+                    self.executed += 1
+
+            if role == 'alone':
+                return func(), False
+
+            if role == 'lead':
+                try:
+                    result = func()
+                except BaseException:
+                    flight.failed = True
+                    raise
+                else:
+                    flight.result = copy(result)
+                    return result, False
+                finally:
+                    with self._lock:
+                        del self._flights[key]
+                    flight.done.set()
+
+            flight.done.wait()
+            if not flight.failed:
+                with self._lock:
+                    self.coalesced += 1
+                return copy(flight.result), True
+
+    def stats(self) -> dict:
+        """Return how many requests ran and how many callers shared one.
+
+        Returns:
+            Dict with requests (executed by a caller) and coalesced (callers
+            served by another caller's request)
+        """
+        with self._lock:
+            return {"requests": self.executed, "coalesced": self.coalesced}
+
+
+# Process-wide, so concurrent checkers (each with its own client) share flights
+IN_FLIGHT = SingleFlight()
@@ -0,0 +1,145 @@
+"""Soft 404 detection over a bounded response body prefix."""
+
+from typing import Optional
+from urllib.parse import urlparse
+
+
+# Words whose presence means a blob URL still serves a document page
+DOCUMENT_WORDS = ['pdf', 'document', 'download']
+
+# Generic Deutsche Boerse landing page title, as spelled in lower-cased raw
+# markup: UTF-8 and Latin-1 bytes (either case of the umlaut, which
+# bytes.lower() leaves alone) and HTML entities. Matched on bytes because
+# requests decodes a UTF-8 page served as text/html without a charset as
+# ISO-8859-1.
+LANDING_BRAND_MARKUP = [
+    b'deutsche b\xc3\xb6rse', b'deutsche b\xc3\x96rse',
+    b'deutsche b\xf6rse', b'deutsche b\xd6rse',
+    b'deutsche b&ouml;rse', b'deutsche b&#246;rse', b'deutsche b&#xf6;rse',
+]
+
+META_REFRESH = '<meta http-equiv="refresh"'
+
+
+class Soft404Detector:
+    """Detects soft 404 pages (HTTP 200 but error/landing content).
+
+    The body prefix is decoded and lower-cased once and every heuristic runs
+    as a substring search over that single copy, with phrases lower-cased up
+    front. The brand checks are the exception: they search the raw bytes,
+    since the declared charset may not be the one the page is written in. Heuristics are evaluated lazily in order of cost: DB-specific
+    checks only for approved domains, and the <title> is only located when
+    the cheap brand/document pre-filter says an expired-blob landing page is
+    likely and must be confirmed.
+    """
+
+    def __init__(
+        self,
+        patterns: list[str],
+        db_specific: dict,
+        approved_domains: list[str]
+    ):
+        """Initialize detector from configuration.
+
+        Args:
+            patterns: Generic soft 404 phrases (soft_404_patterns)
+            db_specific: Toggles for DB-specific checks (db_specific_soft_404)
+            approved_domains: Domains the DB-specific checks apply to
+        """
+        # Pre-lowered and de-duplicated; an empty phrase would match every page
+        self.patterns = tuple(dict.fromkeys(p.lower() for p in patterns if p))
+        self.homepage_redirect = db_specific.get('homepage_redirect', True)
+        self.expired_blob_landing = db_specific.get('expired_blob_landing', True)
+        self.meta_refresh_redirect = db_specific.get('meta_refresh_redirect', True)
+        self.approved_domains = approved_domains
+
+    @staticmethod
+    def _decode(body_prefix: bytes, encoding: Optional[str]) -> str:
+        """Decode and lower-case the body prefix once.
+
+        Args:
+            body_prefix: Leading bytes of the body
+            encoding: Response charset (falls back to UTF-8)
+
+        Returns:
+            Lower-cased text
+        """
+        try:
+            return body_prefix.decode(encoding or 'utf-8', errors='replace').lower()
+        except LookupError:
+            return body_prefix.decode('utf-8', errors='replace').lower()
+
+    def _is_approved(self, url: str) -> bool:
+        """Check whether a URL belongs to an approved (DB) domain."""
+        domain = urlparse(url).netloc
+        return any(approved in domain for approved in self.approved_domains)
+
+    def is_soft_404(
+        self,
+        url: str,
+        final_url: str,
+        body_prefix: bytes,
+        encoding: Optional[str] = None
+    ) -> bool:
+        """Detect soft 404 errors (200 status but no real content).
+
+        Args:
+            url: Original requested URL
+            final_url: Final URL after redirects
+            body_prefix: Leading bytes of the response body
+            encoding: Response charset (falls back to UTF-8)
+
+        Returns:
+            True if this appears to be a soft 404
+        """
+        text = self._decode(body_prefix, encoding)
+
+        # Check for generic soft 404 patterns in body
+        if any(pattern in text for pattern in self.patterns):
+            return True
+
+        # DB-specific checks
+        if not self._is_approved(url):
+            return False
+
+        # Check 1: Homepage redirect (deep path redirects to domain root)
+        if self.homepage_redirect:
+            original_path = urlparse(url).path
+            final_path = urlparse(final_url).path
+            if len(original_path) > 10 and final_path in ['/', '/en/', '/de/']:
+                return True
+
+        # Check 2: Expired blob landing page - parse the title only if the
+        # brand appears in the raw markup and no document keyword does
+        if (self.expired_blob_landing
+                and '/resource/blob/' in url.lower()
+                and not any(word in text for word in DOCUMENT_WORDS)
+                and any(brand in body_prefix.lower() for brand in LANDING_BRAND_MARKUP)):
+            if self._title_is_landing_page(body_prefix):
+                return True
+
+        # Check 3: Meta refresh redirect
+        if self.meta_refresh_redirect and META_REFRESH in text:
+            return True
+
+        return False
+
+    def _title_is_landing_page(self, body_prefix: bytes) -> bool:
+        """Confirm the page <title> carries the generic landing page brand.
+
+        Args:
+            body_prefix: Leading bytes of the response body
+
+        Returns:
+            True if the title contains the Deutsche Boerse brand
+        """
+        # Searched on bytes like the pre-filter: a parser would have to guess
+        # the charset, and gets short Latin-1 pages wrong
+        lowered = body_prefix.lower()
+        start = lowered.find(b'<title')
+        if start == -1:
+            return False
+        start = lowered.find(b'>', start) + 1
+        end = lowered.find(b'</title>', start)
+        title = lowered[start:end] if end != -1 else lowered[start:]
+        return any(brand in title for brand in LANDING_BRAND_MARKUP)
@@ -0,0 +1,188 @@
+"""Per-request phase timings and per-domain latency histograms."""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Phases of one HTTP exchange. dns, connect and tls only occur when a new
+# connection is opened; ttfb is the wait for the response headers once
+# connected, transfer the body read, total the whole exchange.
+PHASES = ('dns', 'connect', 'tls', 'ttfb', 'transfer', 'total')
+CONNECTION_PHASES = ('dns', 'connect', 'tls')
+
+_current = threading.local()
+
+
+@contextmanager
+def capture_phases() -> Iterator[dict]:
+    """Collect phase times charged by the transport on this thread.
+
+    The DNS cache and the connection classes in utils.dns_cache call
+    add_phase() while a request is being sent; inside this block those
+    times land in the yielded dict (nanoseconds per phase).
+
+    Yields:
+        Dict mapping phase name to nanoseconds
+    """
+    previous = getattr(_current, 'phases', None)
+    phases: dict[str, int] = {}
+    _current.phases = phases
+    try:
+        yield phases
+    finally:
+        _current.phases = previous
+
+
+def add_phase(name: str, elapsed_ns: int):
+    """Charge time to a phase of the request being sent on this thread.
+
+    Does nothing outside capture_phases().
+
+    Args:
+        name: Phase name (see PHASES)
+        elapsed_ns: Nanoseconds spent
+    """
+    phases = getattr(_current, 'phases', None)
+    if phases is not None:
+        phases[name] = phases.get(name, 0) + elapsed_ns
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of durations in microseconds.
+
+    Each power of two is split into 2**SUB_BUCKET_BITS linear buckets, so
+    any recorded value is reported within 1/32 (about 3%) of its true value
+    while memory grows only with the number of powers of two spanned.
+    The maximum is tracked exactly.
+    """
+
+    SUB_BUCKET_BITS = 5
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.max = 0
+        self.sum = 0
+
+    def _bucket(self, value: int) -> int:
+        """Lower bound of the bucket holding a value."""
+        shift = max(0, value.bit_length() - self.SUB_BUCKET_BITS - 1)
+        return (value >> shift) << shift
+
+    def _bucket_upper(self, lower: int) -> int:
+        """Highest value that falls in the bucket starting at lower."""
+        shift = max(0, lower.bit_length() - self.SUB_BUCKET_BITS - 1)
+        return lower + (1 << shift) - 1
+
+    def record(self, value_us: int):
+        """Add one duration.
+
+        Args:
+            value_us: Duration in microseconds
+        """
+        value_us = max(0, int(value_us))
+        lower = self._bucket(value_us)
+        self._buckets[lower] = self._buckets.get(lower, 0) + 1
+        self.count += 1
+        self.sum += value_us
+        self.max = max(self.max, value_us)
+
+    def percentile(self, percent: float) -> int:
+        """Return the value at a percentile.
+
+        Args:
+            percent: Percentile (0-100)
+
+        Returns:
+            Upper bound of the bucket holding that rank (capped at the
+            maximum), in microseconds; 0 if empty
+        """
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for lower in sorted(self._buckets):
+            seen += self._buckets[lower]
+            if seen >= rank:
+                return min(self._bucket_upper(lower), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """Return count, p50, p95, p99 and max (milliseconds).
+
+        Returns:
+            Summary dictionary
+        """
+        return {
+            "count": self.count,
+            "p50": round(self.percentile(50) / 1000, 2),
+            "p95": round(self.percentile(95) / 1000, 2),
+            "p99": round(self.percentile(99) / 1000, 2),
+            "max": round(self.max / 1000, 2),
+        }
+
+
+class TimingStats:
+    """Thread-safe per-domain, per-phase latency histograms."""
+
+    def __init__(self):
+        """Initialize with no domains."""
+        self._lock = threading.Lock()
+        self._domains: dict[str, dict[str, LatencyHistogram]] = {}
+
+    def record(self, domain: str, phases_ns: dict):
+        """Add the phase timings of one HTTP exchange.
+
+        Connection phases are only recorded when a connection was opened,
+        so reused connections do not pull their percentiles towards zero.
+
+        Args:
+            domain: Domain name
+            phases_ns: Dict mapping phase name to nanoseconds
+        """
+        with self._lock:
+            histograms = self._domains.setdefault(domain, {})
+            for phase in PHASES:
+                if phase in phases_ns:
+                    histograms.setdefault(phase, LatencyHistogram()).record(phases_ns[phase] // 1000)
+
+    def percentile(self, domain: str, phase: str, percent: float, min_count: int = 1) -> Optional[float]:
+        """Return one phase percentile of a domain.
+
+        Args:
+            domain: Domain name
+            phase: Phase name (see PHASES)
+            percent: Percentile (0-100)
+            min_count: Samples required before a value is reported
+
+        Returns:
+            Percentile in seconds, or None with fewer than min_count samples
+        """
+        with self._lock:
+            histogram = self._domains.get(domain, {}).get(phase)
+            if histogram is None or histogram.count < min_count:
+                return None
+            return histogram.percentile(percent) / 1e6
+
+    def summary(self, top: Optional[int] = None) -> dict:
+        """Return per-domain percentiles, busiest domains first.
+
+        Args:
+            top: Only include this many domains (all if None)
+
+        Returns:
+            Dict mapping domain to requests, total_ms (time spent in
+            requests to it) and a p50/p95/p99/max summary per phase
+        """
+        with self._lock:
+            summaries = {}
+            for domain, histograms in self._domains.items():
+                total = histograms.get('total')
+                summaries[domain] = {
+                    "requests": total.count if total else 0,
+                    "total_ms": round(total.sum / 1000, 1) if total else 0.0,
+                    **{phase: histograms[phase].summary() for phase in PHASES if phase in histograms},
+                }
+        ordered = sorted(summaries.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        return dict(ordered[:top] if top else ordered)
@@ -0,0 +1,122 @@
+"""Canonical forms of URLs, so spelling variants are checked once."""
+
+import fnmatch
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+DEFAULT_TRACKING_PARAMS = ['utm_*', 'fbclid', 'gclid', 'mc_cid', 'mc_eid', '_hsenc', '_hsmkt']
+
+# Characters a bare URL in prose tends to pick up from the sentence around it
+DEFAULT_TRAILING_PUNCTUATION = ".,;:!?'\"*`"
+
+
+class URLCanonicalizer:
+    """Maps URL spellings to one canonical key.
+
+    Each rule can be switched off in the ``url_canonical`` config section:
+
+    - ``strip_trailing_punctuation``: drop sentence punctuation (and a
+      closing parenthesis without an opening one) picked up after bare URLs
+    - ``lowercase_scheme_host``: scheme and host names are case-insensitive
+    - ``drop_default_port``: ``:80`` for http, ``:443`` for https
+    - ``drop_fragment``: fragments are never sent to the server
+    - ``strip_tracking_params``: query parameters matching
+      ``tracking_params`` (glob patterns such as ``utm_*``)
+    - ``strip_trailing_slash``: treat ``/a/`` and ``/a`` as one page (an
+      empty path becomes ``/``); off by default, since most servers serve
+      them as different resources
+
+    URLs that do not parse are returned with only the punctuation rule
+    applied. The canonical form is only a key for grouping spellings; the
+    URL requested is one of the spellings actually written (see
+    strip_punctuation()).
+    """
+
+    def __init__(self, config: dict):
+        """Initialize rules from the url_canonical config section.
+
+        Args:
+            config: Dict with enabled, the rule switches above,
+                tracking_params and trailing_punctuation
+        """
+        self.enabled = config.get('enabled', True)
+        self.strip_trailing_punctuation = config.get('strip_trailing_punctuation', True)
+        self.lowercase_scheme_host = config.get('lowercase_scheme_host', True)
+        self.drop_default_port = config.get('drop_default_port', True)
+        self.drop_fragment = config.get('drop_fragment', True)
+        self.strip_tracking_params = config.get('strip_tracking_params', True)
+        self.strip_trailing_slash = config.get('strip_trailing_slash', False)
+        self.tracking_params = [
+            pattern.lower() for pattern in config.get('tracking_params', DEFAULT_TRACKING_PARAMS)
+        ]
+        self.trailing_punctuation = config.get('trailing_punctuation', DEFAULT_TRAILING_PUNCTUATION)
+
+    def strip_punctuation(self, url: str) -> str:
+        """Remove trailing punctuation and unbalanced closing parentheses.
+
+        This is the only rule that changes what is requested: the rest only
+        decide which spellings are checked together.
+
+        Args:
+            url: URL as written
+
+        Returns:
+            URL without the punctuation (unchanged when the rule is off)
+        """
+        if not self.enabled or not self.strip_trailing_punctuation:
+            return url
+        while url:
+            if url[-1] in self.trailing_punctuation:
+                url = url[:-1]
+            elif url[-1] == ')' and url.count(')') > url.count('('):
+                url = url[:-1]
+            else:
+                break
+        return url
+
+    def _is_tracking(self, name: str) -> bool:
+        """Whether a query parameter name matches a tracking pattern."""
+        name = name.lower()
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.tracking_params)
+
+    def canonical(self, url: str) -> str:
+        """Return the canonical form of a URL.
+
+        Args:
+            url: URL as written
+
+        Returns:
+            Canonical URL (the input itself when canonicalization is off)
+        """
+        if not self.enabled:
+            return url
+        url = self.strip_punctuation(url)
+
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError:
+            return url
+        if not parts.scheme or not parts.hostname:
+            return url
+
+        scheme, netloc, path, query, fragment = parts
+        if self.lowercase_scheme_host:
+            scheme = scheme.lower()
+            userinfo, _, hostport = netloc.rpartition('@')
+            netloc = f"{userinfo}@{hostport.lower()}" if userinfo else hostport.lower()
+        if self.drop_default_port and port is not None and DEFAULT_PORTS.get(scheme.lower()) == port:
+            netloc = netloc.rsplit(':', 1)[0]
+        if self.drop_fragment:
+            fragment = ''
+        if self.strip_tracking_params and query:
+            # Filter the raw pairs so the remaining ones keep their encoding
+            query = '&'.join(
+                pair for pair in query.split('&')
+                if not self._is_tracking(unquote_plus(pair.split('=', 1)[0]))
+            )
+        if self.strip_trailing_slash:
+            path = path.rstrip('/') if path.strip('/') else '/'
+
+        return urlunsplit((scheme, netloc, path, query, fragment))
@@ -0,0 +1,284 @@
+"""On-disk HTTP validator cache for conditional GET/HEAD requests."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ValidatorCache:
+    """Persistent per-URL cache of ETag / Last-Modified validators.
+
+    Each entry records the validators a server returned together with the
+    content hash and length of the body they describe, so a later 304 Not
+    Modified can be answered from the cache. Bodies (and text extracted from
+    them) can optionally be stored by content hash for callers that need the
+    bytes themselves, e.g. PDF fact verification.
+
+    PDF range fingerprints are kept in a separate index so that a HEAD whose
+    validators moved (which drops the URL entry) does not discard them.
+
+    Layout::
+
+        <cache_dir>/index.json          URL -> entry metadata
+        <cache_dir>/fingerprints.json   URL -> PDF range fingerprint
+        <cache_dir>/bodies/<sha256>     raw response bodies
+        <cache_dir>/text/<sha256>       extracted text for a body
+
+    Clients share one instance per directory (see shared()); save() merges
+    with the indexes on disk, so instances in other processes do not lose
+    each other's entries.
+    """
+
+    _shared: dict[Path, "ValidatorCache"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir: Path):
+        """Initialize cache rooted at a directory.
+
+        Args:
+            cache_dir: Directory for the index and stored bodies
+        """
+        self.cache_dir = Path(cache_dir)
+        self.index_file = self.cache_dir / "index.json"
+        self.fingerprints_file = self.cache_dir / "fingerprints.json"
+        self.bodies_dir = self.cache_dir / "bodies"
+        self.text_dir = self.cache_dir / "text"
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._entries: dict[str, dict] = self._load_index(self.index_file)
+        self._fingerprints: dict[str, dict] = self._load_index(self.fingerprints_file)
+        self._changed: set[str] = set()  # URLs updated or dropped since loading
+        self._loaded_at = time.time()
+
+    @classmethod
+    def shared(cls, cache_dir: Path) -> "ValidatorCache":
+        """Return the process-wide cache for a directory.
+
+        Args:
+            cache_dir: Directory for the index and stored bodies
+
+        Returns:
+            ValidatorCache
+        """
+        key = Path(cache_dir).resolve()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(key)
+            return cls._shared[key]
+
+    def _load_index(self, path: Path) -> dict:
+        """Load a URL index from disk.
+
+        Args:
+            path: JSON index file
+
+        Returns:
+            Dict mapping URL to entry metadata (empty if missing or corrupt)
+        """
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, url: str) -> Optional[dict]:
+        """Return the cached entry for a URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Entry dict or None if the URL has not been cached
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def conditional_headers(self, url: str, require_body: bool = False) -> dict:
+        """Build If-None-Match / If-Modified-Since headers for a URL.
+
+        Args:
+            url: Requested URL
+            require_body: Only return headers if the body is stored, so that
+                          a 304 can still be answered with the cached bytes
+
+        Returns:
+            Dict of request headers (empty if nothing usable is cached)
+        """
+        entry = self.get(url)
+        if not entry or not entry.get("content_hash"):
+            return {}
+        if require_body and not self.has_body(entry["content_hash"]):
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, url: str, entry: dict):
+        """Store or replace the entry for a URL.
+
+        Entries without any validator are dropped, since they can never be
+        revalidated.
+
+        Args:
+            url: Requested URL
+            entry: Dict with etag, last_modified, content_hash, content_length, etc.
+        """
+        with self._lock:
+            self._changed.add(url)
+            if not entry.get("etag") and not entry.get("last_modified"):
+                self._entries.pop(url, None)
+                return
+            self._entries[url] = dict(entry, stored_at=time.time())
+
+    def invalidate(self, url: str):
+        """Forget the cached entry for a URL.
+
+        Args:
+            url: Requested URL
+        """
+        with self._lock:
+            self._changed.add(url)
+            self._entries.pop(url, None)
+
+    def get_fingerprint(self, url: str) -> Optional[dict]:
+        """Return the stored range fingerprint for a URL.
+
+        Args:
+            url: PDF URL
+
+        Returns:
+            Dict with fingerprint, content_hash and content_length, or None
+        """
+        with self._lock:
+            entry = self._fingerprints.get(url)
+            return dict(entry) if entry else None
+
+    def set_fingerprint(self, url: str, fingerprint: str, content_hash: str, content_length: int):
+        """Record the range fingerprint of a fully hashed PDF.
+
+        Args:
+            url: PDF URL
+            fingerprint: Sampled hash from RateLimitedClient.pdf_fingerprint
+            content_hash: SHA-256 of the complete body it was taken from
+            content_length: Length of the complete body
+        """
+        with self._lock:
+            self._fingerprints[url] = {
+                "fingerprint": fingerprint,
+                "content_hash": content_hash,
+                "content_length": content_length,
+                "stored_at": time.time(),
+            }
+
+    def has_body(self, content_hash: str) -> bool:
+        """Check whether a body with this hash is stored."""
+        return (self.bodies_dir / content_hash).exists()
+
+    def store_body(self, content_hash: str, content: bytes):
+        """Store a response body by content hash.
+
+        Args:
+            content_hash: SHA-256 hex digest of content
+            content: Raw body bytes
+        """
+        self._write_atomic(self.bodies_dir / content_hash, content)
+
+    def load_body(self, content_hash: str) -> Optional[bytes]:
+        """Load a stored response body.
+
+        Args:
+            content_hash: SHA-256 hex digest of the body
+
+        Returns:
+            Body bytes or None if not stored
+        """
+        try:
+            return (self.bodies_dir / content_hash).read_bytes()
+        except OSError:
+            return None
+
+    def store_text(self, content_hash: str, text: str):
+        """Store text extracted from a body (e.g. PDF text).
+
+        Args:
+            content_hash: SHA-256 hex digest of the source body
+            text: Extracted text
+        """
+        self._write_atomic(self.text_dir / content_hash, text.encode('utf-8'))
+
+    def load_text(self, content_hash: str) -> Optional[str]:
+        """Load text previously extracted from a body.
+
+        Args:
+            content_hash: SHA-256 hex digest of the source body
+
+        Returns:
+            Extracted text or None if not stored
+        """
+        try:
+            return (self.text_dir / content_hash).read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def save(self):
+        """Persist the indexes and prune bodies no longer referenced by them.
+
+        Entries written to disk by another instance since this one loaded
+        are kept unless this instance changed the same URL. Only files older
+        than this instance are pruned: newer ones may belong to an entry
+        another instance has not saved yet.
+        """
+        with self._save_lock:
+            on_disk = self._load_index(self.index_file)
+            fingerprints_on_disk = self._load_index(self.fingerprints_file)
+            with self._lock:
+                entries = {
+                    url: entry for url, entry in on_disk.items() if url not in self._changed
+                }
+                entries.update(self._entries)
+                fingerprints = {**fingerprints_on_disk, **self._fingerprints}
+
+            self._write_atomic(
+                self.index_file,
+                json.dumps(entries, indent=2, sort_keys=True).encode('utf-8')
+            )
+            if fingerprints:
+                self._write_atomic(
+                    self.fingerprints_file,
+                    json.dumps(fingerprints, indent=2, sort_keys=True).encode('utf-8')
+                )
+
+            referenced = {e.get("content_hash") for e in entries.values()}
+            for directory in (self.bodies_dir, self.text_dir):
+                if not directory.exists():
+                    continue
+                for path in directory.iterdir():
+                    if path.name in referenced or path.name.startswith('.'):
+                        continue
+                    try:
+                        if path.stat().st_mtime < self._loaded_at:
+                            path.unlink()
+                    except OSError:
+                        pass
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write a file via a temporary sibling and rename.
+
+        Args:
+            path: Destination path
+            data: Bytes to write
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)